@@ -0,0 +1,70 @@
+"""
+Memory and construction throughput of `Either`/`Option` instances,
+and cost of long `map` chains with and without `Pipeline`.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_functional
+"""
+
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List
+
+from common_py.functional.either import Left, Right
+from common_py.functional.option import Nil, Some
+from common_py.functional.pipeline import Pipeline
+
+N = 1_000_000
+
+
+def memory_per_million(factory: Callable[[int], object]) -> float:
+    tracemalloc.start()
+    instances: List[object] = [factory(0) for _ in range(N)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return current / 1e6
+
+
+def main() -> None:
+    factories: Dict[str, Callable[[int], object]] = {
+        "Right": Right,
+        "Left": Left,
+        "Some": Some,
+        "Nil": lambda i: Nil(),
+    }
+    print("{:<6} {:>14} {:>16}".format("class", "MB / 1M inst.", "ns / construct"))
+    for name, factory in factories.items():
+        seconds: float = min(
+            timeit.repeat(lambda: factory(1), number=N // 10, repeat=5)
+        )
+        print(
+            "{:<6} {:>14.1f} {:>16.0f}".format(
+                name, memory_per_million(factory), seconds / (N // 10) * 1e9
+            )
+        )
+
+    steps: int = 100_000
+    pipeline: Pipeline = Pipeline()
+    for _ in range(steps):
+        pipeline = pipeline.map(lambda x: x + 1)
+    pipeline.steps()
+
+    def chained() -> object:
+        either = Right(0)
+        for _ in range(steps):
+            either = either.map(lambda x: x + 1)
+        return either
+
+    print("{:<24} {:>10}".format("100k maps", "ms / run"))
+    for name, run in [
+        ("Either.map chain", chained),
+        ("Pipeline (fused)", lambda: pipeline.run(Right(0))),
+    ]:
+        seconds = min(timeit.repeat(run, number=1, repeat=5))
+        print("{:<24} {:>10.1f}".format(name, seconds * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Throughput and latency of the `common_py.sftp` upload modes against an in-process
+paramiko SFTP server on localhost, across file size and count mixes and transport profiles.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_sftp
+    python -m benchmarks.bench_sftp --quick
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from typing import Callable, List, Optional, Tuple
+import warnings
+
+from common_py import sftp
+from common_py.sftp import (
+    FAST_LAN_PROFILE,
+    SLOW_WAN_PROFILE,
+    SftpPool,
+    SftpServerInfo,
+    TransportProfile,
+)
+from tests.sftp_server import SftpTestServer
+
+# (label, file count, bytes per file)
+MIXES: List[Tuple[str, int, int]] = [
+    ("1 x 64 MiB", 1, 64 << 20),
+    ("16 x 1 MiB", 16, 1 << 20),
+    ("256 x 16 KiB", 256, 16 << 10),
+]
+QUICK_MIXES: List[Tuple[str, int, int]] = [
+    ("1 x 8 MiB", 1, 8 << 20),
+    ("64 x 16 KiB", 64, 16 << 10),
+]
+PROFILES: List[Tuple[str, Optional[TransportProfile]]] = [
+    ("default", None),
+    ("fast-lan", FAST_LAN_PROFILE),
+    ("slow-wan", SLOW_WAN_PROFILE),
+]
+
+
+def write_files(folder: str, count: int, size: int) -> List[str]:
+    # Half random, half zeros, so compression has something to gain.
+    names: List[str] = []
+    for index in range(count):
+        name: str = "file_{:04d}.bin".format(index)
+        with open(os.path.join(folder, name), "wb") as file:
+            file.write(os.urandom(size // 2))
+            file.write(bytes(size - size // 2))
+        names.append(name)
+    return names
+
+
+def modes(
+    info: SftpServerInfo, local: str, names: List[str]
+) -> List[Tuple[str, Callable[[str], List[float]]]]:
+    # Each mode uploads `names` to a remote folder and returns per-call latencies.
+    def _timed(f: Callable[[], object]) -> List[float]:
+        started_at: float = time.perf_counter()
+        f()
+        return [time.perf_counter() - started_at]
+
+    def _upload_file(remote: str) -> List[float]:
+        latencies: List[float] = []
+        for name in names:
+            latencies += _timed(lambda: sftp.upload_file(info, name, local, remote))
+        return latencies
+
+    def _resumable(remote: str) -> List[float]:
+        latencies: List[float] = []
+        for name in names:
+            latencies += _timed(
+                lambda: sftp.upload_file_resumable(info, name, local, remote)
+            )
+        return latencies
+
+    return [
+        ("upload_file", _upload_file),
+        (
+            "upload_files",
+            lambda remote: _timed(
+                lambda: sftp.upload_files(info, names, local, remote)
+            ),
+        ),
+        (
+            "upload_files_parallel",
+            lambda remote: _timed(
+                lambda: sftp.upload_files_parallel(info, names, local, remote)
+            ),
+        ),
+        (
+            "upload_folder",
+            lambda remote: _timed(lambda: sftp.upload_folder(info, local, remote)),
+        ),
+        ("upload_file_resumable", _resumable),
+        (
+            "sync_to_remote (new)",
+            lambda remote: _timed(lambda: sftp.sync_to_remote(info, local, remote)),
+        ),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="smaller file mixes")
+    args = parser.parse_args()
+    warnings.simplefilter("ignore")
+    # Connection resets on pool close are expected; keep them out of the table.
+    logging.getLogger("paramiko").setLevel(logging.CRITICAL)
+
+    remote_root: str = tempfile.mkdtemp(prefix="bench_sftp_remote_")
+    local_root: str = tempfile.mkdtemp(prefix="bench_sftp_local_")
+    server: SftpTestServer = SftpTestServer(remote_root).start()
+    print(
+        "{:<14} {:<10} {:<24} {:>9} {:>12} {:>10}".format(
+            "mix", "profile", "mode", "MB/s", "latency ms", "connects"
+        )
+    )
+    try:
+        for mix, count, size in QUICK_MIXES if args.quick else MIXES:
+            local: str = os.path.join(local_root, "{}_{}".format(count, size))
+            os.mkdir(local)
+            names: List[str] = write_files(local, count, size)
+            for profile_name, profile_optional in PROFILES:
+                base: SftpServerInfo = server.info
+                info: SftpServerInfo = SftpServerInfo(
+                    base.host_name,
+                    base.host_port,
+                    base.username,
+                    base.password,
+                    profile_optional=profile_optional,
+                )
+                for mode, run in modes(info, local, names):
+                    # A fresh pool per case, so each pays its own handshake.
+                    sftp.set_default_sftp_pool(
+                        SftpPool(sftp.default_sftp_pool().connector)
+                    )
+                    connections: int = server.connections
+                    remote: str = "{}_{}_{}".format(
+                        count, profile_name, mode.split()[0]
+                    )
+                    os.mkdir(os.path.join(remote_root, remote))
+                    started_at: float = time.perf_counter()
+                    latencies: List[float] = run(remote)
+                    elapsed: float = time.perf_counter() - started_at
+                    sftp.default_sftp_pool().close()
+                    print(
+                        "{:<14} {:<10} {:<24} {:>9.1f} {:>12.2f} {:>10}".format(
+                            mix,
+                            profile_name,
+                            mode,
+                            count * size / elapsed / 1e6,
+                            statistics.median(latencies) * 1e3,
+                            server.connections - connections,
+                        )
+                    )
+                    shutil.rmtree(os.path.join(remote_root, remote))
+
+            # Unchanged files: listing and comparison only.
+            sftp.set_default_sftp_pool(SftpPool(sftp.default_sftp_pool().connector))
+            sftp.sync_to_remote(server.info, local, "")
+            started_at = time.perf_counter()
+            sftp.sync_to_remote(server.info, local, "")
+            print(
+                "{:<14} {:<10} {:<24} {:>9} {:>12.2f} {:>10}".format(
+                    mix,
+                    "default",
+                    "sync_to_remote (same)",
+                    "-",
+                    (time.perf_counter() - started_at) * 1e3,
+                    "-",
+                )
+            )
+            for name in names:
+                os.remove(os.path.join(remote_root, name))
+    finally:
+        sftp.default_sftp_pool().close()
+        server.close()
+        shutil.rmtree(remote_root)
+        shutil.rmtree(local_root)
+
+
+if __name__ == "__main__":
+    main()
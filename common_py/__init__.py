@@ -1,5 +1,6 @@
 from pkgutil import extend_path
 
+from .cache import *
 from .dict_extension import *
 from .enum_argparse import *
 from .file import *
@@ -0,0 +1,210 @@
+from collections import OrderedDict
+from functools import wraps
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_CACHE_STAT_NAMES = ("hits", "misses", "waits", "evictions", "expirations", "bypasses")
+
+
+class _InFlight:
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event: threading.Event = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Stripe:
+    # One independently locked segment of the cache.
+    __slots__ = ("lock", "entries", "in_flight", "bytes", "stats")
+
+    def __init__(self):
+        self.lock: threading.Lock = threading.Lock()
+        # key -> (value, expires_at, size), least recently used first.
+        self.entries: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self.in_flight: Dict[Hashable, _InFlight] = {}
+        self.bytes: int = 0
+        self.stats: Dict[str, int] = dict.fromkeys(_CACHE_STAT_NAMES, 0)
+
+
+def __freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(__freeze(v) for v in value)
+    if isinstance(value, dict):
+        return ("dict",) + tuple(
+            sorted(((k, __freeze(v)) for k, v in value.items()), key=repr)
+        )
+    if isinstance(value, set):
+        return frozenset(__freeze(v) for v in value)
+    hash(value)
+    return value
+
+
+def __make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    key = __freeze(args)
+    if kwargs:
+        key = (key, __freeze(kwargs))
+    hash(key)
+    return key
+
+
+def memoize(
+    f: Optional[F] = None,
+    max_size: Optional[int] = 128,
+    max_bytes: Optional[int] = None,
+    size_f: Callable[[Any], int] = sys.getsizeof,
+    ttl: Optional[float] = None,
+    stripes: int = 16,
+) -> Any:
+    """
+    Thread-safe memoization decorator with LRU and TTL eviction.
+
+    The cache is split into `stripes` segments, each with its own lock and LRU order,
+    so concurrent calls with different arguments rarely contend.
+    Concurrent calls with the same arguments run the function only once; the other callers wait
+    for its result. Exceptions are passed to every waiting caller and are not cached.
+
+    Lists, tuples, dicts and sets in the arguments are frozen to build the cache key,
+    calls with other unhashable arguments are not cached.
+
+    Parameters
+    ----------
+    f : Optional[F], optional
+        Function to decorate. Allows using `@memoize` without parentheses.
+    max_size : Optional[int], optional
+        Maximum number of entries, or None for no limit, by default 128
+    max_bytes : Optional[int], optional
+        Maximum total size of the cached values measured by `size_f`,
+        or None for no limit, by default None
+    size_f : Callable[[Any], int], optional
+        Size of a cached value, by default `sys.getsizeof`
+    ttl : Optional[float], optional
+        Seconds an entry stays valid, or None to keep entries until evicted, by default None
+    stripes : int, optional
+        Number of lock stripes, by default 16.
+        `max_size` and `max_bytes` are split evenly between stripes.
+
+    Returns
+    -------
+    Any
+        Decorated function with the same signature,
+        plus `cache_stats() -> Dict[str, int]` and `cache_clear() -> None`.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> cached_files_in_folder = common_py.memoize(ttl=10)(common_py.files_in_folder)
+    >>> cached_files_in_folder("images")
+    >>> cached_files_in_folder.cache_stats()
+    {'hits': 0, 'misses': 1, 'waits': 0, 'evictions': 0, 'expirations': 0, 'bypasses': 0, 'size': 1, 'bytes': 0}
+
+    >>> @common_py.memoize(max_size=1024)
+    ... def remote_stat(path: str) -> int:
+    ...     ...
+    """
+    if f is None:
+        return lambda g: memoize(g, max_size, max_bytes, size_f, ttl, stripes)
+
+    segments: Tuple[_Stripe, ...] = tuple(_Stripe() for _ in range(stripes))
+    stripe_max_size: Optional[int] = (
+        None if max_size is None else max(1, -(-max_size // stripes))
+    )
+    stripe_max_bytes: Optional[int] = (
+        None if max_bytes is None else max(1, -(-max_bytes // stripes))
+    )
+
+    def _evict(stripe: _Stripe) -> None:
+        while stripe.entries and (
+            (stripe_max_size is not None and len(stripe.entries) > stripe_max_size)
+            or (stripe_max_bytes is not None and stripe.bytes > stripe_max_bytes)
+        ):
+            _, (_, _, size) = stripe.entries.popitem(last=False)
+            stripe.bytes -= size
+            stripe.stats["evictions"] += 1
+
+    @wraps(f)
+    def _memoized(*args: Any, **kwargs: Any) -> Any:
+        try:
+            key = __make_key(args, kwargs)
+        except TypeError:
+            with segments[0].lock:
+                segments[0].stats["bypasses"] += 1
+            return f(*args, **kwargs)  # type: ignore
+
+        stripe: _Stripe = segments[hash(key) % stripes]
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is not None:
+                if ttl is None or entry[1] > time.monotonic():
+                    stripe.entries.move_to_end(key)
+                    stripe.stats["hits"] += 1
+                    return entry[0]
+                del stripe.entries[key]
+                stripe.bytes -= entry[2]
+                stripe.stats["expirations"] += 1
+            in_flight: Optional[_InFlight] = stripe.in_flight.get(key)
+            leader: bool = in_flight is None
+            if in_flight is None:
+                in_flight = stripe.in_flight[key] = _InFlight()
+                stripe.stats["misses"] += 1
+            else:
+                stripe.stats["waits"] += 1
+
+        if not leader:
+            in_flight.event.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.value
+
+        try:
+            value = f(*args, **kwargs)  # type: ignore
+        except BaseException as err:
+            in_flight.error = err
+            with stripe.lock:
+                del stripe.in_flight[key]
+            in_flight.event.set()
+            raise
+
+        size: int = size_f(value) if stripe_max_bytes is not None else 0
+        with stripe.lock:
+            if stripe_max_bytes is None or size <= stripe_max_bytes:
+                expires_at: float = (
+                    float("inf") if ttl is None else time.monotonic() + ttl
+                )
+                stripe.entries[key] = (value, expires_at, size)
+                stripe.bytes += size
+                _evict(stripe)
+            del stripe.in_flight[key]
+        in_flight.value = value
+        in_flight.event.set()
+        return value
+
+    def cache_stats() -> Dict[str, int]:
+        stats: Dict[str, int] = dict.fromkeys(_CACHE_STAT_NAMES, 0)
+        stats["size"] = 0
+        stats["bytes"] = 0
+        for stripe in segments:
+            with stripe.lock:
+                for name in _CACHE_STAT_NAMES:
+                    stats[name] += stripe.stats[name]
+                stats["size"] += len(stripe.entries)
+                stats["bytes"] += stripe.bytes
+        return stats
+
+    def cache_clear() -> None:
+        for stripe in segments:
+            with stripe.lock:
+                stripe.entries.clear()
+                stripe.bytes = 0
+
+    _memoized.cache_stats = cache_stats  # type: ignore
+    _memoized.cache_clear = cache_clear  # type: ignore
+    return _memoized
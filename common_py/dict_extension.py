@@ -1,4 +1,19 @@
-from typing import Dict, Optional, TypeVar
+from functools import lru_cache
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 T = TypeVar("T")
 
@@ -28,3 +43,557 @@ def get_or_else(
     .. versionadded:: 0.1.1
     """
     return dictionary.get(key, default_value_optional)
+
+
+_PATH_TOKEN = re.compile(r"""\.?([^.\[\]"']+)|\[(-?\d+)\]|\[(["'])(.*?)\3\]""")
+
+
+def __parse_path(path: str) -> Tuple[Union[str, int], ...]:
+    keys: List[Union[str, int]] = []
+    position: int = 0
+    while position < len(path):
+        match = _PATH_TOKEN.match(path, position)
+        if match is None or (match.group(0).startswith(".") and position == 0):
+            raise ValueError("Invalid path {!r} at position {}.".format(path, position))
+        name, index, _, quoted = match.groups()
+        if name is not None:
+            keys.append(name)
+        elif index is not None:
+            keys.append(int(index))
+        else:
+            keys.append(quoted)
+        position = match.end()
+    return tuple(keys)
+
+
+@lru_cache(maxsize=1024)
+def __compile(keys: Tuple[Any, ...]) -> Callable[[Any, Any], Any]:
+    if len(keys) == 1:
+        (k1,) = keys
+
+        def _get1(dictionary: Any, default_value_optional: Any) -> Any:
+            try:
+                return dictionary[k1]
+            except (KeyError, IndexError, TypeError):
+                return default_value_optional
+
+        return _get1
+    if len(keys) == 2:
+        k1, k2 = keys
+
+        def _get2(dictionary: Any, default_value_optional: Any) -> Any:
+            try:
+                return dictionary[k1][k2]
+            except (KeyError, IndexError, TypeError):
+                return default_value_optional
+
+        return _get2
+
+    def _get(dictionary: Any, default_value_optional: Any) -> Any:
+        try:
+            for key in keys:
+                dictionary = dictionary[key]
+            return dictionary
+        except (KeyError, IndexError, TypeError):
+            return default_value_optional
+
+    return _get
+
+
+@lru_cache(maxsize=1024)
+def __compile_str(path: str) -> Callable[[Any, Any], Any]:
+    return __compile(__parse_path(path))
+
+
+def compile_get_in(
+    path: Union[str, Sequence[Union[str, int]]],
+) -> Callable[[Any, Any], Any]:
+    """
+    Compile a nested path into an accessor. Compiled accessors are cached by path.
+
+    Parameters
+    ----------
+    path : Union[str, Sequence[Union[str, int]]]
+        Path like `"a.b[3].c"` or `'a["key.with.dots"]'`, or a sequence of keys and indexes
+        like `("a", "b", 3, "c")`.
+
+    Returns
+    -------
+    Callable[[Any, Any], Any]
+        Accessor `(dictionary, default_value_optional) -> value`.
+
+    Raises
+    ------
+    ValueError
+        `path` can not be parsed.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> accessor = common_py.compile_get_in("a.b[1].c")
+    >>> accessor({"a": {"b": [{}, {"c": 3}]}}, None)
+    3
+    """
+    if isinstance(path, str):
+        return __compile_str(path)
+    return __compile(tuple(path))
+
+
+def get_in(
+    dictionary: Dict[str, Any],
+    path: Union[str, Sequence[Union[str, int]]],
+    default_value_optional: Optional[T] = None,
+) -> Optional[Any]:
+    """
+    Get the nested value safely from the dictionary.
+
+    Parameters
+    ----------
+    dictionary : Dict[str, Any]
+        Dictionary
+    path : Union[str, Sequence[Union[str, int]]]
+        Path to the value. See `compile_get_in`.
+    default_value_optional : Optional[T], optional
+        Default if there is no value on the path, by default None
+
+    Returns
+    -------
+    Optional[Any]
+        If `default_value_optional` is not specified, None is returned if there is no value.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> common_py.get_in({"a": {"b": [{}, {"c": 3}]}}, "a.b[1].c")
+    3
+    >>> common_py.get_in({"a": {"b": []}}, "a.b[1].c", "no value")
+    'no value'
+    """
+    return compile_get_in(path)(dictionary, default_value_optional)
+
+
+def get_in_batch(
+    dictionaries: Iterable[Dict[str, Any]],
+    path: Union[str, Sequence[Union[str, int]]],
+    default_value_optional: Optional[T] = None,
+) -> Iterator[Optional[Any]]:
+    """
+    Get the nested value safely from each dictionary, compiling `path` only once.
+
+    Parameters
+    ----------
+    dictionaries : Iterable[Dict[str, Any]]
+        Dictionaries
+    path : Union[str, Sequence[Union[str, int]]]
+        Path to the value. See `compile_get_in`.
+    default_value_optional : Optional[T], optional
+        Default if there is no value on the path, by default None
+
+    Returns
+    -------
+    Iterator[Optional[Any]]
+        Lazy values, in the order of `dictionaries`.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.get_in_batch([{"a": [1]}, {"a": []}], "a[0]", 0))
+    [1, 0]
+    """
+    accessor: Callable[[Any, Any], Any] = compile_get_in(path)
+    return (accessor(dictionary, default_value_optional) for dictionary in dictionaries)
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+_SUBNODE = object()
+
+
+class _BitmapNode:
+    # `array` holds flattened (key, value) pairs. A `_SUBNODE` key marks a child node.
+    __slots__ = ("bitmap", "array")
+
+    def __init__(self, bitmap: int, array: Tuple[Any, ...]):
+        self.bitmap: int = bitmap
+        self.array: Tuple[Any, ...] = array
+
+
+class _CollisionNode:
+    # Keys whose full hashes are equal, as flattened (key, value) pairs.
+    __slots__ = ("hash", "array")
+
+    def __init__(self, hash: int, array: Tuple[Any, ...]):
+        self.hash: int = hash
+        self.array: Tuple[Any, ...] = array
+
+
+def _bit(h: int, shift: int) -> int:
+    return 1 << ((h >> shift) & 31)
+
+
+def _index(bitmap: int, bit: int) -> int:
+    return 2 * bin(bitmap & (bit - 1)).count("1")
+
+
+def _key_hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _node_get(node: Any, shift: int, h: int, key: Any, default: Any) -> Any:
+    while True:
+        if type(node) is _CollisionNode:
+            array = node.array
+            for i in range(0, len(array), 2):
+                if array[i] is key or array[i] == key:
+                    return array[i + 1]
+            return default
+        bit = _bit(h, shift)
+        if not node.bitmap & bit:
+            return default
+        i = _index(node.bitmap, bit)
+        k = node.array[i]
+        if k is _SUBNODE:
+            node = node.array[i + 1]
+            shift += 5
+        elif k is key or k == key:
+            return node.array[i + 1]
+        else:
+            return default
+
+
+def _make_node(shift: int, h1: int, k1: Any, v1: Any, h2: int, k2: Any, v2: Any) -> Any:
+    if h1 == h2:
+        return _CollisionNode(h1, (k1, v1, k2, v2))
+    b1, b2 = _bit(h1, shift), _bit(h2, shift)
+    if b1 == b2:
+        return _BitmapNode(
+            b1, (_SUBNODE, _make_node(shift + 5, h1, k1, v1, h2, k2, v2))
+        )
+    if b1 < b2:
+        return _BitmapNode(b1 | b2, (k1, v1, k2, v2))
+    return _BitmapNode(b1 | b2, (k2, v2, k1, v1))
+
+
+def _node_assoc(
+    node: Any, shift: int, h: int, key: Any, value: Any
+) -> Tuple[Any, bool]:
+    if type(node) is _CollisionNode:
+        if h != node.hash:
+            parent = _BitmapNode(_bit(node.hash, shift), (_SUBNODE, node))
+            return _node_assoc(parent, shift, h, key, value)
+        array = node.array
+        for i in range(0, len(array), 2):
+            if array[i] is key or array[i] == key:
+                if array[i + 1] is value:
+                    return node, False
+                return (
+                    _CollisionNode(h, array[: i + 1] + (value,) + array[i + 2 :]),
+                    False,
+                )
+        return _CollisionNode(h, array + (key, value)), True
+
+    bit = _bit(h, shift)
+    i = _index(node.bitmap, bit)
+    array = node.array
+    if not node.bitmap & bit:
+        return (
+            _BitmapNode(node.bitmap | bit, array[:i] + (key, value) + array[i:]),
+            True,
+        )
+    k, v = array[i], array[i + 1]
+    if k is _SUBNODE:
+        child, added = _node_assoc(v, shift + 5, h, key, value)
+        if child is v:
+            return node, False
+        return (
+            _BitmapNode(node.bitmap, array[: i + 1] + (child,) + array[i + 2 :]),
+            added,
+        )
+    if k is key or k == key:
+        if v is value:
+            return node, False
+        return (
+            _BitmapNode(node.bitmap, array[: i + 1] + (value,) + array[i + 2 :]),
+            False,
+        )
+    child = _make_node(shift + 5, _key_hash(k), k, v, h, key, value)
+    return (
+        _BitmapNode(node.bitmap, array[:i] + (_SUBNODE, child) + array[i + 2 :]),
+        True,
+    )
+
+
+def _node_dissoc(node: Any, shift: int, h: int, key: Any) -> Optional[Any]:
+    # Returns the same node if `key` is absent, None if the node becomes empty.
+    if type(node) is _CollisionNode:
+        array = node.array
+        for i in range(0, len(array), 2):
+            if array[i] is key or array[i] == key:
+                rest = array[:i] + array[i + 2 :]
+                if len(rest) == 2:
+                    return _BitmapNode(_bit(node.hash, shift), rest)
+                return _CollisionNode(node.hash, rest)
+        return node
+
+    bit = _bit(h, shift)
+    if not node.bitmap & bit:
+        return node
+    i = _index(node.bitmap, bit)
+    array = node.array
+    k, v = array[i], array[i + 1]
+    if k is _SUBNODE:
+        child = _node_dissoc(v, shift + 5, h, key)
+        if child is v:
+            return node
+        if child is not None:
+            if (
+                type(child) is _BitmapNode
+                and len(child.array) == 2
+                and child.array[0] is not _SUBNODE
+            ):
+                # Pull a single remaining entry up into this node.
+                return _BitmapNode(
+                    node.bitmap, array[:i] + child.array + array[i + 2 :]
+                )
+            return _BitmapNode(node.bitmap, array[: i + 1] + (child,) + array[i + 2 :])
+    elif not (k is key or k == key):
+        return node
+    if node.bitmap == bit:
+        return None
+    return _BitmapNode(node.bitmap ^ bit, array[:i] + array[i + 2 :])
+
+
+def _node_items(node: Any) -> Iterator[Tuple[Any, Any]]:
+    array = node.array
+    for i in range(0, len(array), 2):
+        if array[i] is _SUBNODE:
+            yield from _node_items(array[i + 1])
+        else:
+            yield array[i], array[i + 1]
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+class PersistentMap(Mapping[K, V]):
+    """
+    Immutable dictionary based on a hash array mapped trie (HAMT).
+
+    `assoc`, `dissoc` and `deep_merge` return new maps in O(log n) per changed key,
+    sharing every untouched node with the original map.
+    So many slightly different variants of a large config only cost the size of their differences.
+    It is a read-only `Mapping`, so it can be passed to `get_or_else` and `get_in`.
+
+    Parameters
+    ----------
+    mapping_optional : Optional[Mapping[K, V]], optional
+        Initial items, by default None
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> base = common_py.PersistentMap.from_dict({"lr": 0.1, "optimizer": {"name": "adam"}})
+    >>> trial = base.assoc("lr", 0.01)
+    >>> base["lr"], trial["lr"]
+    (0.1, 0.01)
+    >>> trial.deep_merge({"optimizer": {"beta": 0.9}}).to_dict()
+    {'lr': 0.01, 'optimizer': {'name': 'adam', 'beta': 0.9}}
+    >>> common_py.get_or_else(trial, "epochs", 10)
+    10
+    """
+
+    __slots__ = ("_root", "_count", "_hash")
+
+    def __init__(self, mapping_optional: Optional[Mapping[K, V]] = None):
+        self._root: Any = _EMPTY_NODE
+        self._count: int = 0
+        self._hash: Optional[int] = None
+        if mapping_optional is not None:
+            root, count = _EMPTY_NODE, 0
+            for key, value in mapping_optional.items():
+                root, added = _node_assoc(root, 0, _key_hash(key), key, value)
+                count += added
+            self._root, self._count = root, count
+
+    @staticmethod
+    def _of(root: Any, count: int) -> "PersistentMap":
+        persistent_map = PersistentMap.__new__(PersistentMap)
+        persistent_map._root = root
+        persistent_map._count = count
+        persistent_map._hash = None
+        return persistent_map
+
+    @staticmethod
+    def from_dict(dictionary: Mapping[K, Any]) -> "PersistentMap":
+        """
+        Convert a dictionary to a `PersistentMap`, converting nested dictionaries too.
+
+        Parameters
+        ----------
+        dictionary : Mapping[K, Any]
+            Dictionary
+
+        Returns
+        -------
+        PersistentMap
+            Map with the same items.
+        """
+        return PersistentMap(
+            {
+                key: (
+                    PersistentMap.from_dict(value)
+                    if isinstance(value, Mapping)
+                    and not isinstance(value, PersistentMap)
+                    else value
+                )
+                for key, value in dictionary.items()
+            }
+        )
+
+    def to_dict(self) -> Dict[K, Any]:
+        """
+        Convert to a `dict`, converting nested `PersistentMap` too.
+
+        Returns
+        -------
+        Dict[K, Any]
+            Dictionary with the same items.
+        """
+        return {
+            key: value.to_dict() if isinstance(value, PersistentMap) else value
+            for key, value in _node_items(self._root)
+        }
+
+    def __getitem__(self, key: K) -> V:
+        value = _node_get(self._root, 0, _key_hash(key), key, _SUBNODE)
+        if value is _SUBNODE:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: K, default: Optional[Any] = None) -> Optional[Any]:  # type: ignore
+        return _node_get(self._root, 0, _key_hash(key), key, default)
+
+    def __contains__(self, key: Any) -> bool:
+        return _node_get(self._root, 0, _key_hash(key), key, _SUBNODE) is not _SUBNODE
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[K]:
+        return (key for key, _ in _node_items(self._root))
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(_node_items(self._root)))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "PersistentMap({!r})".format(dict(_node_items(self._root)))
+
+    def __reduce__(self):
+        return PersistentMap, (dict(_node_items(self._root)),)
+
+    def assoc(self, key: K, value: V) -> "PersistentMap":
+        """
+        New map with `key` set to `value`.
+
+        Parameters
+        ----------
+        key : K
+            Key
+        value : V
+            Value
+
+        Returns
+        -------
+        PersistentMap
+            New map. `self` if the value is already set.
+        """
+        root, added = _node_assoc(self._root, 0, _key_hash(key), key, value)
+        if root is self._root:
+            return self
+        return PersistentMap._of(root, self._count + added)
+
+    def dissoc(self, key: K) -> "PersistentMap":
+        """
+        New map without `key`.
+
+        Parameters
+        ----------
+        key : K
+            Key
+
+        Returns
+        -------
+        PersistentMap
+            New map. `self` if there is no `key`.
+        """
+        root = _node_dissoc(self._root, 0, _key_hash(key), key)
+        if root is self._root:
+            return self
+        return PersistentMap._of(_EMPTY_NODE if root is None else root, self._count - 1)
+
+    def assoc_in(self, keys: Sequence[Any], value: Any) -> "PersistentMap":
+        """
+        New map with the nested value at `keys` set to `value`.
+        Missing intermediate maps are created.
+
+        Parameters
+        ----------
+        keys : Sequence[Any]
+            Keys of the path, like `("optimizer", "lr")`.
+        value : Any
+            Value
+
+        Returns
+        -------
+        PersistentMap
+            New map.
+        """
+        if len(keys) == 1:
+            return self.assoc(keys[0], value)
+        child = self.get(keys[0])
+        if not isinstance(child, PersistentMap):
+            child = PersistentMap()
+        return self.assoc(keys[0], child.assoc_in(keys[1:], value))
+
+    def deep_merge(self, other: Mapping[K, Any]) -> "PersistentMap":
+        """
+        New map with the items of `other` merged in.
+        Nested maps are merged recursively, other values of `other` win.
+
+        Parameters
+        ----------
+        other : Mapping[K, Any]
+            Items to merge. Nested dictionaries are converted to `PersistentMap`.
+
+        Returns
+        -------
+        PersistentMap
+            New map. Costs O(log n) per item of `other`, not a copy of `self`.
+        """
+        merged: PersistentMap = self
+        for key, value in other.items():
+            current = merged.get(key, _SUBNODE)
+            if isinstance(value, Mapping):
+                if isinstance(current, PersistentMap):
+                    value = current.deep_merge(value)
+                elif not isinstance(value, PersistentMap):
+                    value = PersistentMap.from_dict(value)
+            merged = merged.assoc(key, value)
+        return merged
@@ -5,8 +5,7 @@ import shutil
 from typing import Callable, List, Optional, Tuple
 
 from common_py.folder import files_in_folder
-from common_py.functional.either import Either, Left, Right, sequences
-
+from common_py.functional.either import Either, Left, Right, sequences, traverse_all
 
 def move_all_file(
     from_folder: str, target_folder: str, overwrite: bool = True
@@ -212,16 +211,18 @@ def rename_files(
     -----
     .. versionadded:: 0.1.0
     """
-    results: List[Either[str, Exception]] = []
-    for original_filename__change_to in original_filename__change_to_list:
-        results.append(
-            rename_file(
-                original_filename=original_filename__change_to[0],
-                change_to=original_filename__change_to[1],
-                path=path,
-            )
-        )
-    return sequences(results)
+    # Every rename is attempted, the result keeps the last error as before.
+    results: Either[List[str], List[Exception]] = traverse_all(
+        original_filename__change_to_list,
+        lambda original_filename__change_to: rename_file(
+            original_filename=original_filename__change_to[0],
+            change_to=original_filename__change_to[1],
+            path=path,
+        ),
+    )
+    if results.left is not None:
+        return Either(results.right, results.left[-1])
+    return Right(results.right)
 
 
 def rename_file_with_regex(
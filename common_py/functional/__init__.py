@@ -2,3 +2,5 @@ from .either import *
 from .future import *
 from .monad import *
 from .option import *
+from .pipeline import *
+from .scheduler import *
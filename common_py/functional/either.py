@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Callable, Generic, List, Optional, TypeVar
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, TypeVar
 
 from .monad import Monad
 
@@ -10,6 +10,8 @@ X = TypeVar("X")
 
 # https://github.com/alleycat-at-git/monad/blob/master/python/src/either.py
 class Either(Monad, Generic[R, L]):
+    __slots__ = ("right", "left")
+
     def __init__(self, right: Optional[R], left: Optional[L]):
         self.right: R = right
         self.left: L = left
@@ -26,6 +28,13 @@ class Either(Monad, Generic[R, L]):
         else:
             return f(self.right)
 
+    # map :: Either a -> (a -> b) -> Either b
+    def map(self, f: Callable[[R], R2]) -> Either[R2, L]:
+        if self.left is not None:
+            return self  # type: ignore
+        else:
+            return Right(f(self.right))
+
     def fold(self, fa: Callable[[R], X], fb: Callable[[L], X]) -> X:
         if self.left is not None:
             return fb(self.left)
@@ -34,36 +43,71 @@ class Either(Monad, Generic[R, L]):
 
 
 class Right(Either):
+    __slots__ = ()
+
     def __init__(self, right: R):
-        super(Right, self).__init__(right, None)
+        self.right = right
+        self.left = None
 
 
 class Left(Either):
+    __slots__ = ()
+
     def __init__(self, left: L):
-        super(Left, self).__init__(None, left)
+        self.right = None
+        self.left = left
 
 
 E = TypeVar("E")
 A = TypeVar("A")
 
 
-def sequences(es: List[Either[A, E]]) -> Either[List[A], E]:
+def sequences(es: Iterable[Either[A, E]]) -> Either[List[A], E]:
     return traverse(es, lambda x: x)
 
 
+def sequences_all(es: Iterable[Either[A, E]]) -> Either[List[A], List[E]]:
+    return traverse_all(es, lambda x: x)
+
+
 B = TypeVar("B")
 
 
-def traverse(es: List[A], f: Callable[[A], Either[B, E]]) -> Either[List[B], E]:
+# traverse :: [a] -> (a -> Either b e) -> Either [b] e
+# Stops at the first `Left`. Its `right` keeps the values computed before the failure.
+def traverse(es: Iterable[A], f: Callable[[A], Either[B, E]]) -> Either[List[B], E]:
+    lb: List[B] = []
+    for element in es:
+        b: Either[B, E] = f(element)
+        if b.left is not None:
+            return Either(lb, b.left)
+        lb.append(b.right)
+    return Right(lb)
+
+
+# traverse_all :: [a] -> (a -> Either b e) -> Either [b] [e]
+# Applies `f` to every element and accumulates all errors.
+def traverse_all(
+    es: Iterable[A], f: Callable[[A], Either[B, E]]
+) -> Either[List[B], List[E]]:
     lb: List[B] = []
-    e: E = None
-    left_flag: bool = False
-    for e in es:
-        a: Either[B, E] = f(e)
-        if a.right is not None:
-            lb.append(a.right)
+    le: List[E] = []
+    for element in es:
+        b: Either[B, E] = f(element)
+        if b.left is not None:
+            le.append(b.left)
         else:
-            e = a.left
-            left_flag = True
-            continue
-    return Either(lb, e) if left_flag else Right(lb)
+            lb.append(b.right)
+    return Either(lb, le) if le else Right(lb)
+
+
+# traverse_iter :: [a] -> (a -> Either b e) -> Iterator (Either b e)
+# Lazily yields the results of `f`, stopping after the first `Left`.
+def traverse_iter(
+    es: Iterable[A], f: Callable[[A], Either[B, E]]
+) -> Iterator[Either[B, E]]:
+    for element in es:
+        b: Either[B, E] = f(element)
+        yield b
+        if b.left is not None:
+            return
@@ -1,8 +1,29 @@
 from __future__ import annotations
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import concurrent.futures
 from functools import reduce
+import heapq
+import itertools
+import os
+import pickle
 import threading
-from threading import Thread
-from typing import Callable, Generic, List, Optional, TypeVar
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from .either import Either, Left, Right
 from .monad import Monad
@@ -11,15 +32,557 @@ from .option import Option, Some, nil
 D = TypeVar("D")
 D2 = TypeVar("D2")
 
+
+class InlineExecutor(Executor):
+    """
+    Executor running each task immediately on the calling thread.
+
+    Used for cheap work such as `Future` callbacks, where handing off to another thread
+    costs more than the work itself.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+
+    def submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:  # type: ignore
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as err:
+            future.set_exception(err)
+        return future
+
+
+inline_executor: InlineExecutor = InlineExecutor()
+
+_executor_lock: threading.Lock = threading.Lock()
+_executor: Optional[Executor] = None
+_callback_executor: Executor = inline_executor
+_process_executor: Optional[Executor] = None
+
+
+def _default_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) + 4),
+                    thread_name_prefix="common_py.future",
+                )
+    return _executor
+
+
+def _default_process_executor() -> Executor:
+    global _process_executor
+    if _process_executor is None:
+        with _executor_lock:
+            if _process_executor is None:
+                _process_executor = ProcessPoolExecutor()
+    return _process_executor
+
+
+class _SharedArgument:
+    # Picklable handle of a buffer or numpy array copied into shared memory.
+    def __init__(
+        self, name: str, nbytes: int, shape: Tuple[int, ...], dtype: str, numpy: bool
+    ):
+        self.name: str = name
+        self.nbytes: int = nbytes
+        self.shape: Tuple[int, ...] = shape
+        self.dtype: str = dtype
+        self.numpy: bool = numpy
+
+
+def _to_shared(argument: Any, threshold: int, shared: List[Any]) -> Any:
+    is_numpy: bool = type(argument).__module__ == "numpy" and hasattr(
+        argument, "__array_interface__"
+    )
+    if not is_numpy and not isinstance(argument, (bytes, bytearray, memoryview)):
+        return argument
+    view: memoryview = memoryview(argument)
+    if view.nbytes < threshold or (is_numpy and not view.c_contiguous):
+        return argument
+    from multiprocessing import shared_memory
+
+    segment = shared_memory.SharedMemory(create=True, size=view.nbytes)
+    segment.buf[: view.nbytes] = view.cast("B")
+    shared.append(segment)
+    return _SharedArgument(
+        segment.name,
+        view.nbytes,
+        tuple(view.shape or ()),
+        argument.dtype.str if is_numpy else view.format,
+        is_numpy,
+    )
+
+
+def _from_shared(argument: Any, segments: List[Any]) -> Any:
+    if not isinstance(argument, _SharedArgument):
+        return argument
+    from multiprocessing import shared_memory
+
+    try:
+        segment = shared_memory.SharedMemory(name=argument.name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the segment with the worker's resource
+        # tracker. That may be the parent's one or its own, which would unlink the
+        # segment at exit, so registering is skipped: the parent owns the segment.
+        from multiprocessing import resource_tracker
+
+        register: Callable[[str, str], None] = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None  # type: ignore
+        try:
+            segment = shared_memory.SharedMemory(name=argument.name)
+        finally:
+            resource_tracker.register = register  # type: ignore
+    segments.append(segment)
+    if argument.numpy:
+        import numpy
+
+        return numpy.ndarray(argument.shape, dtype=argument.dtype, buffer=segment.buf)
+    return segment.buf[: argument.nbytes].cast("B").cast(argument.dtype, argument.shape)
+
+
+def _run_in_process(f: Callable[..., D], args: Tuple[Any, ...]) -> D:
+    # Entry point in the worker process: map shared arguments without copying them.
+    segments: List[Any] = []
+    resolved: List[Any] = [_from_shared(argument, segments) for argument in args]
+    try:
+        return f(*resolved)
+    finally:
+        resolved.clear()
+        for segment in segments:
+            try:
+                segment.close()
+            except BufferError:
+                # The result still references the shared buffer.
+                pass
+
+
+_trampoline_state: threading.local = threading.local()
+
+
+def _trampoline(
+    subscribers: List[Callable[[Either[D, Exception]], None]],
+    value: Either[D, Exception],
+) -> None:
+    # Calls subscribers on this thread without nesting: a completion triggered while
+    # subscribers are already running here is queued and run by the outermost call.
+    # So long `map`/`flat_map` chains complete in constant stack space.
+    queue: Optional[Deque[Tuple[Callable[[Any], None], Any]]] = getattr(
+        _trampoline_state, "queue", None
+    )
+    if queue is not None:
+        queue.extend((sub, value) for sub in subscribers)
+        return
+    queue = _trampoline_state.queue = deque((sub, value) for sub in subscribers)
+    _trampoline_state.error = None
+    try:
+        _run_queued(queue, lambda: False)
+    finally:
+        _trampoline_state.queue = None
+        first_error: Optional[Exception] = _trampoline_state.error
+        _trampoline_state.error = None
+    if first_error is not None:
+        raise first_error
+
+
+def _run_queued(
+    queue: Deque[Tuple[Callable[[Any], None], Any]], done: Callable[[], bool]
+) -> None:
+    # Runs queued subscribers until `done`, keeping the first error for the outermost call.
+    while queue and not done():
+        sub, sub_value = queue.popleft()
+        try:
+            sub(sub_value)
+        except Exception as err:
+            if _trampoline_state.error is None:
+                _trampoline_state.error = err
+
+
+class TimerHandle:
+    """
+    Callback scheduled by `call_later`.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+
+    __slots__ = ("timer", "fn")
+
+    def __init__(self, timer: "_Timer", fn: Callable[[], Any]):
+        self.timer: _Timer = timer
+        self.fn: Optional[Callable[[], Any]] = fn
+
+    def cancel(self) -> None:
+        """
+        Drop the callback if it has not run yet, releasing what it references.
+        """
+        self.timer._cancel(self)
+
+
+class _Timer:
+    # One daemon thread running callbacks at monotonic deadlines.
+    # Cancelled entries are skipped when popped, and purged once they are half the heap.
+    def __init__(self):
+        self._heap: List[Tuple[float, int, TimerHandle]] = []
+        self._cancelled: int = 0
+        self._counter = itertools.count()
+        self._condition: threading.Condition = threading.Condition(threading.Lock())
+        self._thread: Optional[threading.Thread] = None
+
+    def call_at(self, when: float, fn: Callable[[], Any]) -> TimerHandle:
+        handle: TimerHandle = TimerHandle(self, fn)
+        with self._condition:
+            heapq.heappush(self._heap, (when, next(self._counter), handle))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="common_py.future.timer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return handle
+
+    def _cancel(self, handle: TimerHandle) -> None:
+        with self._condition:
+            if handle.fn is None:
+                return
+            handle.fn = None
+            self._cancelled += 1
+            if self._cancelled > 64 and 2 * self._cancelled > len(self._heap):
+                self._heap = [entry for entry in self._heap if entry[2].fn is not None]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap:
+                    self._condition.wait()
+                delay: float = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                handle: TimerHandle = heapq.heappop(self._heap)[2]
+                fn: Optional[Callable[[], Any]] = handle.fn
+                handle.fn = None
+                if fn is None:
+                    self._cancelled -= 1
+                    continue
+            try:
+                fn()
+            except Exception:
+                pass
+
+
+_timer: _Timer = _Timer()
+
+
+def call_later(delay: float, fn: Callable[[], Any]) -> TimerHandle:
+    """
+    Run `fn` on the shared timer thread after `delay` seconds.
+
+    `fn` should return quickly, e.g. by submitting work to an executor, as it delays
+    the other timer callbacks, including future deadlines.
+
+    Parameters
+    ----------
+    delay : float
+        Seconds to wait, on the `time.monotonic()` clock.
+    fn : Callable[[], Any]
+        Callback, its exceptions are ignored.
+
+    Returns
+    -------
+    TimerHandle
+        Handle whose `cancel()` drops `fn` if it has not run yet.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> handle = call_later(0.5, lambda: print("later"))
+    >>> handle.cancel()
+    """
+    return _timer.call_at(time.monotonic() + delay, fn)
+
+
+# Deadline of the `flat_map` step running on this thread, inherited by new futures.
+_context: threading.local = threading.local()
+
+_FANOUT_BUCKETS: Tuple[str, ...] = ("0", "1", "2-3", "4-7", "8-15", "16+")
+
+
+class _Tracer:
+    """Counters, gauges and task spans of `Future.enable_tracing`."""
+
+    def __init__(self, max_spans: int):
+        self.lock: threading.Lock = threading.Lock()
+        self.started_at: float = time.perf_counter()
+        self.spans: Deque[Tuple[str, float, float, float, bool]] = deque(
+            maxlen=max_spans
+        )
+        self.fanout: List[int] = [0] * len(_FANOUT_BUCKETS)
+        self.futures_created: int = 0
+        self.futures_completed: int = 0
+        self.pending_subscribers: int = 0
+        self.tasks_submitted: int = 0
+        self.tasks_started: int = 0
+        self.tasks_completed: int = 0
+
+    def created(self) -> None:
+        with self.lock:
+            self.futures_created += 1
+
+    def subscribed(self) -> None:
+        with self.lock:
+            self.pending_subscribers += 1
+
+    def completed(self, fanout: int) -> None:
+        bucket: int = min(fanout.bit_length(), len(_FANOUT_BUCKETS) - 1)
+        with self.lock:
+            self.futures_completed += 1
+            self.pending_subscribers -= fanout
+            self.fanout[bucket] += 1
+
+    # Wraps `f` so its run records a span from submission to completion.
+    def task(self, f: Callable[[], D]) -> Callable[[], D]:
+        name: str = getattr(f, "__qualname__", type(f).__name__)
+        submitted_at: float = time.perf_counter()
+        with self.lock:
+            self.tasks_submitted += 1
+
+        def _traced() -> D:
+            started_at: float = time.perf_counter()
+            with self.lock:
+                self.tasks_started += 1
+            ok: bool = False
+            try:
+                value: D = f()
+                ok = True
+                return value
+            finally:
+                ended_at: float = time.perf_counter()
+                with self.lock:
+                    self.tasks_completed += 1
+                    self.spans.append((name, submitted_at, started_at, ended_at, ok))
+
+        return _traced
+
+    def stats(self, spans: bool) -> Dict[str, Any]:
+        with self.lock:
+            recorded: List[Tuple[str, float, float, float, bool]] = list(self.spans)
+            stats: Dict[str, Any] = {
+                "futures_created": self.futures_created,
+                "futures_completed": self.futures_completed,
+                "futures_in_flight": self.futures_created - self.futures_completed,
+                "pending_subscribers": self.pending_subscribers,
+                "tasks_submitted": self.tasks_submitted,
+                "tasks_queued": self.tasks_submitted - self.tasks_started,
+                "tasks_running": self.tasks_started - self.tasks_completed,
+                "tasks_completed": self.tasks_completed,
+                "fanout": dict(zip(_FANOUT_BUCKETS, self.fanout)),
+            }
+        queue_latencies: List[float] = [
+            start - submit for _, submit, start, _, _ in recorded
+        ]
+        durations: List[float] = [end - start for _, _, start, end, _ in recorded]
+        stats["queue_latency_avg"] = (
+            sum(queue_latencies) / len(recorded) if recorded else 0.0
+        )
+        stats["queue_latency_max"] = max(queue_latencies, default=0.0)
+        stats["duration_avg"] = sum(durations) / len(recorded) if recorded else 0.0
+        stats["duration_max"] = max(durations, default=0.0)
+        if spans:
+            stats["spans"] = [
+                {
+                    "name": name,
+                    "submit": submit - self.started_at,
+                    "start": start - self.started_at,
+                    "end": end - self.started_at,
+                    "ok": ok,
+                }
+                for name, submit, start, end, ok in recorded
+            ]
+        return stats
+
+
+# Checked once per future and per task, so tracing costs nothing measurable when off.
+_tracer: Optional[_Tracer] = None
+_last_tracer: Optional[_Tracer] = None
+
+
+class GatherError(Exception):
+    """
+    Errors of `Future.gather`/`Future.traverse_par` with `fail_fast=False`.
+
+    Attributes
+    ----------
+    errors : List[Tuple[int, Exception]]
+        Index of each failed element and its error.
+    results : List[Any]
+        Values in order, None where the element failed.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+
+    def __init__(self, errors: List[Tuple[int, Exception]], results: List[Any]):
+        super(GatherError, self).__init__(
+            "{} of {} futures failed".format(len(errors), len(results))
+        )
+        self.errors: List[Tuple[int, Exception]] = errors
+        self.results: List[Any] = results
+
+
 # https://github.com/alleycat-at-git/monad/blob/master/python/src/future.py
 class Future(Monad, Generic[D]):
     # __init__ :: ((Either err a -> void) -> void) -> Future (Either err a)
-    def __init__(self, f: Callable[[Callable[[Either[D, Exception]], None]], None]):
+    # With a `deadline_optional` (`time.monotonic()` based), the future completes with
+    # `Left(TimeoutError)` if it is not done by then. By default the deadline of the
+    # enclosing `flat_map`/`map` step is inherited.
+    def __init__(
+        self,
+        f: Callable[[Callable[[Either[D, Exception]], None]], None],
+        deadline_optional: Optional[float] = None,
+    ):
         self.subscribers: List[Callable[[Either[D, Exception]], None]] = []
-        self.cache: Option[D] = nil
-        self.semaphore: threading.BoundedSemaphore = threading.BoundedSemaphore(1)
+        self.cache: Option[Either[D, Exception]] = nil
+        self.condition: threading.Condition = threading.Condition(threading.Lock())
+        self.deadline: Optional[float] = (
+            deadline_optional
+            if deadline_optional is not None
+            else getattr(_context, "deadline", None)
+        )
+        self.cancel_callbacks: List[Callable[[], Any]] = []
+        self.interrupted: bool = False
+        self.tracer: Optional[_Tracer] = _tracer
+        if self.tracer is not None:
+            self.tracer.created()
+        # Cancelled on completion, so the timer does not keep done futures alive.
+        self.expiry: Optional[TimerHandle] = (
+            _timer.call_at(self.deadline, self._expire)
+            if self.deadline is not None
+            else None
+        )
         f(self.callback)
 
+    @staticmethod
+    def set_executor(executor: Executor) -> None:
+        """
+        Set the executor running `async_f` tasks.
+
+        The default is a shared `ThreadPoolExecutor` with `min(32, cpu_count + 4)` workers,
+        created on first use.
+
+        Parameters
+        ----------
+        executor : Executor
+            Any `concurrent.futures.Executor`.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        global _executor
+        with _executor_lock:
+            _executor = executor
+
+    @staticmethod
+    def set_callback_executor(executor: Executor) -> None:
+        """
+        Set the executor running subscribers when a `Future` completes.
+
+        The default is `inline_executor`, which runs them on the completing thread.
+        Use a thread pool if subscribers block.
+
+        Parameters
+        ----------
+        executor : Executor
+            Any `concurrent.futures.Executor`.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        global _callback_executor
+        _callback_executor = executor
+
+    @staticmethod
+    def enable_tracing(max_spans: int = 10000) -> None:
+        """
+        Start recording futures and tasks, reported by `trace_stats`.
+
+        Futures created from now on count in the `futures_*`, `pending_subscribers` and
+        `fanout` metrics, and each `async_f`/`exec_on_thread` task records a span with its
+        submit, start and end times. Enabling again resets the metrics.
+
+        Parameters
+        ----------
+        max_spans : int, optional
+            Number of most recent spans kept, by default 10000
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        global _tracer
+        _tracer = _Tracer(max_spans)
+
+    @staticmethod
+    def disable_tracing() -> None:
+        """
+        Stop recording. `trace_stats` keeps returning the last metrics.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        global _tracer, _last_tracer
+        if _tracer is not None:
+            _last_tracer = _tracer
+        _tracer = None
+
+    @staticmethod
+    def trace_stats(spans: bool = False) -> Dict[str, Any]:
+        """
+        Metrics recorded since `enable_tracing`, as a JSON serializable dict.
+
+        Parameters
+        ----------
+        spans : bool, optional
+            Include the recorded spans, by default False
+
+        Returns
+        -------
+        Dict[str, Any]
+            Gauges `futures_in_flight`, `pending_subscribers`, `tasks_queued` and
+            `tasks_running`, counters `futures_created`, `futures_completed`,
+            `tasks_submitted` and `tasks_completed`, the `fanout` histogram of subscribers
+            per completed future, `queue_latency_avg`/`_max` and `duration_avg`/`_max` of
+            the recorded spans in seconds, and with `spans`, a list of
+            `{"name", "submit", "start", "end", "ok"}` in seconds since tracing started.
+            Empty if tracing was never enabled.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+
+        Examples
+        --------
+        >>> Future.enable_tracing()
+        >>> Future.traverse_par(names, download, max_concurrency=8).result()
+        >>> json.dumps(Future.trace_stats())
+        """
+        tracer: Optional[_Tracer] = _tracer or _last_tracer
+        return tracer.stats(spans) if tracer is not None else {}
+
     # pure :: a -> Future a
     @staticmethod
     def pure(value: D) -> Future:
@@ -39,27 +602,275 @@ class Future(Monad, Generic[D]):
 
     @staticmethod
     def exec_on_thread(
-        f: Callable[[], D], cb: Callable[[Either[D, Exception]], None]
-    ) -> None:
-        t: Thread = threading.Thread(target=Future.exec, args=[f, cb])
-        t.start()
+        f: Callable[[], D],
+        cb: Callable[[Either[D, Exception]], None],
+        executor: Optional[Executor] = None,
+    ) -> Optional[concurrent.futures.Future]:
+        if _tracer is not None:
+            f = _tracer.task(f)
+        try:
+            return (executor or _default_executor()).submit(Future.exec, f, cb)
+        except Exception as err:
+            # e.g. the executor is shut down.
+            cb(Left(err))
+            return None
+
+    # async_f :: (() -> a) -> Future a
+    # Runs `f` on `executor`, by default the shared thread pool.
+    # If the future is cancelled or expires before `f` starts, `f` does not run.
+    @staticmethod
+    def async_f(f: Callable[[], D], executor: Optional[Executor] = None) -> Future:
+        submitted: List[concurrent.futures.Future] = []
 
-    def async_f(self, f: Callable[[], D]) -> Future:
-        # return Future(lambda cb: Future.exec_on_thread(f, cb))
         def _cbf(cb: Callable[[Either[D, Exception]], None]) -> None:
-            return Future.exec_on_thread(f, cb)
+            task = Future.exec_on_thread(f, cb, executor)
+            if task is not None:
+                submitted.append(task)
 
-        return Future(_cbf)
+        future: Future[D] = Future(_cbf)
+        for task in submitted:
+            future._add_cancel_callback(task.cancel)
+        return future
+
+    @staticmethod
+    def set_process_executor(executor: Executor) -> None:
+        """
+        Set the executor of `async_process`.
+
+        The default is a shared `ProcessPoolExecutor` with `os.cpu_count()` workers,
+        created on first use.
+
+        Parameters
+        ----------
+        executor : Executor
+            Usually `ProcessPoolExecutor(max_workers=n)`.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        global _process_executor
+        with _executor_lock:
+            _process_executor = executor
+
+    # async_process :: (a -> b) -> a -> Future b
+    @staticmethod
+    def async_process(
+        f: Callable[..., D],
+        *args: Any,
+        executor: Optional[Executor] = None,
+        shared_memory_threshold: int = 1 << 20,
+    ) -> Future:
+        """
+        Run `f(*args)` in a worker process, for CPU-bound work the GIL would serialize.
+
+        `bytes`, `bytearray`, `memoryview` and C-contiguous numpy array arguments of at least
+        `shared_memory_threshold` bytes are copied once into `multiprocessing.shared_memory`
+        instead of being pickled, and the worker maps them without copying.
+        Numpy arrays arrive as arrays and other buffers as `memoryview`.
+        The shared memory is released when the task completes.
+
+        Parameters
+        ----------
+        f : Callable[..., D]
+            Picklable function, e.g. defined at module level.
+        *args : Any
+            Picklable arguments.
+        executor : Optional[Executor], optional
+            Process pool, by default the shared one. See `set_process_executor`.
+        shared_memory_threshold : int, optional
+            Minimum size of buffers passed through shared memory, by default 1 MiB
+
+        Returns
+        -------
+        Future
+            Future of the result. If `f` can not be pickled, it completes with `Left` of
+            the pickling error and nothing is submitted. `args` are pickled only once, by
+            the executor, and a failure there also completes it with `Left`.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+
+        Examples
+        --------
+        >>> def sha256_hex(data: memoryview) -> str:  # at module level
+        ...     return hashlib.sha256(data).hexdigest()
+        >>> Future.async_process(sha256_hex, checkpoint_bytes)
+        """
+        shared: List[Any] = []
+        try:
+            shared_args: Tuple[Any, ...] = tuple(
+                _to_shared(argument, shared_memory_threshold, shared)
+                for argument in args
+            )
+            # Only `f` is checked up front, pickling `args` twice would double their cost.
+            pickle.dumps(f)
+            task: concurrent.futures.Future = (
+                executor or _default_process_executor()
+            ).submit(_run_in_process, f, shared_args)
+        except Exception as err:
+            for segment in shared:
+                segment.close()
+                segment.unlink()
+            return Future(lambda cb: cb(Left(err)))
+
+        def _release(_: concurrent.futures.Future) -> None:
+            for segment in shared:
+                segment.close()
+                segment.unlink()
+
+        task.add_done_callback(_release)
+        future: Future[D] = Future.from_concurrent(task)
+        future._add_cancel_callback(task.cancel)
+        return future
 
     # flat_map :: (a -> Future b) -> Future b
     def flat_map(self, f: Callable[[D], Future[D2]]) -> Future[D2]:
-        def _cbf(cb: Callable[[Either[D, Exception]], None]) -> None:
+        deadline: Optional[float] = self.deadline
+
+        def _cbf(cb: Callable[[Either[D2, Exception]], None]) -> None:
             def _cbf2(value: Either[D, Exception]) -> None:
-                return value.fold(lambda r: f(r).subscribe(cb), lambda l: cb(value))
+                if value.left is not None:
+                    return cb(value)  # type: ignore
+                previous_deadline: Optional[float] = getattr(_context, "deadline", None)
+                _context.deadline = deadline
+                try:
+                    next_future: Future[D2] = f(value.right)
+                except Exception as err:
+                    return cb(Left(err))
+                finally:
+                    _context.deadline = previous_deadline
+                next_future.subscribe(cb)
 
             return self.subscribe(_cbf2)
 
-        return Future(_cbf)
+        return Future(_cbf, deadline)
+
+    # map :: (a -> b) -> Future b
+    # Completes directly with `f`'s value, without an intermediate `Future.pure`.
+    def map(self, f: Callable[[D], D2]) -> Future[D2]:
+        def _cbf(cb: Callable[[Either[D2, Exception]], None]) -> None:
+            def _cbf2(value: Either[D, Exception]) -> None:
+                if value.left is not None:
+                    return cb(value)  # type: ignore
+                try:
+                    mapped: D2 = f(value.right)
+                except Exception as err:
+                    return cb(Left(err))
+                cb(Right(mapped))
+
+            return self.subscribe(_cbf2)
+
+        return Future(_cbf, self.deadline)
+
+    # with_timeout :: Future a -> seconds -> Future a
+    def with_timeout(self, seconds: float) -> Future[D]:
+        """
+        Future with the result of this future, or `Left(TimeoutError)` after `seconds`.
+
+        The deadline propagates to the futures created by later `map`/`flat_map` steps,
+        and tasks of `async_f` that have not started by then are not run.
+
+        Parameters
+        ----------
+        seconds : float
+            Timeout
+
+        Returns
+        -------
+        Future[D]
+            Future with the earlier of its own deadline and this future's deadline.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+
+        Examples
+        --------
+        >>> Future.async_f(lambda: remote_call()).with_timeout(5).flat_map(lambda r: Future.async_f(lambda: save(r)))
+        """
+        deadline: float = time.monotonic() + seconds
+        if self.deadline is not None:
+            deadline = min(deadline, self.deadline)
+        return Future(self.subscribe, deadline)
+
+    def result(self, timeout: Optional[float] = None) -> Either[D, Exception]:
+        """
+        Block until the future completes.
+
+        Called from a subscriber, it first runs the completions queued on this thread,
+        e.g. of a chain on already completed futures, so they do not wait for it.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            Seconds to wait, or None to wait forever, by default None
+
+        Returns
+        -------
+        Either[D, Exception]
+            Result of the future, or `Left(TimeoutError)` if it is not done in `timeout`.
+            The future itself keeps running.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        queue: Optional[Deque[Tuple[Callable[[Any], None], Any]]] = getattr(
+            _trampoline_state, "queue", None
+        )
+        if queue:
+            _run_queued(queue, self.done)
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.cache is not nil, timeout):
+                return Left(TimeoutError("Future not done in {}s".format(timeout)))
+            return self.cache.value  # type: ignore
+
+    def done(self) -> bool:
+        """
+        Whether the future is completed.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        return self.cache is not nil
+
+    def cancel(self) -> bool:
+        """
+        Complete the future with `Left(CancelledError)` if it is not done yet.
+
+        A task of `async_f` which has not started is removed from its executor.
+        A running task can not be interrupted, its result is ignored.
+
+        Returns
+        -------
+        bool
+            True if the future was cancelled, False if it was already done.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        return self._interrupt(concurrent.futures.CancelledError())
+
+    def _expire(self) -> None:
+        self._interrupt(TimeoutError("Future deadline exceeded"))
+
+    def _interrupt(self, err: BaseException) -> bool:
+        if not self._complete(Left(err), interrupted=True):
+            return False
+        for cancel_callback in self.cancel_callbacks:
+            cancel_callback()
+        return True
+
+    def _add_cancel_callback(self, cancel_callback: Callable[[], Any]) -> None:
+        with self.condition:
+            if not self.interrupted:
+                self.cancel_callbacks.append(cancel_callback)
+                return
+        cancel_callback()
 
     # traverse :: [a] -> (a -> Future b) -> Future [b]
     def traverse(
@@ -76,7 +887,9 @@ class Future(Monad, Generic[D]):
             def _f2(acc: Future[List[D2]], elem: D) -> Future[List[D2]]:
                 def _f3(values: List[D2]) -> Future[List[D2]]:
                     def _f4(value: D2) -> List[D2]:
-                        return values + [value]
+                        # `values` is only seen by this step of the chain.
+                        values.append(value)
+                        return values
 
                     return f(elem).map(_f4)
 
@@ -87,25 +900,326 @@ class Future(Monad, Generic[D]):
 
         return _f1
 
+    @staticmethod
+    def from_concurrent(future: concurrent.futures.Future) -> Future:
+        """
+        Convert a `concurrent.futures.Future` into a `Future`, without blocking any thread.
+
+        Parameters
+        ----------
+        future : concurrent.futures.Future
+            Future of an executor.
+
+        Returns
+        -------
+        Future
+            Future completing with the result of `future`, or `Left` with its exception.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+
+        def _cbf(cb: Callable[[Either[D, Exception]], None]) -> None:
+            def _done(done_future: concurrent.futures.Future) -> None:
+                if done_future.cancelled():
+                    cb(Left(concurrent.futures.CancelledError()))
+                elif done_future.exception() is not None:
+                    cb(Left(done_future.exception()))  # type: ignore
+                else:
+                    cb(Right(done_future.result()))
+
+            future.add_done_callback(_done)
+
+        return Future(_cbf)
+
+    @staticmethod
+    def from_asyncio(
+        awaitable: Awaitable[D], loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Future:
+        """
+        Convert an asyncio future, task or coroutine into a `Future`.
+
+        The result is handed over by a done callback on the event loop, no thread waits for it.
+
+        Parameters
+        ----------
+        awaitable : Awaitable[D]
+            asyncio future, task or coroutine.
+        loop : Optional[asyncio.AbstractEventLoop], optional
+            Loop running a coroutine, by default the running loop.
+            Required when called outside of the loop thread.
+
+        Returns
+        -------
+        Future
+            Future completing with the result of `awaitable`, or `Left` with its exception.
+
+        Raises
+        ------
+        ValueError
+            `awaitable` is a coroutine, and there is neither a `loop` nor a running loop
+            to run it.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+
+        Examples
+        --------
+        >>> Future.from_asyncio(asyncio.sleep(1, "done"), loop).map(len)
+        """
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = (
+                asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            running_loop = None
+        if asyncio.iscoroutine(awaitable) and loop is None and running_loop is None:
+            # `ensure_future` would bind it to a loop nobody runs, never completing.
+            awaitable.close()
+            raise ValueError("No running event loop for the coroutine, pass `loop`")
+        if (
+            asyncio.iscoroutine(awaitable)
+            and loop is not None
+            and loop is not running_loop
+        ):
+            return Future.from_concurrent(
+                asyncio.run_coroutine_threadsafe(awaitable, loop)  # type: ignore
+            )
+        asyncio_future: asyncio.Future = asyncio.ensure_future(awaitable, loop=loop)
+        future_loop: asyncio.AbstractEventLoop = asyncio_future.get_loop()
+
+        def _cbf(cb: Callable[[Either[D, Exception]], None]) -> None:
+            def _done(done_future: asyncio.Future) -> None:
+                if done_future.cancelled():
+                    cb(Left(asyncio.CancelledError()))  # type: ignore
+                elif done_future.exception() is not None:
+                    cb(Left(done_future.exception()))  # type: ignore
+                else:
+                    cb(Right(done_future.result()))
+
+            if future_loop is running_loop:
+                asyncio_future.add_done_callback(_done)
+            else:
+                future_loop.call_soon_threadsafe(
+                    asyncio_future.add_done_callback, _done
+                )
+
+        return Future(_cbf)
+
+    def to_asyncio(
+        self, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> asyncio.Future:
+        """
+        Convert into an asyncio future of `loop`.
+
+        The result is handed over with `loop.call_soon_threadsafe`, no thread waits for it.
+
+        Parameters
+        ----------
+        loop : Optional[asyncio.AbstractEventLoop], optional
+            Event loop, by default the running loop.
+
+        Returns
+        -------
+        asyncio.Future
+            Future with the `Right` value as result, or the `Left` error as exception.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        target_loop: asyncio.AbstractEventLoop = loop or asyncio.get_running_loop()
+        asyncio_future: asyncio.Future = target_loop.create_future()
+
+        def _set(value: Either[D, Exception]) -> None:
+            if asyncio_future.cancelled():
+                return
+            if value.left is not None:
+                asyncio_future.set_exception(value.left)
+            else:
+                asyncio_future.set_result(value.right)
+
+        self.subscribe(lambda value: target_loop.call_soon_threadsafe(_set, value))
+        asyncio_future.add_done_callback(
+            lambda done_future: self.cancel() if done_future.cancelled() else None
+        )
+        return asyncio_future
+
+    # Awaiting a `Future` returns its `Right` value or raises its `Left` error.
+    def __await__(self) -> Generator[Any, None, D]:
+        return self.to_asyncio().__await__()
+
+    # gather :: [Future a] -> Future [a]
+    @staticmethod
+    def gather(futures: Iterable[Future[D]], fail_fast: bool = True) -> Future[List[D]]:
+        """
+        Wait for all `futures` concurrently and collect their values in order.
+
+        Parameters
+        ----------
+        futures : Iterable[Future[D]]
+            Futures, usually already running.
+        fail_fast : bool, optional
+            If True, complete with the first error as soon as it happens.
+            Otherwise wait for all futures and complete with `GatherError` if any failed.
+            by default True
+
+        Returns
+        -------
+        Future[List[D]]
+            Values in the order of `futures`.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+        """
+        return Future.traverse_par(futures, lambda future: future, fail_fast=fail_fast)
+
+    # traverse_par :: [a] -> (a -> Future b) -> Future [b]
+    @staticmethod
+    def traverse_par(
+        arr: Iterable[D],
+        f: Callable[[D], Future[D2]],
+        max_concurrency: Optional[int] = None,
+        fail_fast: bool = True,
+    ) -> Future[List[D2]]:
+        """
+        Apply `f` to the elements of `arr` concurrently, with at most `max_concurrency`
+        futures running at once, and collect the values in order.
+
+        Parameters
+        ----------
+        arr : Iterable[D]
+            Elements
+        f : Callable[[D], Future[D2]]
+            Function starting the work for one element.
+        max_concurrency : Optional[int], optional
+            Maximum number of futures of `f` not completed yet, or None for no limit.
+            by default None
+        fail_fast : bool, optional
+            If True, complete with the first error and start no new work.
+            Otherwise run every element and complete with `GatherError` if any failed.
+            by default True
+
+        Returns
+        -------
+        Future[List[D2]]
+            Values in the order of `arr`.
+
+        Notes
+        -----
+        .. versionadded:: 0.1.5
+
+        Examples
+        --------
+        >>> Future.traverse_par(filenames, lambda name: Future.async_f(lambda: upload(name)), max_concurrency=4)
+        """
+        elements: List[D] = list(arr)
+        size: int = len(elements)
+        limit: int = size if max_concurrency is None else max(1, max_concurrency)
+
+        def _cbf(cb: Callable[[Either[List[D2], Exception]], None]) -> None:
+            results: List[Optional[D2]] = [None] * size
+            errors: List[Tuple[int, Exception]] = []
+            lock: threading.Lock = threading.Lock()
+            next_index: int = 0
+            running: int = 0
+            remaining: int = size
+            finished: bool = False
+            pumping: bool = False
+
+            def _done(index: int, value: Either[D2, Exception]) -> None:
+                nonlocal running, remaining, finished
+                finish: Optional[Either[List[D2], Exception]] = None
+                with lock:
+                    if finished:
+                        return
+                    running -= 1
+                    remaining -= 1
+                    if value.left is not None:
+                        if fail_fast:
+                            finish = Left(value.left)
+                        else:
+                            errors.append((index, value.left))
+                    else:
+                        results[index] = value.right
+                    if finish is None and remaining == 0:
+                        finish = (
+                            Right(results)
+                            if not errors
+                            else Left(GatherError(errors, results))
+                        )
+                    finished = finish is not None
+                if finish is not None:
+                    cb(finish)
+                else:
+                    _pump()
+
+            def _pump() -> None:
+                # Loops instead of recursing when `f` returns completed futures.
+                nonlocal next_index, running, pumping
+                with lock:
+                    if pumping:
+                        return
+                    pumping = True
+                while True:
+                    with lock:
+                        if finished or next_index >= size or running >= limit:
+                            pumping = False
+                            return
+                        index: int = next_index
+                        next_index += 1
+                        running += 1
+                    try:
+                        future: Future[D2] = f(elements[index])
+                    except Exception as err:
+                        _done(index, Left(err))
+                        continue
+                    future.subscribe(lambda value, index=index: _done(index, value))
+
+            if size == 0:
+                cb(Right([]))
+            else:
+                _pump()
+
+        return Future(_cbf)
+
     # callback :: Either err a -> void
+    # Only the first completion counts, later ones (e.g. after a timeout) are ignored.
     def callback(self, d_either: Either[D, Exception]) -> None:
-        self.semaphore.acquire()
-        self.cache = Some(d_either)
-        while len(self.subscribers) > 0:
-            sub: Callable[[Either[D, Exception]], None] = self.subscribers.pop(0)
-            t: threading.Thread = threading.Thread(target=sub, args=[d_either])
-            t.start()
-        self.semaphore.release()
+        self._complete(d_either)
+
+    def _complete(
+        self, d_either: Either[D, Exception], interrupted: bool = False
+    ) -> bool:
+        with self.condition:
+            if self.cache is not nil:
+                return False
+            self.cache = Some(d_either)
+            self.interrupted = interrupted
+            subscribers: List[Callable[[Either[D, Exception]], None]] = self.subscribers
+            self.subscribers = []
+            self.condition.notify_all()
+        if self.expiry is not None:
+            self.expiry.cancel()
+        if self.tracer is not None:
+            self.tracer.completed(len(subscribers))
+        if _callback_executor is inline_executor:
+            _trampoline(subscribers, d_either)
+        else:
+            for sub in subscribers:
+                _callback_executor.submit(sub, d_either)
+        return True
 
     # subscribe :: (Either err a -> void) -> void
     def subscribe(self, subscriber: Callable[[Either[D, Exception]], None]) -> None:
-        def _some(v: Either[D, Exception]) -> None:
-            self.semaphore.release()
-            subscriber(v)
-
-        def _none() -> None:
-            self.subscribers.append(subscriber)
-            self.semaphore.release()
-
-        self.semaphore.acquire()
-        self.cache.fold(lambda value: _some(value), _none())
+        with self.condition:
+            if self.cache is nil:
+                self.subscribers.append(subscriber)
+                if self.tracer is not None:
+                    self.tracer.subscribed()
+                return
+            value: Either[D, Exception] = self.cache.value  # type: ignore
+        _trampoline([subscriber], value)
@@ -7,6 +7,8 @@ T2 = TypeVar("T2")
 
 # https://github.com/alleycat-at-git/monad/blob/master/python/src/monad.py
 class Monad(Generic[T]):
+    __slots__ = ()
+
     # pure :: a -> M a
     @staticmethod
     def pure(x):
@@ -9,6 +9,8 @@ X = TypeVar("X")
 
 # https://github.com/alleycat-at-git/monad/blob/master/python/src/future.py
 class Option(Monad, Generic[S]):
+    __slots__ = ("value",)
+
     def __init__(self, value: Optional[S]):
         self.value: Optional[S] = value
 
@@ -19,11 +21,18 @@ class Option(Monad, Generic[S]):
 
     # flat_map :: # Option a -> (a -> Option b) -> Option b
     def flat_map(self, f: Callable[[S], Option[S2]]) -> Option[S2]:
-        if self.value is None:
+        if self.value is not None:
             return f(self.value)
         else:
             return nil
 
+    # map :: Option a -> (a -> b) -> Option b
+    def map(self, f: Callable[[S], S2]) -> Option[S2]:
+        if self.value is not None:
+            return Some(f(self.value))
+        else:
+            return nil
+
     def fold(self, fa: Callable[[S], X], default: X) -> X:
         if self.value is not None:
             return fa(self.value)
@@ -32,13 +41,29 @@ class Option(Monad, Generic[S]):
 
 
 class Some(Option):
+    __slots__ = ()
+
     def __init__(self, value: S):
-        super(Some, self).__init__(value)
+        self.value = value
 
 
 class Nil(Option):
+    # Singleton: `Nil()` always returns `nil`.
+    __slots__ = ()
+
+    def __new__(cls) -> Nil:
+        try:
+            return nil
+        except NameError:
+            instance = super(Nil, cls).__new__(cls)
+            instance.value = None
+            return instance
+
     def __init__(self):
-        self.value = None
+        pass
+
+    def __reduce__(self):
+        return Nil, ()
 
 
 nil = Nil()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+from typing import Any, Callable, Generic, List, Optional, Tuple, TypeVar, Union
+
+from .either import Either, Left, Right
+from .future import Future, _context
+from .option import Option, Some, nil
+
+T = TypeVar("T")
+T2 = TypeVar("T2")
+
+_MAP = 0
+_FLAT_MAP = 1
+
+
+def _fuse(functions: Tuple[Callable[[Any], Any], ...]) -> Callable[[Any], Any]:
+    if len(functions) == 1:
+        return functions[0]
+
+    def _fused(value: Any) -> Any:
+        for f in functions:
+            value = f(value)
+        return value
+
+    return _fused
+
+
+class Pipeline(Generic[T]):
+    """
+    Lazy chain of `map`/`flat_map` steps, run later on an `Either`, `Option` or `Future`.
+
+    Consecutive `map` steps are fused into one function call and only one monad is
+    allocated per group of maps. `flat_map` steps run in a loop instead of nested calls,
+    so chains of any length run in constant stack space. On a `Future`, the whole chain
+    completes one result future, and steps whose futures are already done run inline.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> pipeline = Pipeline().map(lambda x: x + 1).map(str).flat_map(parse_either)
+    >>> pipeline.run(Right(1))
+    >>> pipeline.run(Future.async_f(load))
+    """
+
+    __slots__ = ("parent", "kind", "f", "_steps")
+
+    def __init__(
+        self,
+        parent_optional: Optional[Pipeline] = None,
+        kind: int = _MAP,
+        f_optional: Optional[Callable[[Any], Any]] = None,
+    ):
+        # Steps are kept as a linked list so adding one does not copy the chain.
+        self.parent: Optional[Pipeline] = parent_optional
+        self.kind: int = kind
+        self.f: Optional[Callable[[Any], Any]] = f_optional
+        self._steps: Optional[List[Tuple[int, Callable[[Any], Any]]]] = None
+
+    # map :: Pipeline a -> (a -> b) -> Pipeline b
+    def map(self, f: Callable[[T], T2]) -> Pipeline[T2]:
+        return Pipeline(self, _MAP, f)
+
+    # flat_map :: Pipeline a -> (a -> M b) -> Pipeline b
+    def flat_map(self, f: Callable[[T], Any]) -> Pipeline[T2]:
+        return Pipeline(self, _FLAT_MAP, f)
+
+    def steps(self) -> List[Tuple[int, Callable[[Any], Any]]]:
+        """
+        Compiled steps, with consecutive maps fused. Computed once per pipeline.
+
+        Returns
+        -------
+        List[Tuple[int, Callable[[Any], Any]]]
+            `(kind, function)` pairs in order.
+        """
+        if self._steps is None:
+            nodes: List[Pipeline] = []
+            node: Optional[Pipeline] = self
+            while node is not None and node.f is not None:
+                nodes.append(node)
+                node = node.parent
+            steps: List[Tuple[int, Callable[[Any], Any]]] = []
+            maps: List[Callable[[Any], Any]] = []
+            for node in reversed(nodes):
+                if node.kind == _MAP:
+                    maps.append(node.f)  # type: ignore
+                    continue
+                if maps:
+                    steps.append((_MAP, _fuse(tuple(maps))))
+                    maps = []
+                steps.append((_FLAT_MAP, node.f))  # type: ignore
+            if maps:
+                steps.append((_MAP, _fuse(tuple(maps))))
+            self._steps = steps
+        return self._steps
+
+    # run :: Pipeline a b -> M a -> M b
+    def run(self, monad: Union[Either, Option, Future]) -> Any:
+        """
+        Run the steps on `monad`.
+
+        Parameters
+        ----------
+        monad : Union[Either, Option, Future]
+            Start value. `flat_map` functions must return the same kind of monad.
+
+        Returns
+        -------
+        Any
+            Result of the same kind as `monad`.
+        """
+        if isinstance(monad, Future):
+            return self._run_future(monad)
+        if isinstance(monad, Either):
+            return self._run_either(monad)
+        if isinstance(monad, Option):
+            return self._run_option(monad)
+        raise TypeError("Cannot run a pipeline on {}".format(type(monad).__name__))
+
+    __call__ = run
+
+    def _run_either(self, either: Either) -> Either:
+        for kind, f in self.steps():
+            if either.left is not None:
+                return either
+            either = Right(f(either.right)) if kind == _MAP else f(either.right)
+        return either
+
+    def _run_option(self, option: Option) -> Option:
+        for kind, f in self.steps():
+            if option.value is None:
+                return nil
+            option = Some(f(option.value)) if kind == _MAP else f(option.value)
+        return option
+
+    def _run_future(self, future: Future) -> Future:
+        steps: List[Tuple[int, Callable[[Any], Any]]] = self.steps()
+        deadline: Optional[float] = future.deadline
+
+        def _cbf(cb: Callable[[Either[Any, Exception]], None]) -> None:
+            def _resume(index: int, value: Either[Any, Exception]) -> None:
+                while index < len(steps):
+                    if value.left is not None:
+                        break
+                    kind, f = steps[index]
+                    index += 1
+                    try:
+                        if kind == _MAP:
+                            value = Right(f(value.right))
+                            continue
+                        # Stage futures inherit the deadline, as in `Future.flat_map`.
+                        previous_deadline: Optional[float] = getattr(
+                            _context, "deadline", None
+                        )
+                        _context.deadline = deadline
+                        try:
+                            next_future: Future = f(value.right)
+                        finally:
+                            _context.deadline = previous_deadline
+                    except Exception as err:
+                        value = Left(err)
+                        break
+                    if not next_future.done():
+                        next_future.subscribe(
+                            lambda next_value, index=index: _resume(index, next_value)
+                        )
+                        return
+                    value = next_future.result()
+                cb(value)
+
+            future.subscribe(lambda value: _resume(0, value))
+
+        return Future(_cbf, deadline)
@@ -0,0 +1,246 @@
+from __future__ import annotations
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from .either import Either, Left
+from .future import Future, TimerHandle, call_later
+
+D = TypeVar("D")
+
+
+class _Task:
+    __slots__ = (
+        "factory",
+        "priority",
+        "callback",
+        "future",
+        "submitted_at",
+        "attempts",
+    )
+
+    def __init__(self, factory: Callable[[], Future], priority: int):
+        self.factory: Callable[[], Future] = factory
+        self.priority: int = priority
+        self.callback: Optional[Callable[[Either[Any, Exception]], None]] = None
+        self.future: Optional[Future] = None
+        self.submitted_at: float = time.monotonic()
+        self.attempts: int = 0
+
+
+class Scheduler:
+    """
+    Scheduler starting `Future` factories with a limit on running futures,
+    a token-bucket rate limit, priorities and retries with jittered exponential backoff.
+
+    Parameters
+    ----------
+    max_in_flight : int, optional
+        Maximum number of started futures not completed yet, by default 8
+    rate_optional : Optional[float], optional
+        Maximum starts per second (retries included), or None for no limit, by default None
+    burst : int, optional
+        Starts allowed at once when the bucket is full, by default 1
+    max_retries : int, optional
+        Retries of a failed future, by default 0
+    backoff_base : float, optional
+        Base delay of the retries in seconds, by default 0.1
+    backoff_max : float, optional
+        Maximum delay of the retries in seconds, by default 10.0
+    retry_if : Callable[[Exception], bool], optional
+        Whether an error should be retried, by default all errors.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> scheduler = Scheduler(max_in_flight=4, rate_optional=10, max_retries=3)
+    >>> futures = [
+    ...     scheduler.submit(lambda name=name: Future.async_f(lambda: upload_file(info, name, ".", "web")))
+    ...     for name in filenames
+    ... ]
+    >>> scheduler.stats()
+    {'queue_depth': 12, 'in_flight': 4, ...}
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 8,
+        rate_optional: Optional[float] = None,
+        burst: int = 1,
+        max_retries: int = 0,
+        backoff_base: float = 0.1,
+        backoff_max: float = 10.0,
+        retry_if: Callable[[Exception], bool] = lambda err: True,
+    ):
+        self.max_in_flight: int = max(1, max_in_flight)
+        self.rate_optional: Optional[float] = rate_optional
+        self.burst: int = max(1, burst)
+        self.max_retries: int = max_retries
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.retry_if: Callable[[Exception], bool] = retry_if
+
+        self._lock: threading.Lock = threading.Lock()
+        self._queue: List[Tuple[int, int, _Task]] = []
+        self._counter = itertools.count()
+        self._tokens: float = float(self.burst)
+        self._refilled_at: float = time.monotonic()
+        self._wakeup_at: Optional[float] = None
+        self._dispatching: bool = False
+        self._in_flight: int = 0
+        self._stats: Dict[str, float] = {
+            "submitted": 0,
+            "started": 0,
+            "completed": 0,
+            "failed": 0,
+            "retries": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+        }
+
+    # submit :: (() -> Future a) -> Future a
+    def submit(self, factory: Callable[[], Future[D]], priority: int = 0) -> Future[D]:
+        """
+        Queue `factory` to be started when the limits allow it.
+
+        Parameters
+        ----------
+        factory : Callable[[], Future[D]]
+            Function starting the work, called again for each retry.
+        priority : int, optional
+            Lower values start first, submission order among equal values. by default 0
+
+        Returns
+        -------
+        Future[D]
+            Result of the last attempt. Cancelling it before it starts removes it from the queue.
+        """
+        task: _Task = _Task(factory, priority)
+
+        def _cbf(cb: Callable[[Either[D, Exception]], None]) -> None:
+            task.callback = cb
+
+        task.future = Future(_cbf)
+        with self._lock:
+            heapq.heappush(self._queue, (priority, next(self._counter), task))
+            self._stats["submitted"] += 1
+        self._dispatch()
+        return task.future
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Current queue depth and counters, for tuning throughput.
+
+        Returns
+        -------
+        Dict[str, float]
+            `queue_depth`, `in_flight`, `submitted`, `started`, `completed`, `failed`,
+            `retries`, and `wait_time_avg`/`wait_time_max`: seconds between submission
+            and first start.
+        """
+        with self._lock:
+            stats: Dict[str, float] = dict(self._stats)
+            stats["queue_depth"] = len(self._queue)
+            stats["in_flight"] = self._in_flight
+        started: float = stats["started"]
+        stats["wait_time_avg"] = (
+            stats.pop("wait_time_total") / started if started else 0.0
+        )
+        return stats
+
+    def _take_token(self, now: float) -> bool:
+        if self.rate_optional is None:
+            return True
+        self._tokens = min(
+            float(self.burst),
+            self._tokens + (now - self._refilled_at) * self.rate_optional,
+        )
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        if self._wakeup_at is None:
+            self._wakeup_at = now + (1 - self._tokens) / self.rate_optional
+            call_later(self._wakeup_at - now, self._wakeup)
+        return False
+
+    def _wakeup(self) -> None:
+        with self._lock:
+            self._wakeup_at = None
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        # Loops instead of recursing when factories return completed futures.
+        with self._lock:
+            if self._dispatching:
+                return
+            self._dispatching = True
+        while True:
+            with self._lock:
+                task: Optional[_Task] = None
+                while self._queue and self._in_flight < self.max_in_flight:
+                    if self._queue[0][2].future.done():  # type: ignore
+                        heapq.heappop(self._queue)  # cancelled
+                        continue
+                    now: float = time.monotonic()
+                    if not self._take_token(now):
+                        break
+                    _, _, task = heapq.heappop(self._queue)
+                    self._in_flight += 1
+                    if task.attempts == 0:
+                        wait_time: float = now - task.submitted_at
+                        self._stats["started"] += 1
+                        self._stats["wait_time_total"] += wait_time
+                        self._stats["wait_time_max"] = max(
+                            self._stats["wait_time_max"], wait_time
+                        )
+                    break
+                if task is None:
+                    self._dispatching = False
+                    return
+            self._start(task)
+
+    def _start(self, task: _Task) -> None:
+        try:
+            future: Future = task.factory()
+        except Exception as err:
+            self._done(task, Left(err))
+            return
+        future.subscribe(lambda value: self._done(task, value))
+
+    def _done(self, task: _Task, value: Either[Any, Exception]) -> None:
+        retry: bool = (
+            value.left is not None
+            and task.attempts < self.max_retries
+            and not task.future.done()  # type: ignore
+            and self.retry_if(value.left)
+        )
+        with self._lock:
+            self._in_flight -= 1
+            if retry:
+                task.attempts += 1
+                self._stats["retries"] += 1
+            else:
+                self._stats["completed" if value.left is None else "failed"] += 1
+        if retry:
+            # Full jitter: uniform in [0, min(max, base * 2^attempt)].
+            delay: float = random.uniform(
+                0, min(self.backoff_max, self.backoff_base * 2**task.attempts)
+            )
+            pending: TimerHandle = call_later(delay, lambda: self._requeue(task))
+            # Cancelling the result during the backoff drops the pending retry.
+            task.future.subscribe(lambda _: pending.cancel())  # type: ignore
+        else:
+            task.callback(value)  # type: ignore
+        self._dispatch()
+
+    def _requeue(self, task: _Task) -> None:
+        with self._lock:
+            heapq.heappush(self._queue, (task.priority, next(self._counter), task))
+        self._dispatch()
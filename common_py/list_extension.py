@@ -1,5 +1,27 @@
-from collections import Counter
-from typing import Callable, List, TypeVar
+from collections import Counter, deque
+import array
+import decimal
+import fractions
+import hashlib
+import heapq
+import itertools
+import math
+import mmap
+import numbers
+import struct
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 T = TypeVar("T")
 
@@ -150,3 +172,743 @@ def list_intersection(f: List[T], t: List[T]) -> List[T]:
     [1, 2]
     """
     return list(set(f).intersection(t))
+
+
+class BloomFilter:
+    """
+    Compact Bloom filter backed by a `bytearray`.
+
+    Membership tests may report false positives with a probability close to
+    `error_rate` once `capacity` elements have been added, but never false negatives.
+
+    Attributes
+    ----------
+    capacity : int
+        Expected number of elements.
+    error_rate : float
+        Target false-positive rate at `capacity` elements.
+    num_bits : int
+        Size of the bit array.
+    num_hashes : int
+        Number of bit positions set per element.
+    count : int
+        Number of elements added so far.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> bloom = common_py.BloomFilter.build(["a", "b", "c"], error_rate=0.001)
+    >>> "a" in bloom
+    True
+    >>> "z" in bloom
+    False
+    >>> bloom.save("seen.bloom")
+    >>> common_py.BloomFilter.load("seen.bloom", mmap_mode=True)
+    """
+
+    _MAGIC = b"CPBF"
+    _HEADER = struct.Struct("<4sQQId")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive, got {}".format(capacity))
+        if not 0.0 < error_rate < 1.0:
+            raise ValueError("error_rate must be in (0, 1), got {}".format(error_rate))
+        num_bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.capacity: int = capacity
+        self.error_rate: float = error_rate
+        self.num_bits: int = max(num_bits, 8)
+        self.num_hashes: int = max(
+            1, int(round(self.num_bits / capacity * math.log(2)))
+        )
+        self.count: int = 0
+        self.bits: Union[bytearray, memoryview] = bytearray((self.num_bits + 7) // 8)
+        self._mmap: Optional[mmap.mmap] = None
+
+    @staticmethod
+    def _key(item: Any) -> bytes:
+        # Prefix by type so that e.g. `1` and `"1"` do not share bit positions.
+        if isinstance(item, (bytes, bytearray, memoryview)):
+            return b"b" + bytes(item)
+        if isinstance(item, str):
+            return b"s" + item.encode("utf-8")
+        if isinstance(item, int):
+            return b"i" + str(int(item)).encode("ascii")
+        if isinstance(item, (numbers.Real, decimal.Decimal)):
+            # Numbers that compare equal share a key, e.g. `1`, `1.0` and `Decimal("1")`.
+            try:
+                exact = fractions.Fraction(item)
+            except (OverflowError, ValueError):
+                return b"f" + repr(float(item)).encode("ascii")
+            if exact.denominator == 1:
+                return b"i" + str(exact.numerator).encode("ascii")
+            return b"q" + "{}/{}".format(exact.numerator, exact.denominator).encode(
+                "ascii"
+            )
+        return b"r" + repr(item).encode("utf-8")
+
+    def _positions(self, item: Any) -> Iterator[int]:
+        digest = hashlib.blake2b(self._key(item), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def add(self, item: Any) -> None:
+        """
+        Add an element.
+
+        Parameters
+        ----------
+        item : Any
+            Element to add. `bytes`, `str` and real numbers are hashed by value (numbers that
+            compare equal, e.g. `1` and `1.0`, are the same element), anything else by `repr`.
+        """
+        bits = self.bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items: Iterable[Any]) -> None:
+        """
+        Add every element of `items`.
+
+        Parameters
+        ----------
+        items : Iterable[Any]
+            Elements to add.
+        """
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: Any) -> bool:
+        bits = self.bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
+
+    def union(self, other: "BloomFilter") -> "BloomFilter":
+        """
+        Union of two filters built with the same `capacity` and `error_rate`.
+
+        Parameters
+        ----------
+        other : BloomFilter
+            Filter to merge with.
+
+        Returns
+        -------
+        BloomFilter
+            New filter containing the elements of both filters.
+
+        Raises
+        ------
+        ValueError
+            The filters do not have the same size and number of hashes.
+        """
+        if self.num_bits != other.num_bits or self.num_hashes != other.num_hashes:
+            raise ValueError("Cannot union Bloom filters of different shapes.")
+        result = BloomFilter(self.capacity, self.error_rate)
+        chunk = 1 << 20
+        for start in range(0, len(self.bits), chunk):
+            end = min(start + chunk, len(self.bits))
+            merged = int.from_bytes(self.bits[start:end], "little") | int.from_bytes(
+                other.bits[start:end], "little"
+            )
+            result.bits[start:end] = merged.to_bytes(end - start, "little")
+        result.count = self.count + other.count
+        return result
+
+    def __or__(self, other: "BloomFilter") -> "BloomFilter":
+        return self.union(other)
+
+    @staticmethod
+    def build(
+        items: Iterable[Any],
+        error_rate: float = 0.01,
+        capacity_optional: Optional[int] = None,
+    ) -> "BloomFilter":
+        """
+        Build a filter from `items`.
+
+        Parameters
+        ----------
+        items : Iterable[Any]
+            Elements to add.
+        error_rate : float, optional
+            Target false-positive rate, by default 0.01
+        capacity_optional : Optional[int], optional
+            Expected number of elements, by default `len(items)`.
+            Required if `items` has no length (e.g. a generator).
+
+        Returns
+        -------
+        BloomFilter
+            Filter containing `items`.
+        """
+        if capacity_optional is None:
+            if not isinstance(items, Sized):
+                raise ValueError("capacity_optional is required for unsized iterables.")
+            capacity_optional = max(len(items), 1)
+        bloom = BloomFilter(capacity_optional, error_rate)
+        bloom.update(items)
+        return bloom
+
+    def save(self, path: str) -> None:
+        """
+        Write the filter to `path`.
+
+        Parameters
+        ----------
+        path : str
+            File path.
+        """
+        with open(path, "wb") as f:
+            f.write(
+                self._HEADER.pack(
+                    self._MAGIC,
+                    self.num_bits,
+                    self.count,
+                    self.num_hashes,
+                    self.error_rate,
+                )
+            )
+            f.write(self.bits)
+
+    @staticmethod
+    def load(path: str, mmap_mode: bool = False) -> "BloomFilter":
+        """
+        Read a filter written by `save`.
+
+        Parameters
+        ----------
+        path : str
+            File path.
+        mmap_mode : bool, optional
+            If True, the bit array is memory mapped read-only instead of being read into memory,
+            so only the pages touched by lookups are loaded. by default False
+
+        Returns
+        -------
+        BloomFilter
+            Loaded filter. A memory mapped filter cannot be added to.
+        """
+        header_size = BloomFilter._HEADER.size
+        with open(path, "rb") as f:
+            magic, num_bits, count, num_hashes, error_rate = BloomFilter._HEADER.unpack(
+                f.read(header_size)
+            )
+            if magic != BloomFilter._MAGIC:
+                raise ValueError("{} is not a Bloom filter file.".format(path))
+            bloom = BloomFilter.__new__(BloomFilter)
+            bloom.num_bits = num_bits
+            bloom.num_hashes = num_hashes
+            bloom.error_rate = error_rate
+            bloom.count = count
+            bloom.capacity = max(
+                1, int(round(num_bits * (math.log(2) ** 2) / -math.log(error_rate)))
+            )
+            bloom._mmap = None
+            if mmap_mode:
+                bloom._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                bloom.bits = memoryview(bloom._mmap)[header_size:]
+            else:
+                bloom.bits = bytearray(f.read())
+        return bloom
+
+    def close(self) -> None:
+        """
+        Release the memory map of a filter loaded with `mmap_mode=True`.
+        """
+        if self._mmap is not None:
+            self.bits.release()  # type: ignore
+            self._mmap.close()
+            self._mmap = None
+            self.bits = bytearray()
+
+
+def __bloom_of(
+    t: Union[Iterable[T], BloomFilter],
+    error_rate: float,
+    capacity_optional: Optional[int],
+) -> BloomFilter:
+    if isinstance(t, BloomFilter):
+        return t
+    return BloomFilter.build(t, error_rate, capacity_optional)
+
+
+def approx_list_diff(
+    f: Iterable[T],
+    t: Union[Iterable[T], BloomFilter],
+    error_rate: float = 0.01,
+    capacity_optional: Optional[int] = None,
+) -> List[T]:
+    """
+    Approximate `list_diff` that keeps `t` in a Bloom filter instead of a set.
+
+    An element of `f` may be missing from the result with a probability of about `error_rate`
+    (a false positive of the filter). Elements that are in `t` are never returned.
+
+    Parameters
+    ----------
+    f : Iterable[T]
+        Elements to check. Duplicates are removed, the first occurrence order is kept.
+    t : Union[Iterable[T], BloomFilter]
+        Elements to remove, or a prebuilt (possibly memory mapped) `BloomFilter`.
+    error_rate : float, optional
+        False-positive rate when building a filter from `t`, by default 0.01
+    capacity_optional : Optional[int], optional
+        Number of elements of `t` if it has no length, by default None
+
+    Returns
+    -------
+    List[T]
+        Elements of `f` that are (very probably) not in `t`.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> common_py.approx_list_diff([1,2,3,4,4], [1,2,3])
+    [4]
+    """
+    bloom: BloomFilter = __bloom_of(t, error_rate, capacity_optional)
+    return [element for element in dict.fromkeys(f) if element not in bloom]
+
+
+def approx_contains(
+    f: Iterable[T],
+    t: Union[Iterable[T], BloomFilter],
+    error_rate: float = 0.01,
+    capacity_optional: Optional[int] = None,
+) -> List[bool]:
+    """
+    Check whether each element of `f` is in `t`, using a Bloom filter.
+
+    Parameters
+    ----------
+    f : Iterable[T]
+        Elements to check.
+    t : Union[Iterable[T], BloomFilter]
+        Elements to look in, or a prebuilt (possibly memory mapped) `BloomFilter`.
+    error_rate : float, optional
+        False-positive rate when building a filter from `t`, by default 0.01
+    capacity_optional : Optional[int], optional
+        Number of elements of `t` if it has no length, by default None
+
+    Returns
+    -------
+    List[bool]
+        For each element of `f`, False if it is not in `t`,
+        True if it is in `t` or is a false positive.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> common_py.approx_contains([1, 5], [1,2,3])
+    [True, False]
+    """
+    bloom: BloomFilter = __bloom_of(t, error_rate, capacity_optional)
+    return [element in bloom for element in f]
+
+
+_END = object()
+
+
+def __unique_sorted(s: Iterable[T]) -> Iterator[T]:
+    previous: Any = _END
+    for element in s:
+        if previous is _END or element != previous:
+            yield element
+            previous = element
+
+
+def sorted_lines(path: str, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Lazily read the lines of a sorted text file, without trailing newlines.
+
+    Use it to feed the `sorted_*` functions with file-backed streams.
+
+    Parameters
+    ----------
+    path : str
+        Path of a file whose lines are sorted.
+    encoding : str, optional
+        File encoding, by default "utf-8"
+
+    Returns
+    -------
+    Iterator[str]
+        Lines of the file. The file is closed when the iterator is exhausted.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.sorted_diff(common_py.sorted_lines("new.txt"), common_py.sorted_lines("old.txt")))
+    """
+    with open(path, "r", encoding=encoding) as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+def sorted_diff(f: Iterable[T], t: Iterable[T]) -> Iterator[T]:
+    """
+    `list_diff` for sorted inputs. O(n) time, O(1) memory.
+
+    Parameters
+    ----------
+    f : Iterable[T]
+        Sorted iterable 1
+    t : Iterable[T]
+        Sorted iterable 2
+
+    Returns
+    -------
+    Iterator[T]
+        Sorted elements of `f` which are not in `t`, without duplicate elements.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.sorted_diff([1,2,3,4,4], [1,2,3]))
+    [4]
+    """
+    t_iter: Iterator[T] = iter(t)
+    current: Any = next(t_iter, _END)
+    for element in __unique_sorted(f):
+        while current is not _END and current < element:
+            current = next(t_iter, _END)
+        if current is _END or element != current:
+            yield element
+
+
+def sorted_intersection(f: Iterable[T], t: Iterable[T]) -> Iterator[T]:
+    """
+    `list_intersection` for sorted inputs. O(n) time, O(1) memory.
+
+    Parameters
+    ----------
+    f : Iterable[T]
+        Sorted iterable 1
+    t : Iterable[T]
+        Sorted iterable 2
+
+    Returns
+    -------
+    Iterator[T]
+        Sorted common elements between `f` and `t`, without duplicate elements.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.sorted_intersection([1,2,2,3], [1,2,5,9]))
+    [1, 2]
+    """
+    t_iter: Iterator[T] = iter(t)
+    current: Any = next(t_iter, _END)
+    for element in __unique_sorted(f):
+        while current is not _END and current < element:
+            current = next(t_iter, _END)
+        if current is _END:
+            return
+        if element == current:
+            yield element
+
+
+def sorted_union(f: Iterable[T], t: Iterable[T]) -> Iterator[T]:
+    """
+    Union of sorted inputs. O(n) time, O(1) memory.
+
+    Parameters
+    ----------
+    f : Iterable[T]
+        Sorted iterable 1
+    t : Iterable[T]
+        Sorted iterable 2
+
+    Returns
+    -------
+    Iterator[T]
+        Sorted elements in `f` or `t`, without duplicate elements.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.sorted_union([1,3,3], [2,3,4]))
+    [1, 2, 3, 4]
+    """
+    return sorted_union_n(f, t)
+
+
+def sorted_union_n(*iterables: Iterable[T]) -> Iterator[T]:
+    """
+    N-way union of sorted inputs, merged with `heapq.merge`.
+    O(n log k) time and O(k) memory for `k` inputs.
+
+    Parameters
+    ----------
+    *iterables : Iterable[T]
+        Sorted iterables
+
+    Returns
+    -------
+    Iterator[T]
+        Sorted elements in any of `iterables`, without duplicate elements.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.sorted_union_n([1,5], [2,5], [3]))
+    [1, 2, 3, 5]
+    """
+    return __unique_sorted(heapq.merge(*iterables))
+
+
+def sorted_intersection_n(*iterables: Iterable[T]) -> Iterator[T]:
+    """
+    N-way intersection of sorted inputs, merged with `heapq.merge`.
+    O(n log k) time and O(k) memory for `k` inputs.
+
+    Parameters
+    ----------
+    *iterables : Iterable[T]
+        Sorted iterables
+
+    Returns
+    -------
+    Iterator[T]
+        Sorted elements in all of `iterables`, without duplicate elements.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.sorted_intersection_n([1,2,5], [2,5], [0,2,5,7]))
+    [2, 5]
+    """
+    if len(iterables) == 0:
+        return
+    previous: Any = _END
+    count: int = 0
+    for element in heapq.merge(*map(__unique_sorted, iterables)):
+        if previous is not _END and element == previous:
+            count += 1
+        else:
+            previous, count = element, 1
+        if count == len(iterables):
+            yield element
+
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview, array.array)
+
+
+def chunked(
+    iterable: Iterable[T], size: int, as_view: bool = False
+) -> Iterator[Union[List[T], memoryview, bytes, array.array]]:
+    """
+    Lazily split `iterable` into chunks of `size` elements. The last chunk may be shorter.
+
+    Parameters
+    ----------
+    iterable : Iterable[T]
+        Any iterable, or a 1-D buffer (`bytes`, `bytearray`, `memoryview`, `array.array`, ...).
+    size : int
+        Number of elements per chunk.
+    as_view : bool, optional
+        If True, `iterable` must support the buffer protocol and chunks are zero-copy
+        `memoryview` slices of it. by default False
+
+    Returns
+    -------
+    Iterator[Union[List[T], memoryview, bytes, array.array]]
+        Lists for iterables, slices of the same type for buffers,
+        or `memoryview` if `as_view` is True.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.chunked([1,2,3,4,5], 2))
+    [[1, 2], [3, 4], [5]]
+    >>> [bytes(view) for view in common_py.chunked(b"abcde", 2, as_view=True)]
+    [b'ab', b'cd', b'e']
+    """
+    if size <= 0:
+        raise ValueError("size must be positive, got {}".format(size))
+    if as_view or isinstance(iterable, _BUFFER_TYPES):
+        buffer = memoryview(iterable) if as_view else iterable  # type: ignore
+        for start in range(0, len(buffer), size):  # type: ignore
+            yield buffer[start : start + size]  # type: ignore
+        return
+    iterator: Iterator[T] = iter(iterable)
+    while True:
+        chunk: List[T] = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def chunked_by_bytes(
+    iterable: Iterable[T], max_bytes: int, size_f: Callable[[T], int] = len  # type: ignore
+) -> Iterator[List[T]]:
+    """
+    Lazily split `iterable` into chunks whose total size is at most `max_bytes`.
+
+    An element bigger than `max_bytes` is yielded alone in its own chunk.
+
+    Parameters
+    ----------
+    iterable : Iterable[T]
+        Any iterable.
+    max_bytes : int
+        Maximum total size of a chunk.
+    size_f : Callable[[T], int], optional
+        Size of an element, by default `len`.
+        For example `lambda name: os.path.getsize(os.path.join(local_path, name))` for file names.
+
+    Returns
+    -------
+    Iterator[List[T]]
+        Chunks in order.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.chunked_by_bytes([b"ab", b"cd", b"efgh", b"i"], 4))
+    [[b'ab', b'cd'], [b'efgh'], [b'i']]
+    """
+    chunk: List[T] = []
+    chunk_bytes: int = 0
+    for element in iterable:
+        element_bytes: int = size_f(element)
+        if chunk and chunk_bytes + element_bytes > max_bytes:
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(element)
+        chunk_bytes += element_bytes
+    if chunk:
+        yield chunk
+
+
+def windowed(
+    iterable: Iterable[T], n: int, step: int = 1, as_view: bool = False
+) -> Iterator[Union[Tuple[T, ...], memoryview]]:
+    """
+    Lazily yield sliding windows of `n` elements, moving by `step` elements.
+    Only full windows are yielded.
+
+    Parameters
+    ----------
+    iterable : Iterable[T]
+        Any iterable, or a 1-D buffer if `as_view` is True.
+    n : int
+        Window size.
+    step : int, optional
+        Distance between the starts of two windows, by default 1
+    as_view : bool, optional
+        If True, `iterable` must support the buffer protocol and windows are zero-copy
+        `memoryview` slices of it. by default False
+
+    Returns
+    -------
+    Iterator[Union[Tuple[T, ...], memoryview]]
+        Tuples, or `memoryview` if `as_view` is True.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.windowed([1,2,3,4,5], 3))
+    [(1, 2, 3), (2, 3, 4), (3, 4, 5)]
+    >>> list(common_py.windowed([1,2,3,4,5], 2, step=2))
+    [(1, 2), (3, 4)]
+    """
+    if n <= 0 or step <= 0:
+        raise ValueError("n and step must be positive, got {} and {}".format(n, step))
+    if as_view:
+        view: memoryview = memoryview(iterable)  # type: ignore
+        for start in range(0, len(view) - n + 1, step):
+            yield view[start : start + n]
+        return
+    iterator: Iterator[T] = iter(iterable)
+    window: Deque[T] = deque(itertools.islice(iterator, n), maxlen=n)
+    if len(window) < n:
+        return
+    while True:
+        yield tuple(window)
+        if step > n:
+            # Skip the elements between two windows.
+            deque(itertools.islice(iterator, step - n), maxlen=0)
+        shift: List[T] = list(itertools.islice(iterator, min(step, n)))
+        if len(shift) < min(step, n):
+            return
+        window.extend(shift)
+
+
+def interleave(*iterables: Iterable[T]) -> Iterator[T]:
+    """
+    Lazily take one element of each iterable in turn, until all of them are exhausted.
+
+    Parameters
+    ----------
+    *iterables : Iterable[T]
+        Iterables
+
+    Returns
+    -------
+    Iterator[T]
+        Interleaved elements.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> list(common_py.interleave([1,2,3], "ab", [True]))
+    [1, 'a', True, 2, 'b', 3]
+    """
+    iterators: Deque[Iterator[T]] = deque(map(iter, iterables))
+    while iterators:
+        iterator: Iterator[T] = iterators.popleft()
+        for element in iterator:
+            yield element
+            iterators.append(iterator)
+            break
@@ -1,9 +1,84 @@
+import atexit
+from collections import deque
+from contextlib import contextmanager
+import errno
+import hashlib
 import os
+import queue
 import socket
-from typing import List, Optional
+import stat
+import threading
+import time
+import weakref
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 import paramiko
 
+from common_py.functional.either import Either, Left, Right
+
+
+class TransportProfile:
+    """
+    Transport settings for a kind of network, given to `SftpServerInfo`.
+
+    Attributes
+    ----------
+    ciphers : List[str]
+        Preferred ciphers, in order. Those the installed paramiko does not support are
+        skipped, and its other ciphers follow.
+    compression : bool
+        Compress the SSH stream (zlib). Helps on slow links with compressible data,
+        costs CPU on fast ones.
+    window_size_optional : Optional[int]
+        SSH channel window in bytes, paramiko's default if None.
+    max_packet_size_optional : Optional[int]
+        SSH packet size in bytes, paramiko's default if None.
+    block_size_optional : Optional[int]
+        Bytes read from a local file at a time while uploading, the default if None.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> SftpServerInfo("sftp.server.address", 22, "username", "password", profile_optional=FAST_LAN_PROFILE)
+    """
+
+    def __init__(
+        self,
+        ciphers: List[str],
+        compression: bool,
+        window_size_optional: Optional[int] = None,
+        max_packet_size_optional: Optional[int] = None,
+        block_size_optional: Optional[int] = None,
+    ):
+        self.ciphers: List[str] = ciphers
+        self.compression: bool = compression
+        self.window_size_optional: Optional[int] = window_size_optional
+        self.max_packet_size_optional: Optional[int] = max_packet_size_optional
+        self.block_size_optional: Optional[int] = block_size_optional
+
+
+# Fast, low-latency networks: cheap AEAD or CTR ciphers, no compression and large windows.
+FAST_LAN_PROFILE: TransportProfile = TransportProfile(
+    ciphers=[
+        "aes128-gcm@openssh.com",
+        "chacha20-poly1305@openssh.com",
+        "aes128-ctr",
+    ],
+    compression=False,
+    window_size_optional=64 << 20,
+    block_size_optional=1 << 20,
+)
+
+# Slow or long-distance links: compression, and windows covering the bandwidth-delay product.
+SLOW_WAN_PROFILE: TransportProfile = TransportProfile(
+    ciphers=["aes128-gcm@openssh.com", "aes128-ctr"],
+    compression=True,
+    window_size_optional=16 << 20,
+)
+
 
 class SftpServerInfo:
     """
@@ -12,7 +87,7 @@ class SftpServerInfo:
     Attributes
     ----------
     host_name : str
-        Host name for sftp server. 
+        Host name for sftp server.
         Should not include like "sftp://", "http://", "https://" etc.
         ex) test.commonpy.net
     host_port : int
@@ -21,23 +96,73 @@ class SftpServerInfo:
         User name which can access to sftp server.
     password : str
         Password for username.
+    window_size_optional : Optional[int]
+        SSH channel window in bytes, paramiko's default (2 MiB) if None.
+        Larger windows keep more data in flight on high-latency links.
+    max_packet_size_optional : Optional[int]
+        SSH packet size in bytes, paramiko's default (32 KiB) if None.
+    block_size : int
+        Bytes read from a local file at a time while transferring. 256 KiB by default.
+    profile_optional : Optional[TransportProfile]
+        Ciphers and compression of the transport, e.g. `FAST_LAN_PROFILE`.
+        Its sizes apply where the arguments above are not given.
+        Connections are pooled by host, port and username only, so use one profile
+        per server.
 
     Notes
     -----
     .. versionadded:: 0.1.4
+
+    .. versionchanged:: 0.1.5
+       Add `window_size_optional`, `max_packet_size_optional`, `block_size` and
+       `profile_optional`.
     """
 
-    def __init__(self, host_name: str, host_port: int, username: str, password: str):
+    def __init__(
+        self,
+        host_name: str,
+        host_port: int,
+        username: str,
+        password: str,
+        window_size_optional: Optional[int] = None,
+        max_packet_size_optional: Optional[int] = None,
+        block_size: Optional[int] = None,
+        profile_optional: Optional[TransportProfile] = None,
+    ):
         self.host_name: str = host_name
         self.host_port: int = host_port
         self.username: str = username
         self.password: str = password
+        self.profile_optional: Optional[TransportProfile] = profile_optional
+        profile: TransportProfile = profile_optional or TransportProfile([], False)
+        self.window_size_optional: Optional[int] = (
+            window_size_optional or profile.window_size_optional
+        )
+        self.max_packet_size_optional: Optional[int] = (
+            max_packet_size_optional or profile.max_packet_size_optional
+        )
+        self.block_size: int = block_size or profile.block_size_optional or 1 << 18
 
 
 def __connect(sftp_server_info: SftpServerInfo) -> paramiko.Transport:
+    sizes: Dict[str, int] = {}
+    if sftp_server_info.window_size_optional is not None:
+        sizes["default_window_size"] = sftp_server_info.window_size_optional
+    if sftp_server_info.max_packet_size_optional is not None:
+        sizes["default_max_packet_size"] = sftp_server_info.max_packet_size_optional
     transport = paramiko.Transport(
-        (sftp_server_info.host_name, sftp_server_info.host_port)
+        (sftp_server_info.host_name, sftp_server_info.host_port), **sizes
     )
+    profile_optional: Optional[TransportProfile] = sftp_server_info.profile_optional
+    if profile_optional is not None:
+        options: paramiko.SecurityOptions = transport.get_security_options()
+        preferred: List[str] = [
+            cipher for cipher in profile_optional.ciphers if cipher in options.ciphers
+        ]
+        options.ciphers = preferred + [
+            cipher for cipher in options.ciphers if cipher not in preferred
+        ]
+        transport.use_compression(profile_optional.compression)
     transport.connect(
         None,
         sftp_server_info.username,
@@ -51,16 +176,323 @@ def __get_sftp_client(transport: paramiko.Transport):
     return paramiko.SFTPClient.from_transport(transport)
 
 
-def __disconnect(transport: paramiko.Transport):
-    transport.close()
+class _PooledConnection:
+    def __init__(
+        self,
+        key: Tuple[str, int, str],
+        transport: paramiko.Transport,
+        sftp_client: paramiko.SFTPClient,
+    ):
+        self.key: Tuple[str, int, str] = key
+        self.transport: paramiko.Transport = transport
+        self.sftp_client: paramiko.SFTPClient = sftp_client
+        self.released_at: float = time.monotonic()
+
+    def close(self) -> None:
+        for closeable in (self.sftp_client, self.transport):
+            try:
+                closeable.close()
+            except Exception:
+                pass
+
+
+class SftpPool:
+    """
+    Pool of authenticated transports and their `SFTPClient`, reused across uploads.
+
+    Connections are keyed by `host_name`, `host_port` and `username` of `SftpServerInfo`.
+    A checked out connection is used by one thread at a time.
+    Idle connections older than `idle_timeout` seconds are closed on the next `checkout`,
+    `checkin` or `stats` call, there is no background thread. Connections whose
+    transport is no longer active are replaced on checkout.
+    After `close`, checkouts raise `RuntimeError` and connections are closed on checkin.
+
+    Parameters
+    ----------
+    connector : Callable[[SftpServerInfo], paramiko.Transport]
+        Opens and authenticates a transport.
+    max_size : int, optional
+        Maximum connections per key, idle or in use. by default 4
+    idle_timeout : float, optional
+        Seconds an idle connection is kept, by default 60.0
+    checkout_timeout_optional : Optional[float], optional
+        Seconds to wait for a free connection before raising `TimeoutError`,
+        or None to wait forever. by default None
+    client_factory : Callable[[paramiko.Transport], paramiko.SFTPClient], optional
+        Opens the SFTP session, by default `paramiko.SFTPClient.from_transport`
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> pool = default_sftp_pool()
+    >>> with pool.client(sftp_server_info) as sftp_client:
+    ...     sftp_client.listdir("web")
+    """
+
+    def __init__(
+        self,
+        connector: Callable[[SftpServerInfo], paramiko.Transport],
+        max_size: int = 4,
+        idle_timeout: float = 60.0,
+        checkout_timeout_optional: Optional[float] = None,
+        client_factory: Callable[
+            [paramiko.Transport], paramiko.SFTPClient
+        ] = paramiko.SFTPClient.from_transport,
+    ):
+        self.connector: Callable[[SftpServerInfo], paramiko.Transport] = connector
+        self.max_size: int = max(1, max_size)
+        self.idle_timeout: float = idle_timeout
+        self.checkout_timeout_optional: Optional[float] = checkout_timeout_optional
+        self.client_factory: Callable[[paramiko.Transport], paramiko.SFTPClient] = (
+            client_factory
+        )
+        self._condition: threading.Condition = threading.Condition()
+        self._idle: Dict[Tuple[str, int, str], List[_PooledConnection]] = {}
+        self._open: Dict[Tuple[str, int, str], int] = {}
+        self._closed: bool = False
+        self._stats: Dict[str, int] = dict.fromkeys(
+            ("connects", "reuses", "discards", "waits"), 0
+        )
+
+    @staticmethod
+    def key_of(sftp_server_info: SftpServerInfo) -> Tuple[str, int, str]:
+        return (
+            sftp_server_info.host_name,
+            sftp_server_info.host_port,
+            sftp_server_info.username,
+        )
+
+    def _take_expired(self, now: float) -> List[_PooledConnection]:
+        expired: List[_PooledConnection] = []
+        for key, idle in self._idle.items():
+            while idle and now - idle[0].released_at > self.idle_timeout:
+                expired.append(idle.pop(0))
+                self._open[key] -= 1
+        if expired:
+            self._condition.notify_all()
+        return expired
+
+    def checkout(self, sftp_server_info: SftpServerInfo) -> _PooledConnection:
+        """
+        Take an idle healthy connection, or open one if there are less than `max_size`.
+
+        Return it with `checkin`, or use `client` which does both.
+        """
+        return self._checkout(sftp_server_info, True)  # type: ignore
+
+    def try_checkout(
+        self, sftp_server_info: SftpServerInfo
+    ) -> Optional[_PooledConnection]:
+        """
+        Like `checkout`, but return None instead of waiting when `max_size` connections
+        are in use. Use it for connections beyond the first one held at once.
+        """
+        return self._checkout(sftp_server_info, False)
+
+    def _checkout(
+        self, sftp_server_info: SftpServerInfo, wait: bool
+    ) -> Optional[_PooledConnection]:
+        key: Tuple[str, int, str] = SftpPool.key_of(sftp_server_info)
+        deadline_optional: Optional[float] = (
+            time.monotonic() + self.checkout_timeout_optional
+            if self.checkout_timeout_optional is not None
+            else None
+        )
+        waited: bool = False
+        while True:
+            with self._condition:
+                stale: List[_PooledConnection] = self._take_expired(time.monotonic())
+                connection_optional: Optional[_PooledConnection] = None
+                reserved: bool = False
+                while connection_optional is None and not reserved:
+                    if self._closed:
+                        raise RuntimeError("SftpPool is closed")
+                    idle: List[_PooledConnection] = self._idle.get(key, [])
+                    if idle:
+                        connection_optional = idle.pop()
+                    elif self._open.get(key, 0) < self.max_size:
+                        self._open[key] = self._open.get(key, 0) + 1
+                        reserved = True
+                    elif not wait:
+                        break
+                    else:
+                        if not waited:
+                            waited = True
+                            self._stats["waits"] += 1
+                        timeout_optional: Optional[float] = (
+                            deadline_optional - time.monotonic()
+                            if deadline_optional is not None
+                            else None
+                        )
+                        if timeout_optional is not None and timeout_optional <= 0:
+                            raise TimeoutError(
+                                "No free SFTP connection to {}:{}".format(*key[:2])
+                            )
+                        self._condition.wait(timeout_optional)
+            for connection in stale:
+                connection.close()
+            if reserved:
+                break
+            if connection_optional is None:
+                return None
+            if connection_optional.transport.is_active():
+                with self._condition:
+                    self._stats["reuses"] += 1
+                return connection_optional
+            self.discard(connection_optional)
+        # Handshake and authentication outside of the lock.
+        try:
+            transport: paramiko.Transport = self.connector(sftp_server_info)
+            try:
+                sftp_client: paramiko.SFTPClient = self.client_factory(transport)
+            except Exception:
+                transport.close()
+                raise
+        except Exception:
+            with self._condition:
+                self._open[key] -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._stats["connects"] += 1
+        return _PooledConnection(key, transport, sftp_client)
+
+    def checkin(self, connection: _PooledConnection) -> None:
+        """
+        Return a connection taken with `checkout`, closing it if its transport is not
+        active or the pool is closed.
+        """
+        if not connection.transport.is_active():
+            self.discard(connection)
+            return
+        connection.released_at = time.monotonic()
+        with self._condition:
+            closed: bool = self._closed
+            if not closed:
+                stale: List[_PooledConnection] = self._take_expired(
+                    connection.released_at
+                )
+                self._idle.setdefault(connection.key, []).append(connection)
+                self._condition.notify()
+        if closed:
+            self.discard(connection)
+            return
+        for expired in stale:
+            expired.close()
+
+    def discard(self, connection: _PooledConnection) -> None:
+        """Close a connection taken with `checkout` instead of returning it."""
+        connection.close()
+        with self._condition:
+            self._open[connection.key] -= 1
+            self._stats["discards"] += 1
+            self._condition.notify()
+
+    @contextmanager
+    def client(self, sftp_server_info: SftpServerInfo) -> Iterator[paramiko.SFTPClient]:
+        """Check out a connection for the `with` block and yield its `SFTPClient`."""
+        connection: _PooledConnection = self.checkout(sftp_server_info)
+        try:
+            yield connection.sftp_client
+        finally:
+            self.checkin(connection)
+
+    def close(self) -> None:
+        """
+        Close the idle connections. Connections in use are closed on checkin, and
+        later checkouts raise `RuntimeError`.
+        """
+        with self._condition:
+            self._closed = True
+            idle: List[_PooledConnection] = [
+                connection
+                for connections in self._idle.values()
+                for connection in connections
+            ]
+            for key, connections in self._idle.items():
+                self._open[key] -= len(connections)
+            self._idle = {}
+            self._condition.notify_all()
+        for connection in idle:
+            connection.close()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters `connects`, `reuses`, `discards` and `waits`, and gauges `idle` and `in_use`.
+        """
+        with self._condition:
+            expired: List[_PooledConnection] = self._take_expired(time.monotonic())
+            stats: Dict[str, int] = dict(self._stats)
+            stats["idle"] = sum(len(connections) for connections in self._idle.values())
+            stats["in_use"] = sum(self._open.values()) - stats["idle"]
+        for connection in expired:
+            connection.close()
+        return stats
+
+
+_default_pool_lock: threading.Lock = threading.Lock()
+_default_pool: Optional[SftpPool] = None
+
+
+def default_sftp_pool() -> SftpPool:
+    """
+    Pool used by `upload_file` and `upload_files`, created on first use.
 
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SftpPool(__connect, client_factory=__get_sftp_client)
+            atexit.register(_default_pool.close)
+        return _default_pool
+
+
+def set_default_sftp_pool(pool: SftpPool) -> None:
+    """
+    Replace the pool used by `upload_file` and `upload_files`, e.g. to change its sizes.
 
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+    global _default_pool
+    with _default_pool_lock:
+        _default_pool = pool
+
+
+# Streams the file through one reusable buffer with pipelined writes,
+# so memory stays at `block_size` whatever the file size. Returns the bytes sent.
 def __upload(
-    sftp_client: paramiko.SFTPClient, filename: str, local_path: str, remote_path: str
-):
-    with open(os.path.join(local_path, filename), "rb") as f:
-        data = f.read()
-    sftp_client.open(os.path.join(remote_path, filename), "wb").write(data)
+    sftp_client: paramiko.SFTPClient,
+    filename: str,
+    local_path: str,
+    remote_path: str,
+    block_size: int = 1 << 18,
+) -> int:
+    with open(os.path.join(local_path, filename), "rb") as f, sftp_client.open(
+        os.path.join(remote_path, filename), "wb", 0
+    ) as remote_file:
+        return _send(f, remote_file, block_size)
+
+
+def _send(f: Any, remote_file: paramiko.SFTPFile, block_size: int) -> int:
+    buffer: bytearray = bytearray(block_size)
+    view: memoryview = memoryview(buffer)
+    sent: int = 0
+    remote_file.set_pipelined(True)
+    while True:
+        size: int = f.readinto(buffer)
+        if not size:
+            break
+        remote_file.write(view[:size])
+        sent += size
+    return sent
 
 
 def upload_file(
@@ -95,16 +527,18 @@ def upload_file(
     >>> upload_file(sftp_server_info, "014_01_16_linear.png", "..", os.path.join("web", "images"))
     """
     try:
-        t = __connect(sftp_server_info)
-        sftp_client = __get_sftp_client(t)
-        __upload(sftp_client, filename, local_path, remote_path)  # type: ignore
-        __disconnect(t)
+        with default_sftp_pool().client(sftp_server_info) as sftp_client:
+            __upload(  # type: ignore
+                sftp_client,
+                filename,
+                local_path,
+                remote_path,
+                sftp_server_info.block_size,
+            )
     except Exception as e:
-        try:
-            __disconnect(t)  # type: ignore
-        except:
-            pass
         return "*** Caught exception: %s: %s" % (e.__class__, e)
+    finally:
+        _invalidate(sftp_server_info, os.path.join(remote_path, filename))
 
 
 def upload_files(
@@ -144,14 +578,1300 @@ def upload_files(
     >>> upload_files(sftp_server_info, ["014_01_16_linear.png"], "..", os.path.join("web", "images"))
     """
     try:
-        t = __connect(sftp_server_info)
-        sftp_client = __get_sftp_client(t)
-        for filename in filenames:
-            __upload(sftp_client, filename, local_path, remote_path)  # type: ignore
-        __disconnect(t)
+        with default_sftp_pool().client(sftp_server_info) as sftp_client:
+            for filename in filenames:
+                __upload(  # type: ignore
+                    sftp_client,
+                    filename,
+                    local_path,
+                    remote_path,
+                    sftp_server_info.block_size,
+                )
     except Exception as e:
-        try:
-            __disconnect(t)  # type: ignore
-        except:
-            pass
         return "*** Caught exception: %s: %s" % (e.__class__, e)
+    finally:
+        for filename in filenames:
+            _invalidate(sftp_server_info, os.path.join(remote_path, filename))
+
+
+class TransferReport:
+    """
+    Outcome of parallel uploads and downloads, e.g. `upload_files_parallel`.
+
+    Attributes
+    ----------
+    results : Dict[str, Either[int, Exception]]
+        For each file name, `Right` of the bytes transferred or `Left` of the error.
+    total_bytes : int
+        Bytes of the files transferred successfully.
+    elapsed : float
+        Seconds from the first connection to the last file.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+
+    def __init__(
+        self,
+        results: Dict[str, Either[int, Exception]],
+        total_bytes: int,
+        elapsed: float,
+    ):
+        self.results: Dict[str, Either[int, Exception]] = results
+        self.total_bytes: int = total_bytes
+        self.elapsed: float = elapsed
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second."""
+        return self.total_bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def failed(self) -> List[str]:
+        return [
+            name for name, result in self.results.items() if result.left is not None
+        ]
+
+    def __repr__(self) -> str:
+        return "TransferReport({} files, {} failed, {} bytes, {:.3f}s)".format(
+            len(self.results), len(self.failed), self.total_bytes, self.elapsed
+        )
+
+
+# Checks `transports` connections out of the default pool and opens `channels` SFTP
+# sessions across them, the pooled clients first. The error is returned only if no
+# session could be opened, otherwise fewer sessions are used.
+def _open_channels(
+    sftp_server_info: SftpServerInfo, channels: int, transports: int
+) -> Tuple[List[_PooledConnection], List[paramiko.SFTPClient], Optional[Exception]]:
+    pool: SftpPool = default_sftp_pool()
+    channels = max(1, channels)
+    transports = max(1, min(transports, channels))
+    connections: List[_PooledConnection] = []
+    clients: List[paramiko.SFTPClient] = []
+    try:
+        # Only the first checkout waits: callers waiting while holding connections
+        # would deadlock each other. Missing transports are made up with more
+        # channels on the ones held.
+        connections.append(pool.checkout(sftp_server_info))
+        clients.append(connections[-1].sftp_client)
+        for _ in range(1, transports):
+            connection_optional: Optional[_PooledConnection] = pool.try_checkout(
+                sftp_server_info
+            )
+            if connection_optional is None:
+                break
+            connections.append(connection_optional)
+            clients.append(connection_optional.sftp_client)
+        for index in range(len(connections), channels):
+            transport: paramiko.Transport = connections[
+                index % len(connections)
+            ].transport
+            clients.append(pool.client_factory(transport))
+    except Exception as err:
+        if not connections:
+            return [], [], err
+    return connections, clients, None
+
+
+def _close_channels(
+    connections: List[_PooledConnection], clients: List[paramiko.SFTPClient]
+) -> None:
+    for client in clients[len(connections) :]:
+        client.close()
+    pool: SftpPool = default_sftp_pool()
+    for connection in connections:
+        pool.checkin(connection)
+
+
+class _Workers:
+    """
+    One thread per SFTP session, calling `transfer(sftp_client, task)` for the queued tasks
+    in queue order. Results are keyed by the name given with each task.
+    """
+
+    def __init__(
+        self,
+        clients: List[paramiko.SFTPClient],
+        transfer: Callable[[paramiko.SFTPClient, Any], int],
+    ):
+        self.transfer: Callable[[paramiko.SFTPClient, Any], int] = transfer
+        self.tasks: "queue.Queue[Optional[Tuple[str, Any]]]" = queue.Queue()
+        self.lock: threading.Lock = threading.Lock()
+        self.results: Dict[str, Either[int, Exception]] = {}
+        self.started: bool = False
+        self.threads: List[threading.Thread] = [
+            threading.Thread(
+                target=self._work, args=(client,), name="common_py.sftp.transfer"
+            )
+            for client in clients
+        ]
+
+    def _work(self, sftp_client: paramiko.SFTPClient) -> None:
+        while True:
+            item: Optional[Tuple[str, Any]] = self.tasks.get()
+            if item is None:
+                return
+            name, task = item
+            try:
+                result: Either[int, Exception] = Right(self.transfer(sftp_client, task))
+            except Exception as err:
+                result = Left(err)
+            self.set(name, result)
+
+    def put(self, name: str, task: Any) -> None:
+        self.tasks.put((name, task))
+
+    def set(self, name: str, result: Either[int, Exception]) -> None:
+        with self.lock:
+            self.results[name] = result
+
+    def start(self) -> None:
+        if not self.started:
+            self.started = True
+            for thread in self.threads:
+                thread.start()
+
+    # Runs the tasks queued so far, then stops the threads.
+    def join(self) -> Dict[str, Either[int, Exception]]:
+        for _ in self.threads:
+            self.tasks.put(None)
+        self.start()
+        for thread in self.threads:
+            thread.join()
+        return self.results
+
+
+# Runs `tasks` of (name, task) in order on up to `channels` sessions.
+def _transfer_all(
+    sftp_server_info: SftpServerInfo,
+    tasks: List[Tuple[str, Any]],
+    transfer: Callable[[paramiko.SFTPClient, Any], int],
+    channels: int,
+    transports: int,
+) -> Dict[str, Either[int, Exception]]:
+    if not tasks:
+        return {}
+    connections, clients, error_optional = _open_channels(
+        sftp_server_info, min(channels, len(tasks)), transports
+    )
+    if error_optional is not None:
+        return {name: Left(error_optional) for name, _ in tasks}
+    workers: _Workers = _Workers(clients, transfer)
+    for name, task in tasks:
+        workers.put(name, task)
+    results: Dict[str, Either[int, Exception]] = workers.join()
+    _close_channels(connections, clients)
+    return results
+
+
+def _report(
+    results: Dict[str, Either[int, Exception]], names: List[str], started_at: float
+) -> TransferReport:
+    total_bytes: int = sum(
+        result.right for result in results.values() if result.left is None
+    )
+    return TransferReport(
+        {name: results[name] for name in names},
+        total_bytes,
+        time.perf_counter() - started_at,
+    )
+
+
+def upload_files_parallel(
+    sftp_server_info: SftpServerInfo,
+    filenames: List[str],
+    local_path: str,
+    remote_path: str,
+    channels: int = 4,
+    transports: int = 1,
+) -> TransferReport:
+    """
+    Upload files over several SFTP channels at once, largest files first.
+
+    Up to `transports` connections are checked out of `default_sftp_pool()`, waiting only
+    for the first one, and `channels` SFTP sessions are spread over them.
+    Each session takes the largest file not sent yet, so the slowest files start first
+    and the channels finish close together.
+    One failed file does not stop the others.
+
+    Parameters
+    ----------
+    sftp_server_info : SftpServerInfo
+        Info for sftp server.
+    filenames : List[str]
+        File names to upload.
+    local_path : str
+        Local path of `filenames`.
+    remote_path : str
+        Remote path of `filenames`.
+    channels : int, optional
+        SFTP sessions sending files concurrently, by default 4
+    transports : int, optional
+        SSH connections carrying the sessions, fewer if the pool has no free ones. by default 1
+
+    Returns
+    -------
+    TransferReport
+        Result of each file and the total throughput.
+        If no connection can be opened, every file has its error.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> report = upload_files_parallel(sftp_server_info, filenames, "..", "web", channels=8)
+    >>> report.failed, report.throughput
+    ([], 52428800.0)
+    """
+    started_at: float = time.perf_counter()
+    results: Dict[str, Either[int, Exception]] = {}
+    sized: List[Tuple[int, str]] = []
+    for filename in filenames:
+        try:
+            sized.append(
+                (os.path.getsize(os.path.join(local_path, filename)), filename)
+            )
+        except OSError as err:
+            results[filename] = Left(err)
+    # Largest first: each session takes the next file of the queue.
+    sized.sort(reverse=True)
+
+    def _transfer(sftp_client: paramiko.SFTPClient, filename: str) -> int:
+        try:
+            return __upload(
+                sftp_client,
+                filename,
+                local_path,
+                remote_path,
+                sftp_server_info.block_size,
+            )
+        finally:
+            _invalidate(sftp_server_info, os.path.join(remote_path, filename))
+
+    results.update(
+        _transfer_all(
+            sftp_server_info,
+            [(filename, filename) for _, filename in sized],
+            _transfer,
+            channels,
+            transports,
+        )
+    )
+    return _report(results, filenames, started_at)
+
+
+class SyncResult:
+    """
+    Outcome of `sync_to_remote`.
+
+    Attributes
+    ----------
+    uploaded : List[str]
+        File names sent because they were new or changed.
+    skipped : List[str]
+        File names already up to date on the remote.
+    failed : Dict[str, Exception]
+        File names which could not be sent, with their error.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+
+    def __init__(
+        self, uploaded: List[str], skipped: List[str], failed: Dict[str, Exception]
+    ):
+        self.uploaded: List[str] = uploaded
+        self.skipped: List[str] = skipped
+        self.failed: Dict[str, Exception] = failed
+
+    def __repr__(self) -> str:
+        return "SyncResult({} uploaded, {} skipped, {} failed)".format(
+            len(self.uploaded), len(self.skipped), len(self.failed)
+        )
+
+
+def _sha256_of(f: Any, block_size: int) -> str:
+    sha256 = hashlib.sha256()
+    for block in iter(lambda: f.read(block_size), b""):
+        sha256.update(block)
+    return sha256.hexdigest()
+
+
+def sync_to_remote(
+    sftp_server_info: SftpServerInfo,
+    local_folder: str,
+    remote_folder: str,
+    hash_check: bool = False,
+    channels: int = 4,
+) -> Either[SyncResult, Exception]:
+    """
+    Upload the files of `local_folder` which are new or changed compared to `remote_folder`.
+
+    The remote folder is listed once. A file is up to date when the remote copy has the
+    same size and modification time (in seconds). Uploaded files get the local
+    modification time, so the next sync skips them.
+    With `hash_check`, files of the same size but another modification time are compared
+    by SHA-256, which reads those remote copies, and only get the local modification
+    time when the contents match.
+    Sub folders are not synced, and `remote_folder` is created if missing.
+
+    Parameters
+    ----------
+    sftp_server_info : SftpServerInfo
+        Info for sftp server.
+    local_folder : str
+        Local folder to publish.
+    remote_folder : str
+        Remote folder to update.
+    hash_check : bool, optional
+        Compare the contents of same-size files whose modification times differ,
+        instead of uploading them. by default False
+    channels : int, optional
+        Concurrent uploads, see `upload_files_parallel`. by default 4
+
+    Returns
+    -------
+    Either[SyncResult, Exception]
+        `Right` of the files uploaded, skipped and failed, or `Left` of the error
+        if the folders can not be listed.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> sync_to_remote(sftp_server_info, "report", os.path.join("web", "report")).right
+    SyncResult(2 uploaded, 118 skipped, 0 failed)
+    """
+    pool: SftpPool = default_sftp_pool()
+    try:
+        local_stats: Dict[str, os.stat_result] = {
+            entry.name: entry.stat()
+            for entry in os.scandir(local_folder)
+            if entry.is_file()
+        }
+        changed: List[str] = []
+        skipped: List[str] = []
+        # Same content with another modification time, only the time is updated.
+        retimed: List[str] = []
+        with pool.client(sftp_server_info) as sftp_client:
+            try:
+                remote_stats: Dict[str, paramiko.SFTPAttributes] = {
+                    attr.filename: attr
+                    for attr in sftp_client.listdir_attr(remote_folder)
+                }
+            except IOError as err:
+                if err.errno != errno.ENOENT:
+                    raise
+                sftp_client.mkdir(remote_folder)
+                _invalidate(sftp_server_info, remote_folder)
+                remote_stats = {}
+            for name in sorted(local_stats):
+                local: os.stat_result = local_stats[name]
+                remote_optional: Optional[paramiko.SFTPAttributes] = remote_stats.get(
+                    name
+                )
+                if remote_optional is None or remote_optional.st_size != local.st_size:
+                    changed.append(name)
+                elif remote_optional.st_mtime == int(local.st_mtime):
+                    skipped.append(name)
+                elif not hash_check:
+                    changed.append(name)
+                else:
+                    with open(os.path.join(local_folder, name), "rb") as f:
+                        local_hash: str = _sha256_of(f, sftp_server_info.block_size)
+                    with sftp_client.open(
+                        os.path.join(remote_folder, name), "rb"
+                    ) as remote_file:
+                        remote_file.prefetch(local.st_size)
+                        remote_hash: str = _sha256_of(
+                            remote_file, sftp_server_info.block_size
+                        )
+                    if local_hash == remote_hash:
+                        skipped.append(name)
+                        retimed.append(name)
+                    else:
+                        changed.append(name)
+    except Exception as err:
+        return Left(err)
+
+    report: TransferReport = upload_files_parallel(
+        sftp_server_info, changed, local_folder, remote_folder, channels=channels
+    )
+    failed: Dict[str, Exception] = {
+        name: result.left
+        for name, result in report.results.items()
+        if result.left is not None
+    }
+    uploaded: List[str] = [name for name in changed if name not in failed]
+    if uploaded or retimed:
+        try:
+            with pool.client(sftp_server_info) as sftp_client:
+                for name in uploaded + retimed:
+                    local = local_stats[name]
+                    sftp_client.utime(
+                        os.path.join(remote_folder, name),
+                        (int(local.st_atime), int(local.st_mtime)),
+                    )
+        except Exception as err:
+            return Left(err)
+        finally:
+            _invalidate(sftp_server_info, remote_folder)
+    return Right(SyncResult(uploaded, skipped, failed))
+
+
+# SHA-256 of the first and last `block_size` bytes before `end`, to compare a local file
+# with its remote copy without reading all of it.
+def _ends_sha256(f: Any, end: int, block_size: int) -> str:
+    blocks: List[Tuple[int, int]] = [(max(0, end - block_size), min(block_size, end))]
+    if end > block_size:
+        blocks.insert(0, (0, min(block_size, end - block_size)))
+    sha256 = hashlib.sha256()
+    if isinstance(f, paramiko.SFTPFile):
+        # One pipelined readv instead of serial 32 KiB reads on the unbuffered handle.
+        for chunk in f.readv(blocks):
+            sha256.update(chunk)
+        return sha256.hexdigest()
+    for offset, length in blocks:
+        f.seek(offset)
+        sha256.update(f.read(length))
+    return sha256.hexdigest()
+
+
+# Errors worth another attempt: lost or refused connections. SFTP errors such as a
+# missing folder or a denied permission fail the same way again.
+def _is_transient(err: Exception) -> bool:
+    if isinstance(err, (paramiko.SSHException, EOFError)):
+        return True
+    return isinstance(err, socket.error) and err.errno not in (
+        errno.ENOENT,
+        errno.EACCES,
+        errno.EPERM,
+    )
+
+
+def upload_file_resumable(
+    sftp_server_info: SftpServerInfo,
+    filename: str,
+    local_path: str,
+    remote_path: str,
+    retries: int = 3,
+    verify: bool = True,
+    backoff: float = 1.0,
+) -> Either[int, Exception]:
+    """
+    Upload a file so that a failed upload continues where it stopped.
+
+    The file is written to `filename + ".part"` in `remote_path`. Each attempt stats the
+    partial file and sends only the bytes after its size. A complete file is renamed to
+    `filename` with `posix_rename`, so the target is either the old or the new file.
+    A partial file larger than the local file, or whose first or last `block_size` bytes
+    differ from the local file, e.g. left by an older version of it, is overwritten from
+    the start.
+
+    Parameters
+    ----------
+    sftp_server_info : SftpServerInfo
+        Info for sftp server.
+    filename : str
+        File name to upload.
+    local_path : str
+        Local path of `filename`.
+    remote_path : str
+        Remote path of `filename`.
+    retries : int, optional
+        Attempts after the first one, on connection errors only. Missing files or folders
+        and denied permissions are returned at once. by default 3
+    verify : bool, optional
+        Compare SHA-256 of the first and last `block_size` bytes of the remote and local
+        files before renaming. On mismatch the partial file is removed and the upload
+        starts again. by default True
+    backoff : float, optional
+        Seconds before the first retry, doubled for each next one. by default 1.0
+
+    Returns
+    -------
+    Either[int, Exception]
+        `Right` of the file size, or `Left` of the error of the last attempt.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> upload_file_resumable(sftp_server_info, "checkpoint.h5", "checkpoints", "models")
+    """
+    local_file_path: str = os.path.join(local_path, filename)
+    remote_file_path: str = os.path.join(remote_path, filename)
+    part_path: str = remote_file_path + ".part"
+    block_size: int = sftp_server_info.block_size
+    try:
+        size: int = os.path.getsize(local_file_path)
+    except OSError as err:
+        return Left(err)
+    error: Exception = IOError("No attempt to upload {}".format(filename))
+    for attempt in range(max(0, retries) + 1):
+        if attempt > 0:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        try:
+            with default_sftp_pool().client(sftp_server_info) as sftp_client:
+                try:
+                    offset: int = sftp_client.stat(part_path).st_size  # type: ignore
+                except IOError as err:
+                    if err.errno != errno.ENOENT:
+                        raise
+                    offset = 0
+                if offset > size:
+                    offset = 0
+                with open(local_file_path, "rb") as f, sftp_client.open(
+                    part_path, "r+b" if offset > 0 else "w+b", 0
+                ) as remote_file:
+                    if offset > 0 and _ends_sha256(
+                        f, offset, block_size
+                    ) != _ends_sha256(remote_file, offset, block_size):
+                        # Not a prefix of the local file, rewritten over its whole size.
+                        offset = 0
+                    f.seek(offset)
+                    remote_file.seek(offset)
+                    _send(f, remote_file, block_size)
+                    verified: bool = not verify or _ends_sha256(
+                        f, size, block_size
+                    ) == _ends_sha256(remote_file, size, block_size)
+                if not verified:
+                    sftp_client.remove(part_path)
+                    raise IOError(
+                        "Uploaded {} does not match the local file".format(part_path)
+                    )
+                sftp_client.posix_rename(part_path, remote_file_path)
+            return Right(size)
+        except Exception as err:
+            error = err
+            if not _is_transient(err):
+                break
+        finally:
+            _invalidate(sftp_server_info, part_path)
+            _invalidate(sftp_server_info, remote_file_path)
+    return Left(error)
+
+
+# mkdir -p of `remote_dir`, returning the directories created. `known` maps the remote
+# directories known to exist to whether they were created here, so each directory is
+# stat'ed at most once across calls, and directories under created ones are not stat'ed.
+def _makedirs(
+    sftp_client: paramiko.SFTPClient, remote_dir: str, known: Dict[str, bool]
+) -> List[str]:
+    missing: List[str] = []
+    path: str = remote_dir
+    while path not in ("", ".", "/") and path not in known:
+        parent: str = os.path.dirname(path)
+        if not known.get(parent, False):
+            try:
+                sftp_client.stat(path)
+                known[path] = False
+                break
+            except IOError as err:
+                if err.errno != errno.ENOENT:
+                    raise
+        missing.append(path)
+        path = parent
+    for path in reversed(missing):
+        sftp_client.mkdir(path)
+        known[path] = True
+    return missing
+
+
+def upload_folder(
+    sftp_server_info: SftpServerInfo,
+    local_root: str,
+    remote_root: str,
+    channels: int = 4,
+    transports: int = 1,
+) -> TransferReport:
+    """
+    Upload the folder tree `local_root` to `remote_root`, creating missing remote folders.
+
+    One SFTP session walks the local tree and creates the remote folders like `mkdir -p`,
+    remembering the ones which exist so each is stat'ed at most once, and folders under
+    newly created ones are not stat'ed at all.
+    The files of a folder start uploading on the other sessions as soon as the folder is
+    ready, while the walk continues.
+
+    Parameters
+    ----------
+    sftp_server_info : SftpServerInfo
+        Info for sftp server.
+    local_root : str
+        Local folder to upload.
+    remote_root : str
+        Remote folder receiving the content of `local_root`.
+    channels : int, optional
+        SFTP sessions sending files concurrently, by default 4
+    transports : int, optional
+        SSH connections carrying the sessions, fewer if the pool has no free ones. by default 1
+
+    Returns
+    -------
+    TransferReport
+        Results keyed by the path of each file relative to `local_root`, in walk order.
+        Files of a folder which can not be created get its error.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> upload_folder(sftp_server_info, "report", os.path.join("web", "report")).failed
+    []
+    """
+    started_at: float = time.perf_counter()
+    order: List[str] = []
+
+    def _transfer(sftp_client: paramiko.SFTPClient, task: Tuple[str, str, str]) -> int:
+        local_dir, remote_dir, filename = task
+        try:
+            return __upload(
+                sftp_client,
+                filename,
+                local_dir,
+                remote_dir,
+                sftp_server_info.block_size,
+            )
+        finally:
+            _invalidate(sftp_server_info, os.path.join(remote_dir, filename))
+
+    # One more session walks the tree, unless only one can be opened.
+    connections, clients, error_optional = _open_channels(
+        sftp_server_info, max(1, channels) + 1, transports
+    )
+    walker_optional: Optional[paramiko.SFTPClient] = (
+        clients[-1] if len(clients) > 1 else None
+    )
+    workers: _Workers = _Workers(
+        clients[:-1] if walker_optional is not None else clients, _transfer
+    )
+    if walker_optional is not None:
+        workers.start()
+
+    known: Dict[str, bool] = {}
+    for dirpath, dirnames, filenames in os.walk(local_root):
+        dirnames.sort()
+        relative_dir: str = os.path.relpath(dirpath, local_root)
+        remote_dir: str = (
+            remote_root
+            if relative_dir == os.curdir
+            else os.path.join(remote_root, relative_dir)
+        )
+        dir_error_optional: Optional[Exception] = error_optional
+        if dir_error_optional is None:
+            try:
+                for created in _makedirs(
+                    walker_optional or clients[0], remote_dir, known
+                ):
+                    _invalidate(sftp_server_info, created)
+            except Exception as err:
+                dir_error_optional = err
+        for filename in sorted(filenames):
+            relative: str = os.path.normpath(os.path.join(relative_dir, filename))
+            order.append(relative)
+            if dir_error_optional is not None:
+                workers.set(relative, Left(dir_error_optional))
+            else:
+                workers.put(relative, (dirpath, remote_dir, filename))
+
+    results: Dict[str, Either[int, Exception]] = workers.join()
+    _close_channels(connections, clients)
+    return _report(results, order, started_at)
+
+
+# Bytes requested ahead of the local writes, for each file or range being downloaded.
+_READ_AHEAD: int = 1 << 23
+
+
+def _preallocate(local_file_path: str, size: int) -> None:
+    with open(local_file_path, "wb") as f:
+        f.truncate(size)
+
+
+# Downloads bytes `start` to `end` of the remote file into the preallocated local file
+# at the same offsets. `readv` pipelines the reads `_READ_AHEAD` bytes at a time,
+# so memory stays bounded whatever the file size.
+def _receive(
+    sftp_client: paramiko.SFTPClient,
+    remote_file_path: str,
+    local_file_path: str,
+    start: int,
+    end: int,
+    block_size: int,
+) -> int:
+    with sftp_client.open(remote_file_path, "rb") as remote_file, open(
+        local_file_path, "r+b"
+    ) as f:
+        f.seek(start)
+        offset: int = start
+        while offset < end:
+            window_end: int = min(end, offset + max(block_size, _READ_AHEAD))
+            chunks: List[Tuple[int, int]] = [
+                (chunk_offset, min(block_size, window_end - chunk_offset))
+                for chunk_offset in range(offset, window_end, block_size)
+            ]
+            for (_, length), data in zip(chunks, remote_file.readv(chunks)):
+                if len(data) != length:
+                    raise IOError(
+                        "{} is shorter than {} bytes".format(remote_file_path, end)
+                    )
+                f.write(data)
+            offset = window_end
+    return end - start
+
+
+def download_file(
+    sftp_server_info: SftpServerInfo,
+    filename: str,
+    remote_path: str,
+    local_path: str,
+    ranges: int = 4,
+    range_threshold: int = 1 << 26,
+    transports: int = 1,
+) -> Either[int, Exception]:
+    """
+    Download file via sftp connection.
+
+    The local file is allocated at its final size and filled as the reads complete.
+    Files of at least `range_threshold` bytes are split into `ranges` parts downloaded
+    concurrently on their own SFTP sessions, each written at its offset.
+    Reads are pipelined ahead of the writes, and memory does not grow with the file size.
+
+    Parameters
+    ----------
+    sftp_server_info : SftpServerInfo
+        Info for sftp server.
+    filename : str
+        File name to download.
+    remote_path : str
+        Remote path of `filename`.
+    local_path : str
+        Local path receiving `filename`.
+    ranges : int, optional
+        Parts downloaded concurrently for large files, by default 4
+    range_threshold : int, optional
+        Size from which a file is split, by default 64 MiB
+    transports : int, optional
+        SSH connections carrying the parts, fewer if the pool has no free ones. by default 1
+
+    Returns
+    -------
+    Either[int, Exception]
+        `Right` of the file size, or `Left` of the first error.
+        The local file is incomplete after an error.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> download_file(sftp_server_info, "imagenet.tar", "datasets", "data").right
+    147897477120
+    """
+    remote_file_path: str = os.path.join(remote_path, filename)
+    local_file_path: str = os.path.join(local_path, filename)
+    block_size: int = sftp_server_info.block_size
+    try:
+        with default_sftp_pool().client(sftp_server_info) as sftp_client:
+            size: int = sftp_client.stat(remote_file_path).st_size  # type: ignore
+            _preallocate(local_file_path, size)
+            if ranges <= 1 or size < range_threshold:
+                return Right(
+                    _receive(
+                        sftp_client,
+                        remote_file_path,
+                        local_file_path,
+                        0,
+                        size,
+                        block_size,
+                    )
+                )
+        # Parts aligned to `block_size`.
+        step: int = -(-size // ranges)
+        step = -(-step // block_size) * block_size
+
+        def _transfer(sftp_client: paramiko.SFTPClient, part: Tuple[int, int]) -> int:
+            return _receive(
+                sftp_client, remote_file_path, local_file_path, *part, block_size
+            )
+
+        parts: List[Tuple[str, Tuple[int, int]]] = [
+            (str(start), (start, min(size, start + step)))
+            for start in range(0, size, step)
+        ]
+        results: Dict[str, Either[int, Exception]] = _transfer_all(
+            sftp_server_info, parts, _transfer, len(parts), transports
+        )
+        for name, _ in parts:
+            if results[name].left is not None:
+                return Left(results[name].left)
+        return Right(size)
+    except Exception as err:
+        return Left(err)
+
+
+def download_files(
+    sftp_server_info: SftpServerInfo,
+    filenames: List[str],
+    remote_path: str,
+    local_path: str,
+    channels: int = 4,
+    transports: int = 1,
+) -> TransferReport:
+    """
+    Download files over several SFTP channels at once, largest files first.
+
+    `remote_path` is listed once to find the sizes. Each file is streamed on one session,
+    without splitting it into ranges like `download_file`.
+
+    Parameters
+    ----------
+    sftp_server_info : SftpServerInfo
+        Info for sftp server.
+    filenames : List[str]
+        File names to download.
+    remote_path : str
+        Remote path of `filenames`.
+    local_path : str
+        Local path receiving `filenames`.
+    channels : int, optional
+        SFTP sessions receiving files concurrently, by default 4
+    transports : int, optional
+        SSH connections carrying the sessions, fewer if the pool has no free ones. by default 1
+
+    Returns
+    -------
+    TransferReport
+        Result of each file and the total throughput.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> download_files(sftp_server_info, ["train.npz", "test.npz"], "datasets", "data").failed
+    []
+    """
+    started_at: float = time.perf_counter()
+    try:
+        with default_sftp_pool().client(sftp_server_info) as sftp_client:
+            sizes: Dict[str, int] = {
+                attr.filename: attr.st_size  # type: ignore
+                for attr in sftp_client.listdir_attr(remote_path)
+            }
+    except Exception as err:
+        return _report({name: Left(err) for name in filenames}, filenames, started_at)
+    results: Dict[str, Either[int, Exception]] = {}
+    sized: List[Tuple[int, str]] = []
+    for filename in filenames:
+        if filename in sizes:
+            sized.append((sizes[filename], filename))
+        else:
+            results[filename] = Left(
+                FileNotFoundError(
+                    errno.ENOENT, "No such file", os.path.join(remote_path, filename)
+                )
+            )
+    sized.sort(reverse=True)
+
+    def _transfer(sftp_client: paramiko.SFTPClient, task: Tuple[int, str]) -> int:
+        size, filename = task
+        local_file_path: str = os.path.join(local_path, filename)
+        _preallocate(local_file_path, size)
+        return _receive(
+            sftp_client,
+            os.path.join(remote_path, filename),
+            local_file_path,
+            0,
+            size,
+            sftp_server_info.block_size,
+        )
+
+    results.update(
+        _transfer_all(
+            sftp_server_info,
+            [(filename, (size, filename)) for size, filename in sized],
+            _transfer,
+            channels,
+            transports,
+        )
+    )
+    return _report(results, filenames, started_at)
+
+
+def download_folder(
+    sftp_server_info: SftpServerInfo,
+    remote_root: str,
+    local_root: str,
+    channels: int = 4,
+    transports: int = 1,
+) -> TransferReport:
+    """
+    Download the remote folder tree `remote_root` to `local_root`.
+
+    One SFTP session lists the remote folders breadth first and creates the local ones.
+    The files of a folder start downloading on the other sessions as soon as it is listed.
+
+    Parameters
+    ----------
+    sftp_server_info : SftpServerInfo
+        Info for sftp server.
+    remote_root : str
+        Remote folder to download.
+    local_root : str
+        Local folder receiving the content of `remote_root`.
+    channels : int, optional
+        SFTP sessions receiving files concurrently, by default 4
+    transports : int, optional
+        SSH connections carrying the sessions, fewer if the pool has no free ones. by default 1
+
+    Returns
+    -------
+    TransferReport
+        Results keyed by the path of each file relative to `remote_root`.
+        A folder which can not be listed has its error under its relative path,
+        `"."` for `remote_root`.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> download_folder(sftp_server_info, "checkpoints/run_12", "checkpoints").failed
+    []
+    """
+    started_at: float = time.perf_counter()
+    order: List[str] = []
+
+    def _transfer(sftp_client: paramiko.SFTPClient, task: Tuple[str, str, int]) -> int:
+        remote_file_path, local_file_path, size = task
+        _preallocate(local_file_path, size)
+        return _receive(
+            sftp_client,
+            remote_file_path,
+            local_file_path,
+            0,
+            size,
+            sftp_server_info.block_size,
+        )
+
+    # One more session lists the tree, unless only one can be opened.
+    connections, clients, error_optional = _open_channels(
+        sftp_server_info, max(1, channels) + 1, transports
+    )
+    if error_optional is not None:
+        return _report({os.curdir: Left(error_optional)}, [os.curdir], started_at)
+    walker: paramiko.SFTPClient = clients[-1]
+    workers: _Workers = _Workers(
+        clients[:-1] if len(clients) > 1 else clients, _transfer
+    )
+    if len(clients) > 1:
+        workers.start()
+
+    folders: Deque[str] = deque([os.curdir])
+    while folders:
+        relative_dir: str = folders.popleft()
+        remote_dir: str = os.path.normpath(os.path.join(remote_root, relative_dir))
+        local_dir: str = os.path.normpath(os.path.join(local_root, relative_dir))
+        try:
+            os.makedirs(local_dir, exist_ok=True)
+            attrs: List[paramiko.SFTPAttributes] = sorted(
+                walker.listdir_attr(remote_dir), key=lambda attr: attr.filename
+            )
+        except Exception as err:
+            order.append(relative_dir)
+            workers.set(relative_dir, Left(err))
+            continue
+        for attr in attrs:
+            relative: str = os.path.normpath(os.path.join(relative_dir, attr.filename))
+            if stat.S_ISDIR(attr.st_mode or 0):
+                folders.append(relative)
+            else:
+                order.append(relative)
+                workers.put(
+                    relative,
+                    (
+                        os.path.join(remote_dir, attr.filename),
+                        os.path.join(local_dir, attr.filename),
+                        attr.st_size,
+                    ),
+                )
+
+    results: Dict[str, Either[int, Exception]] = workers.join()
+    _close_channels(connections, clients)
+    return _report(results, order, started_at)
+
+
+class RemoteMetadataCache:
+    """
+    Snapshots of remote folder listings, reused for `ttl` seconds.
+
+    `exists`, `stat` and `listdir` are answered from the listing of the folder,
+    fetched with one `listdir_attr` when missing or older than `ttl`.
+    Missing folders are remembered too.
+    Uploads, renames and removals done through this module drop the snapshots they
+    change, in every cache. Changes made by others are seen after `ttl`.
+
+    Parameters
+    ----------
+    ttl : float, optional
+        Seconds a listing is reused, by default 30.0
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> cache = RemoteMetadataCache(ttl=60)
+    >>> [name for name in filenames if not cache.exists(sftp_server_info, os.path.join("web", name)).right]
+    """
+
+    def __init__(self, ttl: float = 30.0):
+        self.ttl: float = ttl
+        self._lock: threading.Lock = threading.Lock()
+        # (server key, folder) -> (fetched at, attributes by name or None if missing)
+        self._snapshots: Dict[
+            Tuple[Tuple[str, int, str], str],
+            Tuple[float, Optional[Dict[str, paramiko.SFTPAttributes]]],
+        ] = {}
+        # Incremented by each invalidation, so a listing fetched meanwhile is not kept.
+        self._generation: int = 0
+        self._stats: Dict[str, int] = dict.fromkeys(
+            ("hits", "misses", "invalidations"), 0
+        )
+        _caches.add(self)
+
+    def _listing(
+        self, sftp_server_info: SftpServerInfo, remote_dir: str
+    ) -> Optional[Dict[str, paramiko.SFTPAttributes]]:
+        key: Tuple[Tuple[str, int, str], str] = (
+            SftpPool.key_of(sftp_server_info),
+            os.path.normpath(remote_dir),
+        )
+        with self._lock:
+            snapshot_optional = self._snapshots.get(key)
+            if (
+                snapshot_optional is not None
+                and time.monotonic() - snapshot_optional[0] < self.ttl
+            ):
+                self._stats["hits"] += 1
+                return snapshot_optional[1]
+            self._stats["misses"] += 1
+            generation: int = self._generation
+        fetched_at: float = time.monotonic()
+        with default_sftp_pool().client(sftp_server_info) as sftp_client:
+            try:
+                listing: Optional[Dict[str, paramiko.SFTPAttributes]] = {
+                    attr.filename: attr for attr in sftp_client.listdir_attr(key[1])
+                }
+            except IOError as err:
+                if err.errno != errno.ENOENT:
+                    raise
+                listing = None
+        with self._lock:
+            if self._generation == generation:
+                self._snapshots[key] = (fetched_at, listing)
+        return listing
+
+    def listdir_attr(
+        self, sftp_server_info: SftpServerInfo, remote_dir: str
+    ) -> Either[List[paramiko.SFTPAttributes], Exception]:
+        """`Right` of the attributes of the entries of `remote_dir`, or `Left` of the error."""
+        try:
+            listing = self._listing(sftp_server_info, remote_dir)
+        except Exception as err:
+            return Left(err)
+        if listing is None:
+            return Left(
+                FileNotFoundError(errno.ENOENT, "No such remote folder", remote_dir)
+            )
+        return Right(list(listing.values()))
+
+    def listdir(
+        self, sftp_server_info: SftpServerInfo, remote_dir: str
+    ) -> Either[List[str], Exception]:
+        """`Right` of the entry names of `remote_dir`, or `Left` of the error."""
+        return self.listdir_attr(sftp_server_info, remote_dir).map(
+            lambda attrs: [attr.filename for attr in attrs]
+        )
+
+    def stat(
+        self, sftp_server_info: SftpServerInfo, remote_path: str
+    ) -> Either[paramiko.SFTPAttributes, Exception]:
+        """
+        `Right` of the attributes of `remote_path` from the listing of its folder,
+        or `Left` of the error, `FileNotFoundError` if it does not exist.
+        """
+        path: str = os.path.normpath(remote_path)
+        name: str = os.path.basename(path)
+        if name in ("", os.curdir, os.pardir):
+            # No parent listing holds it.
+            try:
+                with default_sftp_pool().client(sftp_server_info) as sftp_client:
+                    return Right(sftp_client.stat(path))
+            except Exception as err:
+                return Left(err)
+        try:
+            listing = self._listing(
+                sftp_server_info, os.path.dirname(path) or os.curdir
+            )
+        except Exception as err:
+            return Left(err)
+        if listing is None or name not in listing:
+            return Left(FileNotFoundError(errno.ENOENT, "No such remote file", path))
+        return Right(listing[name])
+
+    def exists(
+        self, sftp_server_info: SftpServerInfo, remote_path: str
+    ) -> Either[bool, Exception]:
+        """`Right` of whether `remote_path` exists, or `Left` of the error."""
+        result: Either[paramiko.SFTPAttributes, Exception] = self.stat(
+            sftp_server_info, remote_path
+        )
+        if isinstance(result.left, FileNotFoundError):
+            return Right(False)
+        return result.map(lambda _: True)
+
+    def invalidate(self, sftp_server_info: SftpServerInfo, remote_path: str) -> None:
+        """Drop the listings of `remote_path` and of its folder."""
+        server: Tuple[str, int, str] = SftpPool.key_of(sftp_server_info)
+        path: str = os.path.normpath(remote_path)
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidations"] += 1
+            self._snapshots.pop((server, path), None)
+            self._snapshots.pop((server, os.path.dirname(path) or os.curdir), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._snapshots = {}
+
+    def stats(self) -> Dict[str, int]:
+        """Counters `hits`, `misses` and `invalidations`, and the number of `listings`."""
+        with self._lock:
+            stats: Dict[str, int] = dict(self._stats)
+            stats["listings"] = len(self._snapshots)
+        return stats
+
+
+_caches: "weakref.WeakSet[RemoteMetadataCache]" = weakref.WeakSet()
+_default_cache: RemoteMetadataCache = RemoteMetadataCache()
+
+
+# Called after changing `remote_path`, so no cache answers from an older listing.
+def _invalidate(sftp_server_info: SftpServerInfo, remote_path: str) -> None:
+    for cache in list(_caches):
+        cache.invalidate(sftp_server_info, remote_path)
+
+
+def remote_exists(
+    sftp_server_info: SftpServerInfo, remote_path: str
+) -> Either[bool, Exception]:
+    """
+    Whether `remote_path` exists, answered from the default `RemoteMetadataCache`.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+
+    Examples
+    --------
+    >>> remote_exists(sftp_server_info, os.path.join("web", "images", "014_01_16_linear.png")).right
+    True
+    """
+    return _default_cache.exists(sftp_server_info, remote_path)
+
+
+def remote_stat(
+    sftp_server_info: SftpServerInfo, remote_path: str
+) -> Either[paramiko.SFTPAttributes, Exception]:
+    """
+    Attributes of `remote_path`, answered from the default `RemoteMetadataCache`.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+    return _default_cache.stat(sftp_server_info, remote_path)
+
+
+def remote_listdir(
+    sftp_server_info: SftpServerInfo, remote_dir: str
+) -> Either[List[str], Exception]:
+    """
+    Entry names of `remote_dir`, answered from the default `RemoteMetadataCache`.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+    return _default_cache.listdir(sftp_server_info, remote_dir)
+
+
+def remote_remove(
+    sftp_server_info: SftpServerInfo, remote_path: str
+) -> Either[str, Exception]:
+    """
+    Remove the remote file `remote_path`, dropping the cached listings it changes.
+
+    Returns
+    -------
+    Either[str, Exception]
+        `Right` of `remote_path`, or `Left` of the error.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+    try:
+        with default_sftp_pool().client(sftp_server_info) as sftp_client:
+            sftp_client.remove(remote_path)
+        return Right(remote_path)
+    except Exception as err:
+        return Left(err)
+    finally:
+        _invalidate(sftp_server_info, remote_path)
+
+
+def remote_rename(
+    sftp_server_info: SftpServerInfo, remote_path: str, new_remote_path: str
+) -> Either[str, Exception]:
+    """
+    Rename `remote_path` to `new_remote_path`, replacing it if it exists,
+    and drop the cached listings it changes.
+
+    Returns
+    -------
+    Either[str, Exception]
+        `Right` of `new_remote_path`, or `Left` of the error.
+
+    Notes
+    -----
+    .. versionadded:: 0.1.5
+    """
+    try:
+        with default_sftp_pool().client(sftp_server_info) as sftp_client:
+            sftp_client.posix_rename(remote_path, new_remote_path)
+        return Right(new_remote_path)
+    except Exception as err:
+        return Left(err)
+    finally:
+        _invalidate(sftp_server_info, remote_path)
+        _invalidate(sftp_server_info, new_remote_path)
@@ -63,7 +63,7 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/tenkeyless/common_py",
-    packages=setuptools.find_packages(exclude=["tests*"]),
+    packages=setuptools.find_packages(exclude=["tests*", "benchmarks*"]),
     install_requires=install_requires,
     setup_requires=install_requires,
     license="MIT",
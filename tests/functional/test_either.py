@@ -1,6 +1,16 @@
+from typing import Iterator, List
 import unittest
 
-from common_py.functional.either import Either, Right
+from common_py.functional.either import (
+    Either,
+    Left,
+    Right,
+    sequences,
+    sequences_all,
+    traverse,
+    traverse_all,
+    traverse_iter,
+)
 
 
 class TestEither(unittest.TestCase):
@@ -10,3 +20,54 @@ class TestEither(unittest.TestCase):
         success.map(lambda el: el + 1).fold(
             lambda r: self.assertEqual(r, 2), lambda e: None
         )
+
+    def test_either_slots(self):
+        self.assertFalse(hasattr(Right(1), "__dict__"))
+        self.assertFalse(hasattr(Left(Exception()), "__dict__"))
+        failure: Either[int, Exception] = Left(ValueError())
+        self.assertIs(failure.map(lambda el: el + 1), failure)
+
+
+def _positive(x: int) -> Either[int, Exception]:
+    return Right(x) if x > 0 else Left(ValueError(x))
+
+
+class TestTraverse(unittest.TestCase):
+    def test_traverse_short_circuit(self):
+        calls: List[int] = []
+
+        def f(x: int) -> Either[int, Exception]:
+            calls.append(x)
+            return _positive(x)
+
+        failure: Either[List[int], Exception] = traverse([1, 2, -3, 4, -5], f)
+        self.assertEqual(calls, [1, 2, -3])
+        self.assertEqual(failure.right, [1, 2])
+        self.assertEqual(failure.left.args, (-3,))
+        self.assertEqual(traverse(iter([1, 2]), _positive).right, [1, 2])
+        self.assertEqual(sequences([Right(1), Right(None)]).right, [1, None])
+
+    def test_traverse_all(self):
+        failure: Either[List[int], List[Exception]] = traverse_all(
+            [1, -2, 3, -4], _positive
+        )
+        self.assertEqual(failure.right, [1, 3])
+        self.assertEqual([e.args for e in failure.left], [(-2,), (-4,)])
+        self.assertEqual(traverse_all([1], _positive).left, None)
+
+    def test_sequences_all(self):
+        failure: Either[List[int], List[Exception]] = sequences_all(
+            [Right(1), Left(ValueError(2)), Right(None), Left(ValueError(4))]
+        )
+        self.assertEqual(failure.right, [1, None])
+        self.assertEqual([e.args for e in failure.left], [(2,), (4,)])
+        self.assertEqual(sequences_all(iter([Right(1), Right(2)])).right, [1, 2])
+        self.assertIsNone(sequences_all([]).left)
+
+    def test_traverse_iter(self):
+        results: Iterator[Either[int, Exception]] = traverse_iter(
+            (x for x in [1, -2, 3]), _positive
+        )
+        self.assertEqual(next(results).right, 1)
+        self.assertEqual(next(results).left.args, (-2,))
+        self.assertEqual(list(results), [])
@@ -0,0 +1,314 @@
+import asyncio
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+import gc
+import json
+import threading
+import time
+from typing import Any, List
+import unittest
+import weakref
+
+from common_py.functional.either import Either
+from common_py.functional.future import (
+    Future,
+    GatherError,
+    call_later,
+    inline_executor,
+)
+
+
+def wait_result(future: Future, timeout: float = 5) -> Either[Any, Exception]:
+    results: List[Either[Any, Exception]] = []
+    done = threading.Event()
+
+    def _sub(value: Either[Any, Exception]) -> None:
+        results.append(value)
+        done.set()
+
+    future.subscribe(_sub)
+    if not done.wait(timeout):
+        raise AssertionError("Future did not complete in {}s".format(timeout))
+    return results[0]
+
+
+class TestFuture(unittest.TestCase):
+    def test_future_pure_map(self):
+        success: Either[int, Exception] = wait_result(
+            Future.pure(1).map(lambda el: el + 1)
+        )
+        self.assertEqual(success.right, 2)
+
+    def test_future_async_f(self):
+        success = wait_result(
+            Future.async_f(lambda: 1).flat_map(
+                lambda el: Future.async_f(lambda: el + 1)
+            )
+        )
+        self.assertEqual(success.right, 2)
+        failure = wait_result(Future.async_f(lambda: 1 // 0))
+        self.assertTrue(isinstance(failure.left, ZeroDivisionError))
+
+    def test_future_executor(self):
+        thread_names: List[str] = []
+        with ThreadPoolExecutor(2, thread_name_prefix="test_pool") as executor:
+            futures: List[Future] = [
+                Future.async_f(
+                    lambda: thread_names.append(threading.current_thread().name),
+                    executor,
+                )
+                for _ in range(100)
+            ]
+            for future in futures:
+                wait_result(future)
+        self.assertTrue(all(name.startswith("test_pool") for name in thread_names))
+        success = wait_result(Future.async_f(lambda: 3, inline_executor))
+        self.assertEqual(success.right, 3)
+
+    def test_future_traverse(self):
+        success = wait_result(
+            Future.pure(0).traverse([1, 2, 3])(
+                lambda el: Future.async_f(lambda: el * 2)
+            )
+        )
+        self.assertEqual(success.right, [2, 4, 6])
+
+
+class TestFutureGather(unittest.TestCase):
+    def test_gather_success(self):
+        futures: List[Future] = [Future.async_f(lambda i=i: i * 2) for i in range(10)]
+        success = wait_result(Future.gather(futures))
+        self.assertEqual(success.right, [i * 2 for i in range(10)])
+        self.assertEqual(wait_result(Future.gather([])).right, [])
+
+    def test_gather_failure(self):
+        futures: List[Future] = [
+            Future.pure(1),
+            Future.async_f(lambda: 1 // 0),
+            Future.pure(3),
+        ]
+        failure = wait_result(Future.gather(futures))
+        self.assertTrue(isinstance(failure.left, ZeroDivisionError))
+        failure = wait_result(Future.gather(futures, fail_fast=False))
+        self.assertTrue(isinstance(failure.left, GatherError))
+        self.assertEqual(failure.left.results, [1, None, 3])
+        self.assertEqual([index for index, _ in failure.left.errors], [1])
+
+    def test_traverse_par_max_concurrency(self):
+        lock = threading.Lock()
+        running: List[int] = [0, 0]
+
+        def work(el: int) -> int:
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.005)
+            with lock:
+                running[0] -= 1
+            return el
+
+        success = wait_result(
+            Future.traverse_par(
+                range(20),
+                lambda el: Future.async_f(lambda: work(el)),
+                max_concurrency=3,
+            )
+        )
+        self.assertEqual(success.right, list(range(20)))
+        self.assertLessEqual(running[1], 3)
+        many = wait_result(
+            Future.traverse_par(range(10000), Future.pure, max_concurrency=1)
+        )
+        self.assertEqual(len(many.right), 10000)
+
+    def test_traverse_par_fail_fast(self):
+        started: List[int] = []
+
+        def f(el: int) -> Future:
+            started.append(el)
+            return Future.pure(el) if el != 2 else Future.async_f(lambda: 1 // 0)
+
+        failure = wait_result(Future.traverse_par(range(10), f, max_concurrency=1))
+        self.assertTrue(isinstance(failure.left, ZeroDivisionError))
+        self.assertEqual(started, [0, 1, 2])
+
+
+class TestFutureInterop(unittest.TestCase):
+    def test_await_future(self):
+        async def main() -> int:
+            value: int = await Future.async_f(lambda: 1).map(lambda el: el + 1)
+            with self.assertRaises(ZeroDivisionError):
+                await Future.async_f(lambda: 1 // 0)
+            return value
+
+        self.assertEqual(asyncio.run(main()), 2)
+
+    def test_from_asyncio(self):
+        async def double(el: int) -> int:
+            await asyncio.sleep(0.001)
+            return el * 2
+
+        async def main() -> int:
+            return await Future.from_asyncio(double(2)).to_asyncio()
+
+        self.assertEqual(asyncio.run(main()), 4)
+        with self.assertRaises(ValueError):
+            Future.from_asyncio(double(1))
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+        try:
+            success = wait_result(Future.from_asyncio(double(3), loop))
+            self.assertEqual(success.right, 6)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def test_from_concurrent(self):
+        with ThreadPoolExecutor(1) as executor:
+            success = wait_result(Future.from_concurrent(executor.submit(lambda: 5)))
+            failure = wait_result(
+                Future.from_concurrent(executor.submit(lambda: 1 // 0))
+            )
+        self.assertEqual(success.right, 5)
+        self.assertTrue(isinstance(failure.left, ZeroDivisionError))
+
+
+class TestFutureCompletion(unittest.TestCase):
+    def test_result(self):
+        self.assertEqual(Future.async_f(lambda: 1).result(timeout=5).right, 1)
+        pending: Future = Future(lambda cb: None)
+        self.assertTrue(isinstance(pending.result(timeout=0.01).left, TimeoutError))
+        self.assertFalse(pending.done())
+
+    def test_cancel(self):
+        pending: Future = Future(lambda cb: None)
+        self.assertTrue(pending.cancel())
+        self.assertFalse(pending.cancel())
+        self.assertTrue(isinstance(pending.result().left, CancelledError))
+
+        ran: List[int] = []
+        with ThreadPoolExecutor(1) as executor:
+            blocker = threading.Event()
+            executor.submit(blocker.wait)
+            queued: Future = Future.async_f(lambda: ran.append(1), executor)
+            self.assertTrue(queued.cancel())
+            blocker.set()
+        self.assertEqual(ran, [])
+
+    def test_with_timeout(self):
+        stuck = threading.Event()
+        timed_out = Future.async_f(lambda: stuck.wait(5)).with_timeout(0.02)
+        self.assertTrue(isinstance(timed_out.result(timeout=5).left, TimeoutError))
+        stuck.set()
+        success = Future.async_f(lambda: 1).with_timeout(5).result(timeout=5)
+        self.assertEqual(success.right, 1)
+
+    def test_deadline_propagation(self):
+        stuck = threading.Event()
+        chained = (
+            Future.pure(1)
+            .with_timeout(0.02)
+            .flat_map(lambda el: Future.async_f(lambda: stuck.wait(5)))
+            .map(lambda el: el)
+        )
+        self.assertIsNotNone(chained.deadline)
+        self.assertTrue(isinstance(chained.result(timeout=5).left, TimeoutError))
+        stuck.set()
+
+    def test_deadline_released_on_completion(self):
+        stages: List[weakref.ref] = []
+
+        def _step(el: int) -> Future[int]:
+            stage: Future[int] = Future.pure(el + 1)
+            stages.append(weakref.ref(stage))
+            return stage
+
+        chained: Future[int] = Future.pure(0).with_timeout(3600)
+        for _ in range(1000):
+            chained = chained.flat_map(_step)
+        self.assertEqual(chained.result(timeout=5).right, 1000)
+        self.assertIsNotNone(chained.expiry)
+        del chained
+        gc.collect()
+        self.assertEqual(len(stages), 1000)
+        self.assertEqual([stage for stage in stages if stage() is not None], [])
+
+    def test_call_later(self):
+        fired: threading.Event = threading.Event()
+        call_later(0.01, fired.set)
+        self.assertTrue(fired.wait(5))
+        cancelled: List[int] = []
+        call_later(0.01, lambda: cancelled.append(1)).cancel()
+        time.sleep(0.05)
+        self.assertEqual(cancelled, [])
+
+
+def _sum_buffer(buffer: memoryview) -> int:
+    return sum(buffer)
+
+
+class TestFutureProcess(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.executor = ProcessPoolExecutor(2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.executor.shutdown()
+
+    def test_async_process(self):
+        success = Future.async_process(pow, 2, 10, executor=self.executor).result(5)
+        self.assertEqual(success.right, 1024)
+        data = bytearray(range(256)) * 16
+        shared = Future.async_process(
+            _sum_buffer, data, executor=self.executor, shared_memory_threshold=1024
+        ).result(5)
+        self.assertEqual(shared.right, sum(data))
+
+    def test_async_process_not_picklable(self):
+        failure = Future.async_process(lambda: 1, executor=self.executor).result(5)
+        self.assertIsNotNone(failure.left)
+        bad_argument = Future.async_process(
+            _sum_buffer, threading.Lock(), executor=self.executor
+        ).result(5)
+        self.assertIsNotNone(bad_argument.left)
+
+
+class TestFutureTracing(unittest.TestCase):
+    def tearDown(self):
+        Future.disable_tracing()
+
+    def test_trace_stats(self):
+        Future.enable_tracing()
+        gate = threading.Event()
+        blocked: Future = Future.async_f(gate.wait)
+        blocked.subscribe(lambda _: None)
+        blocked.subscribe(lambda _: None)
+        stats = Future.trace_stats()
+        self.assertEqual(stats["futures_in_flight"], 1)
+        self.assertEqual(stats["pending_subscribers"], 2)
+        self.assertEqual(stats["tasks_queued"] + stats["tasks_running"], 1)
+        gate.set()
+        blocked.result(5)
+        self.assertEqual(wait_result(Future.async_f(lambda: 1 + 1)).right, 2)
+
+        stats = Future.trace_stats(spans=True)
+        self.assertEqual(stats["futures_in_flight"], 0)
+        self.assertEqual(stats["pending_subscribers"], 0)
+        self.assertEqual(stats["tasks_completed"], 2)
+        self.assertEqual(stats["fanout"]["2-3"], 1)
+        self.assertEqual(len(stats["spans"]), 2)
+        for span in stats["spans"]:
+            self.assertTrue(span["submit"] <= span["start"] <= span["end"])
+            self.assertTrue(span["ok"])
+        self.assertTrue(json.dumps(stats))
+
+    def test_tracing_off(self):
+        Future.enable_tracing()
+        Future.disable_tracing()
+        future: Future = Future.async_f(lambda: 1)
+        self.assertIsNone(future.tracer)
+        future.result(5)
+        self.assertEqual(Future.trace_stats()["tasks_submitted"], 0)
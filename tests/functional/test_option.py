@@ -1,6 +1,7 @@
+import pickle
 import unittest
 
-from common_py.functional.option import Option, Some
+from common_py.functional.option import Nil, Option, Some, nil
 
 
 class TestOption(unittest.TestCase):
@@ -9,3 +10,14 @@ class TestOption(unittest.TestCase):
         success.fold(lambda s: self.assertEqual(s, 1), 0)
         success.map(lambda el: el + 1).fold(lambda s: self.assertEqual(s, 2), 1)
 
+    def test_option_flat_map(self):
+        self.assertEqual(
+            Some(1).flat_map(lambda s: Some(s + 1)).fold(lambda s: s, 0), 2
+        )
+        self.assertIs(Some(1).flat_map(lambda s: nil), nil)
+        self.assertIs(nil.flat_map(lambda s: Some(s)), nil)
+
+    def test_nil_singleton(self):
+        self.assertIs(Nil(), nil)
+        self.assertIs(pickle.loads(pickle.dumps(nil)), nil)
+        self.assertFalse(hasattr(Some(1), "__dict__"))
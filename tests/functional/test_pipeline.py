@@ -0,0 +1,80 @@
+from typing import List
+import unittest
+
+from common_py.functional.either import Either, Left, Right
+from common_py.functional.future import Future
+from common_py.functional.option import Some, nil
+from common_py.functional.pipeline import Pipeline
+
+
+class TestPipeline(unittest.TestCase):
+    def test_pipeline_fuses_maps(self):
+        pipeline: Pipeline = (
+            Pipeline()
+            .map(lambda el: el + 1)
+            .map(lambda el: el * 2)
+            .flat_map(lambda el: Right(el) if el < 10 else Left(ValueError(el)))
+            .map(str)
+        )
+        self.assertEqual(len(pipeline.steps()), 3)
+        self.assertEqual(pipeline.run(Right(1)).right, "4")
+        self.assertTrue(isinstance(pipeline.run(Right(9)).left, ValueError))
+        option_pipeline: Pipeline = (
+            Pipeline().map(lambda el: el + 1).flat_map(Some).map(str)
+        )
+        self.assertEqual(option_pipeline.run(Some(1)).value, "2")
+        self.assertIs(option_pipeline.run(nil), nil)
+
+    def test_pipeline_long_chain(self):
+        pipeline: Pipeline = Pipeline()
+        for _ in range(100000):
+            pipeline = pipeline.map(lambda el: el + 1).flat_map(Right)
+        self.assertEqual(pipeline.run(Right(0)).right, 100000)
+
+    def test_pipeline_future(self):
+        pipeline: Pipeline = Pipeline()
+        for _ in range(10000):
+            pipeline = pipeline.flat_map(Future.pure).map(lambda el: el + 1)
+        pipeline = pipeline.flat_map(lambda el: Future.async_f(lambda: el * 2))
+        self.assertEqual(pipeline.run(Future.pure(0)).result(5).right, 20000)
+        failure: Either = (
+            Pipeline().map(lambda el: 1 // el).run(Future.pure(0)).result(5)
+        )
+        self.assertTrue(isinstance(failure.left, ZeroDivisionError))
+
+    def test_pipeline_future_deadline(self):
+        stages: List[Future] = []
+
+        def _stage(el: int) -> Future:
+            stages.append(Future.async_f(lambda: el))
+            return stages[-1]
+
+        timed: Future = Future.pure(1).with_timeout(5)
+        result: Future = Pipeline().flat_map(_stage).map(lambda el: el + 1).run(timed)
+        self.assertEqual(result.result(5).right, 2)
+        self.assertEqual(stages[0].deadline, timed.deadline)
+
+
+class TestFutureTrampoline(unittest.TestCase):
+    def test_long_future_chain(self):
+        callbacks: List = []
+        root: Future = Future(callbacks.append)
+        chained: Future = root
+        for _ in range(20000):
+            chained = chained.flat_map(lambda el: Future.pure(el + 1)).map(
+                lambda el: el
+            )
+        callbacks[0](Right(0))
+        self.assertEqual(chained.result(5).right, 20000)
+
+    def test_result_inside_callback(self):
+        nested: Future = Future.pure(1).map(
+            lambda el: Future.pure(el).map(lambda x: x + 1).result(timeout=1).right
+        )
+        self.assertEqual(nested.result(timeout=5).right, 2)
+        flat: Future = Future.pure(1).flat_map(
+            lambda el: Future.pure(
+                Future.pure(el).map(lambda x: x * 3).result(timeout=1).right
+            )
+        )
+        self.assertEqual(flat.result(timeout=5).right, 3)
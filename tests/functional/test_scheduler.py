@@ -0,0 +1,119 @@
+import gc
+import threading
+import time
+from typing import Callable, List
+import unittest
+import weakref
+
+from common_py.functional.either import Either, Left
+from common_py.functional.future import Future
+from common_py.functional.scheduler import Scheduler
+
+
+class TestScheduler(unittest.TestCase):
+    def test_max_in_flight(self):
+        scheduler: Scheduler = Scheduler(max_in_flight=2)
+        lock = threading.Lock()
+        running: List[int] = [0, 0]
+
+        def _work(el: int) -> int:
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return el * 2
+
+        futures: List[Future] = [
+            scheduler.submit(lambda el=el: Future.async_f(lambda: _work(el)))
+            for el in range(8)
+        ]
+        self.assertEqual([f.result(5).right for f in futures], list(range(0, 16, 2)))
+        self.assertEqual(running[1], 2)
+        stats = scheduler.stats()
+        self.assertEqual(stats["completed"], 8)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertEqual(stats["in_flight"], 0)
+        self.assertGreater(stats["wait_time_max"], 0)
+
+    def test_priority(self):
+        scheduler: Scheduler = Scheduler(max_in_flight=1)
+        gate = threading.Event()
+        order: List[int] = []
+        first: Future = scheduler.submit(lambda: Future.async_f(gate.wait))
+        futures: List[Future] = [
+            scheduler.submit(lambda el=el: Future.pure(order.append(el)), priority=el)
+            for el in [3, 1, 2]
+        ]
+        self.assertEqual(scheduler.stats()["queue_depth"], 3)
+        gate.set()
+        first.result(5)
+        for future in futures:
+            future.result(5)
+        self.assertEqual(order, [1, 2, 3])
+
+    def test_rate_limit(self):
+        scheduler: Scheduler = Scheduler(max_in_flight=10, rate_optional=50, burst=1)
+        start: float = time.monotonic()
+        futures: List[Future] = [
+            scheduler.submit(lambda: Future.pure(time.monotonic())) for _ in range(6)
+        ]
+        times: List[float] = [f.result(5).right for f in futures]
+        self.assertGreaterEqual(times[-1] - start, 5 / 50 * 0.9)
+
+    def test_retry(self):
+        scheduler: Scheduler = Scheduler(max_retries=3, backoff_base=0.001)
+        calls: List[int] = []
+
+        def _factory() -> Future:
+            calls.append(1)
+            if len(calls) < 3:
+                return Future(lambda cb: cb(Left(IOError("again"))))
+            return Future.pure("ok")
+
+        self.assertEqual(scheduler.submit(_factory).result(5).right, "ok")
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(scheduler.stats()["retries"], 2)
+
+        failing: Callable[[], Future] = lambda: Future(
+            lambda cb: cb(Left(ValueError("no")))
+        )
+        no_retry: Scheduler = Scheduler(
+            max_retries=3, retry_if=lambda err: not isinstance(err, ValueError)
+        )
+        result: Either = no_retry.submit(failing).result(5)
+        self.assertTrue(isinstance(result.left, ValueError))
+        self.assertEqual(no_retry.stats()["retries"], 0)
+        self.assertEqual(no_retry.stats()["failed"], 1)
+
+    def test_cancel_during_backoff(self):
+        class _Failing:
+            def __call__(self) -> Future:
+                return Future(lambda cb: cb(Left(IOError("again"))))
+
+        factory: _Failing = _Failing()
+        released: weakref.ref = weakref.ref(factory)
+        scheduler: Scheduler = Scheduler(
+            max_retries=1, backoff_base=3600, backoff_max=3600
+        )
+        future: Future = scheduler.submit(factory)
+        del factory
+        self.assertEqual(scheduler.stats()["retries"], 1)
+        self.assertTrue(future.cancel())
+        gc.collect()
+        self.assertIsNone(released())
+
+    def test_factory_error_and_many_completed(self):
+        scheduler: Scheduler = Scheduler(max_in_flight=1)
+
+        def _raise() -> Future:
+            raise RuntimeError("boom")
+
+        self.assertTrue(
+            isinstance(scheduler.submit(_raise).result(5).left, RuntimeError)
+        )
+        futures: List[Future] = [
+            scheduler.submit(lambda el=el: Future.pure(el)) for el in range(5000)
+        ]
+        self.assertEqual(futures[-1].result(5).right, 4999)
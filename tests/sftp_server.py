@@ -0,0 +1,252 @@
+import os
+import socket
+import threading
+from typing import Any, List, Optional
+
+import paramiko
+
+from common_py.sftp import SftpServerInfo
+
+_host_key: Optional[paramiko.RSAKey] = None
+_host_key_lock = threading.Lock()
+
+
+def host_key() -> paramiko.RSAKey:
+    global _host_key
+    with _host_key_lock:
+        if _host_key is None:
+            _host_key = paramiko.RSAKey.generate(2048)
+        return _host_key
+
+
+def _to_errno(err: OSError) -> int:
+    return paramiko.SFTPServer.convert_errno(err.errno)
+
+
+class _Server(paramiko.ServerInterface):
+    def __init__(self, username: str, password: str):
+        self.username: str = username
+        self.password: str = password
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "password"
+
+    def check_auth_password(self, username: str, password: str) -> int:
+        if username == self.username and password == self.password:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+
+class _Handle(paramiko.SFTPHandle):
+    def stat(self):
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+        except OSError as err:
+            return _to_errno(err)
+
+    def chattr(self, attr):
+        try:
+            paramiko.SFTPServer.set_file_attr(self.filename, attr)
+            return paramiko.SFTP_OK
+        except OSError as err:
+            return _to_errno(err)
+
+
+class _SftpInterface(paramiko.SFTPServerInterface):
+    """Serves the folder `root` of the `SftpTestServer`."""
+
+    def __init__(
+        self, server: paramiko.ServerInterface, root: str, requests: List[str]
+    ):
+        super(_SftpInterface, self).__init__(server)
+        self.root: str = root
+        self.requests: List[str] = requests
+
+    def canonicalize(self, path: str) -> str:
+        return os.path.normpath("/" + path)
+
+    def _local(self, path: str) -> str:
+        return os.path.join(self.root, self.canonicalize(path).lstrip("/"))
+
+    def _record(self, name: str) -> None:
+        self.requests.append(name)
+
+    def list_folder(self, path: str):
+        self._record("list_folder")
+        local: str = self._local(path)
+        try:
+            result = []
+            for name in os.listdir(local):
+                attr = paramiko.SFTPAttributes.from_stat(
+                    os.stat(os.path.join(local, name))
+                )
+                attr.filename = name
+                result.append(attr)
+            return result
+        except OSError as err:
+            return _to_errno(err)
+
+    def stat(self, path: str):
+        self._record("stat")
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.stat(self._local(path)))
+        except OSError as err:
+            return _to_errno(err)
+
+    def lstat(self, path: str):
+        self._record("lstat")
+        try:
+            return paramiko.SFTPAttributes.from_stat(os.lstat(self._local(path)))
+        except OSError as err:
+            return _to_errno(err)
+
+    def open(self, path: str, flags: int, attr):
+        self._record("open")
+        local: str = self._local(path)
+        try:
+            fd: int = os.open(local, flags | getattr(os, "O_BINARY", 0), 0o666)
+        except OSError as err:
+            return _to_errno(err)
+        if (flags & os.O_CREAT) and (attr is not None):
+            attr._flags &= ~attr.FLAG_PERMISSIONS
+            paramiko.SFTPServer.set_file_attr(local, attr)
+        if flags & os.O_WRONLY:
+            mode: str = "ab" if flags & os.O_APPEND else "wb"
+        elif flags & os.O_RDWR:
+            mode = "a+b" if flags & os.O_APPEND else "r+b"
+        else:
+            mode = "rb"
+        try:
+            f = os.fdopen(fd, mode)
+        except OSError as err:
+            return _to_errno(err)
+        handle = _Handle(flags)
+        handle.filename = local
+        handle.readfile = f
+        handle.writefile = f
+        return handle
+
+    def remove(self, path: str) -> int:
+        self._record("remove")
+        try:
+            os.remove(self._local(path))
+        except OSError as err:
+            return _to_errno(err)
+        return paramiko.SFTP_OK
+
+    def rename(self, oldpath: str, newpath: str) -> int:
+        self._record("rename")
+        try:
+            os.rename(self._local(oldpath), self._local(newpath))
+        except OSError as err:
+            return _to_errno(err)
+        return paramiko.SFTP_OK
+
+    def posix_rename(self, oldpath: str, newpath: str) -> int:
+        self._record("posix_rename")
+        try:
+            os.replace(self._local(oldpath), self._local(newpath))
+        except OSError as err:
+            return _to_errno(err)
+        return paramiko.SFTP_OK
+
+    def mkdir(self, path: str, attr) -> int:
+        self._record("mkdir")
+        try:
+            os.mkdir(self._local(path))
+        except OSError as err:
+            return _to_errno(err)
+        return paramiko.SFTP_OK
+
+    def rmdir(self, path: str) -> int:
+        self._record("rmdir")
+        try:
+            os.rmdir(self._local(path))
+        except OSError as err:
+            return _to_errno(err)
+        return paramiko.SFTP_OK
+
+    def chattr(self, path: str, attr) -> int:
+        self._record("chattr")
+        try:
+            paramiko.SFTPServer.set_file_attr(self._local(path), attr)
+        except OSError as err:
+            return _to_errno(err)
+        return paramiko.SFTP_OK
+
+
+class SftpTestServer:
+    """
+    In-process SFTP server on localhost serving the folder `root`, for tests and benchmarks.
+
+    Examples
+    --------
+    >>> with SftpTestServer(root) as server:
+    ...     upload_file(server.info, "a.txt", local_path, "remote")
+    """
+
+    def __init__(self, root: str, username: str = "user", password: str = "password"):
+        self.root: str = root
+        self.username: str = username
+        self.password: str = password
+        self.connections: int = 0
+        # Names of the SFTP requests received, e.g. "stat", "open".
+        self.requests: List[str] = []
+        self.transports: List[paramiko.Transport] = []
+        self.socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(("127.0.0.1", 0))
+        self.socket.listen(16)
+        self.thread: threading.Thread = threading.Thread(
+            target=self._accept, name="sftp-test-server", daemon=True
+        )
+
+    @property
+    def info(self) -> SftpServerInfo:
+        return SftpServerInfo(
+            "127.0.0.1", self.socket.getsockname()[1], self.username, self.password
+        )
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self.socket.accept()
+            except OSError:
+                return
+            self.connections += 1
+            transport = paramiko.Transport(sock)
+            transport.add_server_key(host_key())
+            # Offered to clients asking for it, e.g. `SLOW_WAN_PROFILE`.
+            transport.use_compression(True)
+            transport.set_subsystem_handler(
+                "sftp",
+                paramiko.SFTPServer,
+                _SftpInterface,
+                root=self.root,
+                requests=self.requests,
+            )
+            self.transports.append(transport)
+            try:
+                transport.start_server(server=_Server(self.username, self.password))
+            except Exception:
+                transport.close()
+
+    def start(self) -> "SftpTestServer":
+        self.thread.start()
+        return self
+
+    def close(self) -> None:
+        self.socket.close()
+        for transport in self.transports:
+            transport.close()
+
+    def __enter__(self) -> "SftpTestServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
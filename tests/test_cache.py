@@ -0,0 +1,72 @@
+import threading
+import time
+from typing import List
+import unittest
+
+import common_py
+
+
+class TestMemoize(unittest.TestCase):
+    def test_memoize_hit_miss(self):
+        calls: List[int] = []
+
+        @common_py.memoize
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        self.assertEqual([square(2), square(2), square(3)], [4, 4, 9])
+        self.assertEqual(calls, [2, 3])
+        stats = square.cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 2, 2))
+
+    def test_memoize_unhashable_arguments(self):
+        cached_list_diff = common_py.memoize()(common_py.list_diff)
+        self.assertEqual(cached_list_diff([1, 2, 3, 4], [1, 2, 3]), [4])
+        self.assertEqual(cached_list_diff([1, 2, 3, 4], t=[1, 2, 3]), [4])
+        self.assertEqual(cached_list_diff([1, 2, 3, 4], [1, 2, 3]), [4])
+        self.assertEqual(cached_list_diff.cache_stats()["hits"], 1)
+
+    def test_memoize_lru_eviction(self):
+        @common_py.memoize(max_size=2, stripes=1)
+        def identity(x: int) -> int:
+            return x
+
+        for x in [1, 2, 1, 3]:
+            identity(x)
+        stats = identity.cache_stats()
+        self.assertEqual((stats["evictions"], stats["size"]), (1, 2))
+        identity(1)
+        self.assertEqual(identity.cache_stats()["hits"], 2)
+
+    def test_memoize_ttl(self):
+        @common_py.memoize(ttl=0.01)
+        def now(x: int) -> float:
+            return time.monotonic()
+
+        first: float = now(1)
+        self.assertEqual(now(1), first)
+        time.sleep(0.02)
+        self.assertNotEqual(now(1), first)
+        self.assertEqual(now.cache_stats()["expirations"], 1)
+
+    def test_memoize_single_flight(self):
+        calls: List[int] = []
+        started = threading.Event()
+
+        @common_py.memoize
+        def slow(x: int) -> int:
+            calls.append(x)
+            started.set()
+            time.sleep(0.05)
+            return x
+
+        threads = [threading.Thread(target=slow, args=[1]) for _ in range(5)]
+        threads[0].start()
+        started.wait()
+        for t in threads[1:]:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(calls, [1])
+        self.assertEqual(slow.cache_stats()["waits"], 4)
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Dict
 import unittest
 
 import common_py
@@ -14,3 +14,72 @@ class TestGetOrElse(unittest.TestCase):
         self.assertEqual(common_py.get_or_else(dict, "apple"), "computer")
         self.assertEqual(common_py.get_or_else(dict, "axe", "no value"), "no value")
         self.assertEqual(common_py.get_or_else(dict, "orange", "no value"), "fruit")
+
+
+class TestGetIn(unittest.TestCase):
+    record: Dict[str, Any] = {
+        "model": {"layers": [{"units": 64}, {"units": 32}], "name": "unet"},
+        "tags": {"train.set": "v2"},
+    }
+
+    def test_get_in_success(self):
+        self.assertEqual(common_py.get_in(self.record, "model.layers[1].units"), 32)
+        self.assertEqual(common_py.get_in(self.record, "model.layers[-1].units"), 32)
+        self.assertEqual(common_py.get_in(self.record, 'tags["train.set"]'), "v2")
+        self.assertEqual(common_py.get_in(self.record, ("model", "name")), "unet")
+        self.assertEqual(
+            common_py.get_in(self.record, "model.layers[2].units", "no value"),
+            "no value",
+        )
+        self.assertIsNone(common_py.get_in(self.record, "model.name.first"))
+
+    def test_get_in_failure(self):
+        with self.assertRaises(ValueError):
+            common_py.get_in(self.record, "model.layers[x]")
+
+    def test_get_in_batch_success(self):
+        self.assertEqual(
+            list(
+                common_py.get_in_batch(
+                    [self.record, {}], "model.layers[0].units", "no value"
+                )
+            ),
+            [64, "no value"],
+        )
+
+
+class TestPersistentMap(unittest.TestCase):
+    def test_persistent_map_assoc_dissoc(self):
+        base = common_py.PersistentMap({"apple": "computer", "orange": "fruit"})
+        changed = base.assoc("apple", "fruit").dissoc("orange").assoc("axe", "tool")
+        self.assertEqual(dict(base), {"apple": "computer", "orange": "fruit"})
+        self.assertEqual(dict(changed), {"apple": "fruit", "axe": "tool"})
+        self.assertIs(base.dissoc("carrot"), base)
+        self.assertEqual(common_py.get_or_else(changed, "axe"), "tool")
+        self.assertEqual(
+            common_py.get_or_else(changed, "orange", "no value"), "no value"
+        )
+
+    def test_persistent_map_many_keys(self):
+        persistent_map = common_py.PersistentMap()
+        for i in range(5000):
+            persistent_map = persistent_map.assoc(i, str(i))
+        for i in range(0, 5000, 2):
+            persistent_map = persistent_map.dissoc(i)
+        self.assertEqual(len(persistent_map), 2500)
+        self.assertEqual(dict(persistent_map), {i: str(i) for i in range(1, 5000, 2)})
+
+    def test_persistent_map_deep_merge(self):
+        base = common_py.PersistentMap.from_dict(
+            {"lr": 0.1, "optimizer": {"name": "adam", "beta": 0.9}}
+        )
+        merged = base.deep_merge({"optimizer": {"beta": 0.99}, "epochs": 10})
+        self.assertEqual(
+            merged.to_dict(),
+            {"lr": 0.1, "optimizer": {"name": "adam", "beta": 0.99}, "epochs": 10},
+        )
+        self.assertEqual(base["optimizer"]["beta"], 0.9)
+        self.assertEqual(
+            base.assoc_in(("optimizer", "name"), "sgd").to_dict()["optimizer"],
+            {"name": "sgd", "beta": 0.9},
+        )
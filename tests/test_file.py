@@ -125,6 +125,15 @@ class TestRename(unittest.TestCase):
         self.assertEqual(failure.right, results)
         self.assertTrue(os.path.exists(results[0]))
 
+    def test_rename_files_continues_after_failure(self):
+        failure: Either[List[str], Exception] = common_py.rename_files(
+            [("trax.txt", "fish.txt"), ("tiger.txt", "rabbit.txt")], self.base_folder
+        )
+        self.assertTrue(isinstance(failure.left, FileNotFoundError))
+        result: str = os.path.join(self.base_folder, "rabbit.txt")
+        self.assertEqual(failure.right, [result])
+        self.assertTrue(os.path.exists(result))
+
 
 class TestRenameWithRegex(unittest.TestCase):
     base_folder = os.path.join("tests", "resources", "base")
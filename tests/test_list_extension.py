@@ -1,3 +1,7 @@
+from decimal import Decimal
+from fractions import Fraction
+import os
+from pathlib import Path
 from typing import Callable, List
 import unittest
 
@@ -52,3 +56,138 @@ class TestListIntersection(unittest.TestCase):
         self.assertEqual(
             common_py.list_intersection([1, 2, 3, 3, 3, 2], [1, 5, 9, 2]), [1, 2]
         )
+
+
+class TestBloomFilter(unittest.TestCase):
+    bloom_file = os.path.join("tests", "resources", "seen.bloom")
+
+    def tearDown(self) -> None:
+        if os.path.exists(self.bloom_file):
+            os.remove(self.bloom_file)
+
+    def test_bloom_filter_no_false_negative(self):
+        bloom: common_py.BloomFilter = common_py.BloomFilter.build(
+            range(10000), error_rate=0.01
+        )
+        self.assertTrue(all(i in bloom for i in range(10000)))
+        false_positives: int = sum(1 for i in range(10000, 20000) if i in bloom)
+        self.assertLess(false_positives, 300)
+        self.assertFalse("1" in common_py.BloomFilter.build([1]))
+
+    def test_bloom_filter_equal_numbers(self):
+        bloom = common_py.BloomFilter.build([1.0, Decimal("2"), 0.5, True])
+        self.assertTrue(1 in bloom and 2 in bloom and 2.0 in bloom)
+        self.assertTrue(Fraction(1, 2) in bloom and Decimal("0.5") in bloom)
+        self.assertFalse(1.5 in common_py.BloomFilter.build([1]))
+
+    def test_bloom_filter_union(self):
+        b1 = common_py.BloomFilter(100)
+        b2 = common_py.BloomFilter(100)
+        b1.add("apple")
+        b2.add("orange")
+        union: common_py.BloomFilter = b1 | b2
+        self.assertTrue("apple" in union and "orange" in union)
+        with self.assertRaises(ValueError):
+            b1.union(common_py.BloomFilter(1000))
+
+    def test_bloom_filter_save_load(self):
+        Path(os.path.dirname(self.bloom_file)).mkdir(parents=True, exist_ok=True)
+        common_py.BloomFilter.build(["apple", b"car", 3]).save(self.bloom_file)
+        for mmap_mode in [False, True]:
+            bloom = common_py.BloomFilter.load(self.bloom_file, mmap_mode=mmap_mode)
+            self.assertTrue("apple" in bloom and b"car" in bloom and 3 in bloom)
+            self.assertEqual(len(bloom), 3)
+            bloom.close()
+
+
+class TestApproxListDiff(unittest.TestCase):
+    def test_approx_list_diff_success(self):
+        self.assertEqual(common_py.approx_list_diff([1, 2, 3, 4, 4], [1, 2, 3]), [4])
+        bloom = common_py.BloomFilter.build([1, 2, 3])
+        self.assertEqual(common_py.approx_list_diff([1, 2, 3], bloom), [])
+        self.assertEqual(
+            common_py.approx_list_diff(
+                [5, 1], (i for i in [1, 2, 3]), capacity_optional=3
+            ),
+            [5],
+        )
+
+    def test_approx_contains_success(self):
+        self.assertEqual(common_py.approx_contains([1, 5], [1, 2, 3]), [True, False])
+
+
+class TestSortedSetOperations(unittest.TestCase):
+    lines_file = os.path.join("tests", "resources", "sorted.txt")
+
+    def tearDown(self) -> None:
+        if os.path.exists(self.lines_file):
+            os.remove(self.lines_file)
+
+    def test_sorted_set_operations_success(self):
+        self.assertEqual(list(common_py.sorted_diff([1, 2, 3, 4, 4], [1, 2, 3])), [4])
+        self.assertEqual(list(common_py.sorted_diff([1, 2, 3], [1, 2, 3, 4])), [])
+        self.assertEqual(
+            list(common_py.sorted_intersection([1, 2, 2, 3], iter([1, 2, 5, 9]))),
+            [1, 2],
+        )
+        self.assertEqual(
+            list(common_py.sorted_union([1, 3, 3], [2, 3, 4])), [1, 2, 3, 4]
+        )
+        self.assertEqual(
+            list(common_py.sorted_union_n([1, 5], [2, 5], [3])), [1, 2, 3, 5]
+        )
+        self.assertEqual(
+            list(common_py.sorted_intersection_n([1, 2, 2, 5], [2, 5], [0, 2, 5, 7])),
+            [2, 5],
+        )
+
+    def test_sorted_diff_lines(self):
+        Path(os.path.dirname(self.lines_file)).mkdir(parents=True, exist_ok=True)
+        with open(self.lines_file, "w") as file:
+            file.write("apple\ncar\norange\n")
+        self.assertEqual(
+            list(
+                common_py.sorted_diff(
+                    common_py.sorted_lines(self.lines_file), ["car", "lemon"]
+                )
+            ),
+            ["apple", "orange"],
+        )
+
+
+class TestChunkingAndWindowing(unittest.TestCase):
+    def test_chunked_success(self):
+        self.assertEqual(
+            list(common_py.chunked(iter([1, 2, 3, 4, 5]), 2)), [[1, 2], [3, 4], [5]]
+        )
+        self.assertEqual(list(common_py.chunked(b"abcde", 2)), [b"ab", b"cd", b"e"])
+        data = bytearray(b"abcde")
+        views: List[memoryview] = list(common_py.chunked(data, 2, as_view=True))
+        data[0:1] = b"z"
+        self.assertEqual(bytes(views[0]), b"zb")
+
+    def test_chunked_by_bytes_success(self):
+        self.assertEqual(
+            list(common_py.chunked_by_bytes(["ab", "cd", "efgh", "i"], 4)),
+            [["ab", "cd"], ["efgh"], ["i"]],
+        )
+
+    def test_windowed_success(self):
+        self.assertEqual(
+            list(common_py.windowed([1, 2, 3, 4, 5], 3)),
+            [(1, 2, 3), (2, 3, 4), (3, 4, 5)],
+        )
+        self.assertEqual(
+            list(common_py.windowed(range(7), 2, step=3)), [(0, 1), (3, 4)]
+        )
+        self.assertEqual(
+            [bytes(v) for v in common_py.windowed(b"abcd", 2, step=2, as_view=True)],
+            [b"ab", b"cd"],
+        )
+        self.assertEqual(list(common_py.windowed([1], 2)), [])
+
+    def test_interleave_success(self):
+        self.assertEqual(
+            list(common_py.interleave([1, 2, 3], "ab", [True])),
+            [1, "a", True, 2, "b", 3],
+        )
@@ -0,0 +1,533 @@
+import errno
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import List
+import unittest
+
+import common_py
+from common_py.functional.either import Either
+from common_py.sftp import (
+    FAST_LAN_PROFILE,
+    SLOW_WAN_PROFILE,
+    RemoteMetadataCache,
+    SftpPool,
+    SftpServerInfo,
+    SyncResult,
+    TransferReport,
+    download_file,
+    download_files,
+    download_folder,
+    remote_exists,
+    remote_listdir,
+    remote_remove,
+    remote_rename,
+    remote_stat,
+    sync_to_remote,
+    upload_file_resumable,
+    upload_folder,
+    upload_files_parallel,
+)
+from tests.sftp_server import SftpTestServer
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active: bool = True
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def close(self) -> None:
+        self.active = False
+
+
+class FakeClient:
+    def __init__(self, transport: FakeTransport):
+        self.transport: FakeTransport = transport
+
+    def close(self) -> None:
+        pass
+
+
+class TestSftpPool(unittest.TestCase):
+    info = SftpServerInfo("sftp.test", 22, "user", "password")
+
+    def setUp(self):
+        self.transports: List[FakeTransport] = []
+
+    def connector(self, sftp_server_info: SftpServerInfo) -> FakeTransport:
+        transport: FakeTransport = FakeTransport()
+        self.transports.append(transport)
+        return transport
+
+    def pool(self, **kwargs) -> SftpPool:
+        return SftpPool(self.connector, client_factory=FakeClient, **kwargs)
+
+    def test_reuse_and_keys(self):
+        pool: SftpPool = self.pool()
+        with pool.client(self.info) as client:
+            first: FakeClient = client
+        with pool.client(self.info) as client:
+            self.assertIs(client, first)
+        other: SftpServerInfo = SftpServerInfo("sftp.test", 22, "other", "password")
+        with pool.client(other) as client:
+            self.assertIsNot(client, first)
+        self.assertEqual(len(self.transports), 2)
+        stats = pool.stats()
+        self.assertEqual(stats["connects"], 2)
+        self.assertEqual(stats["reuses"], 1)
+        self.assertEqual(stats["idle"], 2)
+        pool.close()
+        self.assertFalse(any(transport.active for transport in self.transports))
+        self.assertEqual(pool.stats()["idle"], 0)
+
+    def test_health_check_and_idle_timeout(self):
+        pool: SftpPool = self.pool(idle_timeout=0.05)
+        with pool.client(self.info):
+            pass
+        self.transports[0].active = False
+        with pool.client(self.info):
+            pass
+        self.assertEqual(len(self.transports), 2)
+        self.assertEqual(pool.stats()["discards"], 1)
+        time.sleep(0.1)
+        with pool.client(self.info):
+            pass
+        self.assertEqual(len(self.transports), 3)
+        self.assertFalse(self.transports[1].active)
+
+    def test_max_size(self):
+        pool: SftpPool = self.pool(max_size=2, checkout_timeout_optional=0.05)
+        first = pool.checkout(self.info)
+        second = pool.checkout(self.info)
+        self.assertRaises(TimeoutError, pool.checkout, self.info)
+
+        released: List[object] = []
+
+        def _release() -> None:
+            time.sleep(0.02)
+            released.append(first)
+            pool.checkin(first)
+
+        threading.Thread(target=_release).start()
+        pool.checkout_timeout_optional = 5
+        third = pool.checkout(self.info)
+        self.assertIs(third, released[0])
+        self.assertEqual(len(self.transports), 2)
+        self.assertIsNone(pool.try_checkout(self.info))
+        pool.checkin(second)
+        self.assertIs(pool.try_checkout(self.info), second)
+        pool.checkin(second)
+        pool.checkin(third)
+
+    def test_close(self):
+        pool: SftpPool = self.pool(idle_timeout=0.05)
+        idle = pool.checkout(self.info)
+        in_use = pool.checkout(self.info)
+        pool.checkin(idle)
+        time.sleep(0.1)
+        self.assertEqual(pool.stats()["idle"], 0)
+        self.assertFalse(self.transports[0].active)
+
+        pool.close()
+        pool.checkin(in_use)
+        self.assertFalse(self.transports[1].active)
+        self.assertEqual(pool.stats()["idle"], 0)
+        self.assertEqual(pool.stats()["in_use"], 0)
+        self.assertRaises(RuntimeError, pool.checkout, self.info)
+
+    def test_connector_error(self):
+        def _fail(sftp_server_info: SftpServerInfo) -> FakeTransport:
+            raise OSError("unreachable")
+
+        pool: SftpPool = SftpPool(_fail, max_size=1, client_factory=FakeClient)
+        self.assertRaises(OSError, pool.checkout, self.info)
+        self.assertRaises(OSError, pool.checkout, self.info)
+        self.assertEqual(pool.stats()["in_use"], 0)
+
+
+class TestSftpUpload(unittest.TestCase):
+    def setUp(self):
+        self.remote = tempfile.TemporaryDirectory()
+        self.local = tempfile.TemporaryDirectory()
+        os.mkdir(os.path.join(self.remote.name, "web"))
+        for name in ["a.txt", "b.txt"]:
+            with open(os.path.join(self.local.name, name), "w") as file:
+                file.write(name * 100)
+        self.server: SftpTestServer = SftpTestServer(self.remote.name).start()
+        self.previous_pool: SftpPool = common_py.sftp.default_sftp_pool()
+        common_py.sftp.set_default_sftp_pool(
+            SftpPool(
+                self.previous_pool.connector,
+                client_factory=self.previous_pool.client_factory,
+            )
+        )
+
+    def tearDown(self):
+        common_py.sftp.default_sftp_pool().close()
+        common_py.sftp.set_default_sftp_pool(self.previous_pool)
+        self.server.close()
+        self.remote.cleanup()
+        self.local.cleanup()
+
+    def read_remote(self, *names: str) -> str:
+        with open(os.path.join(self.remote.name, *names)) as file:
+            return file.read()
+
+    def test_upload_reuses_connection(self):
+        info: SftpServerInfo = self.server.info
+        self.assertIsNone(common_py.upload_file(info, "a.txt", self.local.name, "web"))
+        self.assertIsNone(
+            common_py.upload_files(info, ["a.txt", "b.txt"], self.local.name, "web")
+        )
+        self.assertEqual(self.read_remote("web", "b.txt"), "b.txt" * 100)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_upload_error(self):
+        error = common_py.upload_file(
+            self.server.info, "a.txt", self.local.name, "nowhere"
+        )
+        self.assertTrue(error.startswith("*** Caught exception"))
+        self.assertIsNone(
+            common_py.upload_file(self.server.info, "a.txt", self.local.name, "web")
+        )
+        self.assertEqual(self.server.connections, 1)
+
+    def test_upload_files_parallel(self):
+        names: List[str] = ["a.txt", "b.txt"]
+        for index in range(6):
+            name: str = "c{}.bin".format(index)
+            with open(os.path.join(self.local.name, name), "wb") as file:
+                file.write(os.urandom(1000 * (index + 1)))
+            names.append(name)
+        report: TransferReport = upload_files_parallel(
+            self.server.info,
+            names + ["missing.txt"],
+            self.local.name,
+            "web",
+            channels=3,
+            transports=2,
+        )
+        self.assertEqual(report.failed, ["missing.txt"])
+        self.assertEqual(list(report.results), names + ["missing.txt"])
+        self.assertEqual(report.results["c5.bin"].right, 6000)
+        self.assertEqual(report.total_bytes, 21000 + 1000)
+        self.assertGreater(report.throughput, 0)
+        for name in names:
+            with open(os.path.join(self.local.name, name), "rb") as file:
+                local: bytes = file.read()
+            with open(os.path.join(self.remote.name, "web", name), "rb") as file:
+                self.assertEqual(file.read(), local)
+        self.assertEqual(self.server.connections, 2)
+
+        failed: TransferReport = upload_files_parallel(
+            self.server.info, names, self.local.name, "nowhere"
+        )
+        self.assertEqual(failed.failed, names)
+        self.assertEqual(failed.total_bytes, 0)
+
+    def test_upload_files_parallel_concurrent_callers(self):
+        # Both callers hold their first connection before asking for a second one.
+        pool: SftpPool = common_py.sftp.default_sftp_pool()
+        both_connected: threading.Barrier = threading.Barrier(2, timeout=5)
+        connects: List[int] = []
+
+        def _connector(sftp_server_info: SftpServerInfo):
+            transport = pool.connector(sftp_server_info)
+            connects.append(1)
+            if len(connects) <= 2:
+                both_connected.wait()
+            return transport
+
+        common_py.sftp.set_default_sftp_pool(
+            SftpPool(_connector, max_size=2, client_factory=pool.client_factory)
+        )
+        reports: List[TransferReport] = []
+
+        def _upload(remote: str) -> None:
+            os.mkdir(os.path.join(self.remote.name, remote))
+            reports.append(
+                upload_files_parallel(
+                    self.server.info,
+                    ["a.txt", "b.txt"],
+                    self.local.name,
+                    remote,
+                    channels=2,
+                    transports=2,
+                )
+            )
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=_upload, args=(remote,), daemon=True)
+            for remote in ["one", "two"]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual(len(reports), 2)
+        self.assertTrue(all(report.failed == [] for report in reports))
+        self.assertEqual(self.read_remote("two", "b.txt"), "b.txt" * 100)
+        self.assertEqual(common_py.sftp.default_sftp_pool().stats()["in_use"], 0)
+        common_py.sftp.default_sftp_pool().close()
+
+    def test_upload_streams_large_file(self):
+        size: int = 8 * 1024 * 1024
+        with open(os.path.join(self.local.name, "large.bin"), "wb") as file:
+            for _ in range(size // (1 << 20)):
+                file.write(os.urandom(1 << 20))
+        info: SftpServerInfo = self.server.info
+        info.block_size = 1 << 16
+        tracemalloc.start()
+        try:
+            self.assertIsNone(
+                common_py.upload_file(info, "large.bin", self.local.name, "web")
+            )
+            peak: int = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, size // 2)
+        self.assertEqual(
+            os.path.getsize(os.path.join(self.remote.name, "web", "large.bin")), size
+        )
+
+    def test_sync_to_remote(self):
+        info: SftpServerInfo = self.server.info
+        result: SyncResult = sync_to_remote(info, self.local.name, "site").right
+        self.assertEqual(result.uploaded, ["a.txt", "b.txt"])
+        self.assertEqual(self.read_remote("site", "a.txt"), "a.txt" * 100)
+
+        with open(os.path.join(self.local.name, "b.txt"), "w") as file:
+            file.write("changed")
+        del self.server.requests[:]
+        result = sync_to_remote(info, self.local.name, "site").right
+        self.assertEqual((result.uploaded, result.skipped), (["b.txt"], ["a.txt"]))
+        self.assertEqual(self.server.requests.count("list_folder"), 1)
+        self.assertEqual(self.read_remote("site", "b.txt"), "changed")
+
+        # Same size and content, other modification time.
+        os.utime(os.path.join(self.local.name, "a.txt"), (1000000000, 1000000000))
+        del self.server.requests[:]
+        result = sync_to_remote(info, self.local.name, "site", hash_check=True).right
+        self.assertEqual(result.uploaded, [])
+        self.assertEqual(self.server.requests.count("open"), 1)
+        # Matching modification times are not read again, even with `hash_check`.
+        del self.server.requests[:]
+        result = sync_to_remote(info, self.local.name, "site", hash_check=True).right
+        self.assertEqual(result.skipped, ["a.txt", "b.txt"])
+        self.assertEqual(self.server.requests.count("open"), 0)
+        result = sync_to_remote(info, self.local.name, "site").right
+        self.assertEqual(result.skipped, ["a.txt", "b.txt"])
+
+        self.assertTrue(
+            isinstance(
+                sync_to_remote(
+                    info, os.path.join(self.local.name, "none"), "site"
+                ).left,
+                FileNotFoundError,
+            )
+        )
+
+    def test_upload_file_resumable(self):
+        info: SftpServerInfo = self.server.info
+        info.block_size = 4096
+        content: bytes = os.urandom(100000)
+        with open(os.path.join(self.local.name, "model.bin"), "wb") as file:
+            file.write(content)
+        part: str = os.path.join(self.remote.name, "web", "model.bin.part")
+
+        remote_file: str = os.path.join(self.remote.name, "web", "model.bin")
+
+        # Resumes after the bytes already sent.
+        with open(part, "wb") as file:
+            file.write(content[:50000])
+        result: Either = upload_file_resumable(
+            info, "model.bin", self.local.name, "web"
+        )
+        self.assertEqual(result.right, 100000)
+        with open(remote_file, "rb") as file:
+            self.assertEqual(file.read(), content)
+        self.assertFalse(os.path.exists(part))
+
+        # Stale or garbage partial files are not kept: shorter, complete with a wrong
+        # end, and larger than the local file.
+        for stale in [b"x" * 50000, content[:-1] + b"\0", b"x" * 150000]:
+            with open(part, "wb") as file:
+                file.write(stale)
+            result = upload_file_resumable(
+                info, "model.bin", self.local.name, "web", backoff=0
+            )
+            self.assertEqual(result.right, 100000)
+            with open(remote_file, "rb") as file:
+                self.assertEqual(file.read(), content)
+        self.assertEqual(self.server.requests.count("remove"), 0)
+
+        # A missing folder is not retried, a lost connection is.
+        del self.server.requests[:]
+        started_at: float = time.monotonic()
+        failed: Either = upload_file_resumable(
+            info, "model.bin", self.local.name, "nowhere"
+        )
+        self.assertTrue(isinstance(failed.left, FileNotFoundError))
+        self.assertLess(time.monotonic() - started_at, 0.9)
+        self.assertEqual(self.server.requests.count("open"), 1)
+
+        pool: SftpPool = common_py.sftp.default_sftp_pool()
+        attempts: List[int] = []
+
+        def _flaky(sftp_server_info: SftpServerInfo):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionResetError(errno.ECONNRESET, "reset")
+            return pool.connector(sftp_server_info)
+
+        common_py.sftp.set_default_sftp_pool(
+            SftpPool(_flaky, client_factory=pool.client_factory)
+        )
+        pool.close()
+        result = upload_file_resumable(
+            info, "model.bin", self.local.name, "web", backoff=0
+        )
+        self.assertEqual(result.right, 100000)
+        self.assertEqual(len(attempts), 2)
+        self.assertTrue(
+            isinstance(
+                upload_file_resumable(info, "none", self.local.name, "web").left,
+                FileNotFoundError,
+            )
+        )
+
+    def test_upload_folder(self):
+        tree: str = os.path.join(self.local.name, "tree")
+        for folder in ["images/train", "images/test", "logs"]:
+            os.makedirs(os.path.join(tree, folder))
+            for index in range(3):
+                with open(
+                    os.path.join(tree, folder, "{}.txt".format(index)), "w"
+                ) as file:
+                    file.write(folder * (index + 1))
+        with open(os.path.join(tree, "index.html"), "w") as file:
+            file.write("index")
+        os.makedirs(os.path.join(self.remote.name, "site", "images"))
+
+        report: TransferReport = upload_folder(
+            self.server.info, tree, os.path.join("site", "report", "v1"), channels=3
+        )
+        self.assertEqual(report.failed, [])
+        self.assertEqual(len(report.results), 10)
+        self.assertEqual(list(report.results)[0], "index.html")
+        self.assertEqual(
+            self.read_remote("site", "report", "v1", "images", "train", "2.txt"),
+            "images/train" * 3,
+        )
+        # site exists, so site/report and site/report/v1 are created after one stat each,
+        # and the folders under v1 are created without a stat.
+        self.assertEqual(self.server.requests.count("stat"), 3)
+        self.assertEqual(self.server.requests.count("mkdir"), 6)
+
+        with open(os.path.join(self.remote.name, "web", "a.txt"), "w"):
+            pass
+        failed: TransferReport = upload_folder(
+            self.server.info, tree, os.path.join("web", "a.txt", "under_file")
+        )
+        self.assertEqual(len(failed.failed), 10)
+
+    def test_download(self):
+        content: bytes = os.urandom(300000)
+        with open(os.path.join(self.remote.name, "web", "large.bin"), "wb") as file:
+            file.write(content)
+        os.makedirs(os.path.join(self.remote.name, "web", "logs", "run"))
+        for name in ["logs/1.txt", "logs/run/2.txt"]:
+            with open(os.path.join(self.remote.name, "web", name), "w") as file:
+                file.write(name)
+        info: SftpServerInfo = self.server.info
+        info.block_size = 4096
+        target: str = os.path.join(self.local.name, "target")
+        os.mkdir(target)
+
+        self.assertEqual(
+            download_file(info, "large.bin", "web", target, range_threshold=1).right,
+            300000,
+        )
+        with open(os.path.join(target, "large.bin"), "rb") as file:
+            self.assertEqual(file.read(), content)
+        self.assertEqual(self.server.requests.count("open"), 4)
+        self.assertTrue(
+            isinstance(download_file(info, "none", "web", target).left, IOError)
+        )
+
+        report: TransferReport = download_files(
+            info, ["large.bin", "none"], "web", target
+        )
+        self.assertEqual(report.failed, ["none"])
+        self.assertEqual(report.total_bytes, 300000)
+
+        report = download_folder(info, "web", os.path.join(target, "web"))
+        self.assertEqual(
+            list(report.results),
+            ["large.bin", "logs/1.txt", "logs/run/2.txt"],
+        )
+        self.assertEqual(report.failed, [])
+        with open(os.path.join(target, "web", "logs", "run", "2.txt")) as file:
+            self.assertEqual(file.read(), "logs/run/2.txt")
+        self.assertEqual(list(download_folder(info, "nowhere", target).results), ["."])
+
+    def test_remote_metadata_cache(self):
+        info: SftpServerInfo = self.server.info
+        cache: RemoteMetadataCache = RemoteMetadataCache(ttl=60)
+        self.assertEqual(cache.listdir(info, "web").right, [])
+        self.assertFalse(cache.exists(info, "web/a.txt").right)
+        self.assertTrue(cache.exists(info, "web").right)
+        self.assertFalse(cache.exists(info, "nowhere/a.txt").right)
+        self.assertFalse(cache.exists(info, "nowhere/a.txt").right)
+        self.assertTrue(
+            isinstance(cache.listdir(info, "nowhere").left, FileNotFoundError)
+        )
+        # ".", "web" and "nowhere" were listed once each.
+        self.assertEqual(self.server.requests.count("list_folder"), 3)
+        self.assertEqual(cache.stats()["misses"], 3)
+
+        # Own uploads, renames and removals drop the listings they change.
+        self.assertIsNone(common_py.upload_file(info, "a.txt", self.local.name, "web"))
+        self.assertEqual(cache.stat(info, "web/a.txt").right.st_size, 500)
+        self.assertTrue(remote_rename(info, "web/a.txt", "web/c.txt").right)
+        self.assertEqual(cache.listdir(info, "web").right, ["c.txt"])
+        self.assertTrue(remote_exists(info, "web/c.txt").right)
+        self.assertEqual(remote_remove(info, "web/c.txt").right, "web/c.txt")
+        self.assertFalse(cache.exists(info, "web/c.txt").right)
+        self.assertEqual(remote_listdir(info, "web").right, [])
+        self.assertTrue(
+            isinstance(remote_stat(info, "web/c.txt").left, FileNotFoundError)
+        )
+        self.assertTrue(remote_remove(info, "web/c.txt").left is not None)
+
+        self.assertFalse(cache.exists(info, "web/c.txt").right)
+        listed: int = self.server.requests.count("list_folder")
+        for _ in range(10):
+            self.assertFalse(cache.exists(info, "web/c.txt").right)
+        self.assertEqual(self.server.requests.count("list_folder"), listed)
+
+    def test_transport_profiles(self):
+        pool: SftpPool = common_py.sftp.default_sftp_pool()
+        for profile, compression in [
+            (FAST_LAN_PROFILE, "none"),
+            (SLOW_WAN_PROFILE, "zlib@openssh.com"),
+        ]:
+            info: SftpServerInfo = self.server.info
+            info.profile_optional = profile
+            connection = pool.checkout(info)
+            self.assertEqual(connection.transport.local_cipher, "aes128-ctr")
+            self.assertEqual(connection.transport.local_compression, compression)
+            pool.discard(connection)
+        fast: SftpServerInfo = SftpServerInfo(
+            "127.0.0.1", 22, "user", "password", profile_optional=FAST_LAN_PROFILE
+        )
+        self.assertEqual(fast.block_size, 1 << 20)
+        self.assertEqual(fast.window_size_optional, 64 << 20)
+        self.assertEqual(
+            SftpServerInfo("127.0.0.1", 22, "user", "password").block_size, 1 << 18
+        )
+        self.assertIsNone(common_py.upload_file(info, "a.txt", self.local.name, "web"))